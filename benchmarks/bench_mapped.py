@@ -0,0 +1,49 @@
+"""
+Сравнение времени получения топа вакансий из JSON-файла и из хранилища, отображаемого в память
+
+Запуск: python -m benchmarks.bench_mapped [количество записей]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+from benchmarks.bench_vacancy import make_records
+from src.json_saver import JSONSaver
+from src.mapped_store import MappedVacancyStore
+
+
+def top_from_json(filename: str) -> list:
+    """Открытие JSON-хранилища и топ-5 вакансий"""
+    return JSONSaver(filename).get_top_vacancies(5)
+
+
+def top_from_mapped(filename: str) -> list:
+    """Открытие хранилища в памяти и топ-5 вакансий"""
+    with MappedVacancyStore(filename) as store:
+        return store.get_top_vacancies(5)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records = make_records(count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_filename = os.path.join(directory, "vacancies.json")
+        mapped_filename = os.path.join(directory, "vacancies.vmap")
+        JSONSaver(json_filename).add_vacancies(records)
+        MappedVacancyStore.build(mapped_filename, records).close()
+
+        assert top_from_json(json_filename) == top_from_mapped(mapped_filename)
+        json_time = min(timeit.repeat(lambda: top_from_json(json_filename), number=1, repeat=5))
+        mapped_time = min(timeit.repeat(lambda: top_from_mapped(mapped_filename), number=1, repeat=5))
+
+        print(f"Записей: {count}")
+        print(f"JSON:     {json_time * 1000:.1f} мс, {os.path.getsize(json_filename) / 2**20:.1f} МБ")
+        print(f"mmap:     {mapped_time * 1000:.1f} мс, {os.path.getsize(mapped_filename) / 2**20:.1f} МБ")
+        print(f"Ускорение: {json_time / mapped_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
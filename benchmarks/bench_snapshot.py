@@ -0,0 +1,55 @@
+"""
+Сравнение скорости загрузки хранилища из JSON-файла и из двоичного снимка
+
+Запуск: python -m benchmarks.bench_snapshot [количество записей]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable
+
+from benchmarks.bench_vacancy import make_records
+from src.json_saver import JSONSaver
+from src.snapshot_saver import SnapshotSaver, decode_snapshot
+
+
+def measure_load(saver_class: type, filename: str) -> float:
+    """Время первой загрузки всех вакансий новым экземпляром хранилища"""
+    return min(timeit.repeat(lambda: saver_class(filename).get_all_vacancies(), number=1, repeat=5))
+
+
+def measure_decode(decode: Callable[[bytes], Any], filename: str) -> float:
+    """Время разбора содержимого файла без построения индексов хранилища"""
+    with open(filename, "rb") as file:
+        data = file.read()
+    return min(timeit.repeat(lambda: decode(data), number=1, repeat=5))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records = make_records(count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_filename = os.path.join(directory, "vacancies.json")
+        snapshot_filename = os.path.join(directory, "vacancies.snap")
+        JSONSaver(json_filename).add_vacancies(records)
+        SnapshotSaver(snapshot_filename).add_vacancies(records)
+
+        json_time = measure_load(JSONSaver, json_filename)
+        snapshot_time = measure_load(SnapshotSaver, snapshot_filename)
+        json_decode = measure_decode(json.loads, json_filename)
+        snapshot_decode = measure_decode(decode_snapshot, snapshot_filename)
+
+        print(f"Записей: {count}")
+        print(f"JSON:   {json_time:.3f} с, {os.path.getsize(json_filename) / 2**20:.1f} МБ")
+        print(f"Снимок: {snapshot_time:.3f} с, {os.path.getsize(snapshot_filename) / 2**20:.1f} МБ")
+        print(f"Ускорение загрузки хранилища: {json_time / snapshot_time:.1f}x")
+        print(f"Разбор файла: json.loads {json_decode:.3f} с, decode_snapshot {snapshot_decode:.3f} с")
+        print(f"Ускорение разбора: {json_decode / snapshot_decode:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Сравнение скорости создания вакансий из записей хранилища
+
+Запуск: python -m benchmarks.bench_vacancy [количество записей]
+"""
+
+import sys
+import timeit
+
+from src.vacancy import Vacancy
+
+
+def make_records(count: int) -> list:
+    """Записи в формате Vacancy.to_dict()"""
+    return [
+        Vacancy(
+            str(i), f"Python Developer {i}", f"https://hh.ru/vacancy/{i}", 100000 + i, 150000 + i, "RUR", "Python"
+        ).to_dict()
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records = make_records(count)
+
+    validated = min(timeit.repeat(lambda: Vacancy.cast_to_object_list(records), number=1, repeat=5))
+    trusted = min(timeit.repeat(lambda: Vacancy.from_stored_batch(records), number=1, repeat=5))
+
+    print(f"Записей: {count}")
+    print(f"cast_to_object_list: {validated:.3f} с")
+    print(f"from_stored_batch:   {trusted:.3f} с")
+    print(f"Ускорение: {validated / trusted:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from src.cli import user_interaction
+from src.cli import main
 
 if __name__ == "__main__":
-    user_interaction()
+    main()
@@ -0,0 +1,192 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .hh import MAX_PAGES, REQUEST_HEADERS, IncompleteCrawlError
+from .parser import Parser
+from .rate_limiter import RateLimiter
+
+
+class SearchManyError(ConnectionError):
+    """
+    Ошибка одновременного поиска, при которой часть ключевых слов загружена не полностью
+
+    Загруженные вакансии по ключевым словам доступны в атрибуте results (для IncompleteCrawlError -
+    частичные), ошибки подключения по ключевым словам - в errors
+    """
+
+    def __init__(self, results: Dict[str, List[Dict[str, Any]]], errors: Dict[str, ConnectionError]):
+        super().__init__(f"Не удалось полностью загрузить ключевые слова: {', '.join(errors)}")
+        self.results = results
+        self.errors = errors
+
+
+class AsyncHH(Parser):
+    """
+    Асинхронный клиент API HeadHunter
+
+    Все запросы идут через одну сессию requests с пулом постоянных соединений
+    и выполняются в потоках через asyncio.to_thread. Число одновременных запросов
+    ограничено семафором, поэтому можно запускать много поисков одновременно.
+    """
+
+    def __init__(
+        self,
+        file_worker,
+        max_in_flight: int = 10,
+        pool_size: int = 10,
+        url: str = "https://api.hh.ru/vacancies",
+        retries: int = 3,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Инициализация асинхронного клиента
+
+        Ответы 429 и 5xx повторяются ограничителем запросов (по умолчанию общим для процесса)
+        """
+        if max_in_flight < 1 or pool_size < 1:
+            raise ValueError("max_in_flight и pool_size должны быть положительными числами")
+
+        self.__url = url
+        self.__params = {"per_page": 100}
+        self.__max_in_flight = max_in_flight
+        self.__retries = retries
+        self.__rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.shared()
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.__session = requests.Session()
+        self.__session.headers.update(REQUEST_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        super().__init__(file_worker)
+
+    async def __aenter__(self) -> "AsyncHH":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие сессии и всех соединений пула
+        """
+        self.__session.close()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Приватный метод получения семафора для текущего цикла событий
+        """
+        loop = asyncio.get_running_loop()
+        if self.__semaphore is None or self.__loop is not loop:
+            self.__semaphore = asyncio.Semaphore(self.__max_in_flight)
+            self.__loop = loop
+        return self.__semaphore
+
+    def _connect(self) -> None:
+        """
+        Приватный метод подключения к API HeadHunter (проверка доступности)
+        """
+        try:
+            response = self._send({"text": "test", "per_page": 1})
+        except Exception as e:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {str(e)}")
+        if response.status_code != 200:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {response.status_code}")
+
+    def _send(self, params: Dict[str, Any]) -> requests.Response:
+        """
+        Приватный метод выполнения запроса через ограничитель частоты
+        """
+        return self.__rate_limiter.execute(lambda: self.__session.get(self.__url, params=params), self.__retries)
+
+    async def _get(self, params: Dict[str, Any]) -> requests.Response:
+        """
+        Приватный метод выполнения запроса с ограничением числа одновременных запросов
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(self._send, params)
+
+    async def _fetch_page(self, keyword: str, page: int) -> Optional[Dict[str, Any]]:
+        """
+        Приватный метод загрузки одной страницы результатов
+        Возвращает None, если страницу получить не удалось
+        """
+        try:
+            response = await self._get({**self.__params, "text": keyword, "page": page})
+            if response.status_code != 200:
+                return None
+            return response.json()
+        except requests.RequestException:
+            return None
+
+    async def load_vacancies_async(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Асинхронная загрузка вакансий по ключевому слову
+
+        Первая страница заменяет проверку доступности и сообщает число страниц,
+        остальные загружаются одновременно с сохранением порядка.
+        Если часть страниц не загружена, возникает IncompleteCrawlError с загруженными вакансиями
+        """
+        try:
+            response = await self._get({**self.__params, "text": keyword, "page": 0})
+            first_page = response.json() if response.status_code == 200 else None
+        except Exception as e:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {str(e)}")
+        if first_page is None:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {response.status_code}")
+
+        vacancies = list(first_page.get("items", []))
+        pages = min(first_page.get("pages", 1), MAX_PAGES)
+        if not vacancies or pages <= 1:
+            return vacancies
+
+        other_pages = await asyncio.gather(*(self._fetch_page(keyword, page) for page in range(1, pages)))
+        failures = 0
+        for page_data in other_pages:
+            if page_data is None:
+                failures += 1
+            else:
+                vacancies.extend(page_data.get("items", []))
+
+        if failures:
+            raise IncompleteCrawlError(vacancies, failures)
+        return vacancies
+
+    async def search_many(self, keywords: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Одновременный поиск по нескольким ключевым словам
+
+        Ошибка по одному ключевому слову не прерывает остальные запросы. Если хотя бы одно
+        ключевое слово не загружено полностью, возникает SearchManyError с результатами
+        загруженных ключевых слов (в том числе частичными) и ошибками по ключевым словам
+        """
+        keywords = list(keywords)
+        results = await asyncio.gather(
+            *(self.load_vacancies_async(keyword) for keyword in keywords), return_exceptions=True
+        )
+        vacancies_by_keyword: Dict[str, List[Dict[str, Any]]] = {}
+        errors: Dict[str, ConnectionError] = {}
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, IncompleteCrawlError):
+                vacancies_by_keyword[keyword] = result.vacancies
+                errors[keyword] = result
+            elif isinstance(result, ConnectionError):
+                errors[keyword] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                vacancies_by_keyword[keyword] = result
+
+        if errors:
+            raise SearchManyError(vacancies_by_keyword, errors)
+        return vacancies_by_keyword
+
+    def load_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
+        """
+        Синхронная загрузка вакансий (для совместимости с Parser)
+        """
+        return asyncio.run(self.load_vacancies_async(keyword))
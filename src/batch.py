@@ -0,0 +1,125 @@
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from .currency import CurrencyRates
+from .file_handler import FileHandler
+from .hh import HH, IncompleteCrawlError
+from .vacancy import Vacancy
+
+
+def read_keywords(filename: str) -> List[str]:
+    """
+    Чтение ключевых слов из файла (по одному в строке)
+    Пустые строки, комментарии (#) и повторы пропускаются
+    """
+    keywords: Dict[str, None] = {}
+    with open(filename, "r", encoding="utf-8") as file:
+        for line in file:
+            keyword = line.strip()
+            if keyword and not keyword.startswith("#"):
+                keywords[keyword] = None
+    return list(keywords)
+
+
+def _init_parse_worker(rates: Dict[str, float]) -> None:
+    """
+    Инициализация процесса-обработчика: таблица курсов передается из основного процесса
+    """
+    CurrencyRates.shared().update(rates)
+
+
+def _parse_raw_vacancies(raw_vacancies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Преобразование ответа API в записи хранилища (выполняется в процессе-обработчике)
+    """
+    return [vacancy.to_dict() for vacancy in Vacancy.cast_to_object_list(raw_vacancies)]
+
+
+def harvest(
+    hh_api: HH,
+    file_worker: FileHandler,
+    keywords: List[str],
+    keyword_workers: int = 4,
+    parse_workers: Optional[int] = None,
+    crawl: bool = False,
+) -> Dict[str, Any]:
+    """
+    Пакетная загрузка вакансий по списку ключевых слов
+
+    Запросы к API выполняются параллельно в keyword_workers потоках (пул соединений hh_api
+    должен вмещать keyword_workers * max_workers соединений), разбор ответов -
+    в пуле из parse_workers процессов (0 - в текущем процессе). Процессы запускаются
+    методом spawn: fork при работающих потоках загрузки небезопасен. Таблица курсов
+    валют передается процессам при запуске. Все вакансии сохраняются в хранилище
+    одной пакетной операцией. При crawl=True используется полная выгрузка
+    hh_api.crawl_vacancies.
+    """
+    started = time.perf_counter()
+    load = hh_api.crawl_vacancies if crawl else hh_api.load_vacancies
+    parse_pool: Optional[ProcessPoolExecutor] = None
+    if parse_workers != 0:
+        parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(CurrencyRates.shared().rates,),
+        )
+
+    records: List[Dict[str, Any]] = []
+    fetched = 0
+    failed: List[str] = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=keyword_workers) as fetch_pool:
+            fetches = {fetch_pool.submit(load, keyword): keyword for keyword in keywords}
+            parses: Dict[Future, str] = {}
+
+            for done, future in enumerate(as_completed(fetches), 1):
+                keyword = fetches[future]
+                try:
+                    raw_vacancies = future.result()
+                    status = f"загружено {len(raw_vacancies)} вакансий"
+                except IncompleteCrawlError as e:
+                    # Выгруженная часть сохраняется, но ключевое слово считается неудачным
+                    failed.append(keyword)
+                    raw_vacancies = e.vacancies
+                    status = f"загружено {len(raw_vacancies)} вакансий, выгрузка неполная ({e})"
+                except ConnectionError as e:
+                    failed.append(keyword)
+                    print(f"[{done}/{len(keywords)}] {keyword}: ошибка ({e})")
+                    continue
+
+                fetched += len(raw_vacancies)
+                print(f"[{done}/{len(keywords)}] {keyword}: {status}")
+                if parse_pool is not None:
+                    parses[parse_pool.submit(_parse_raw_vacancies, raw_vacancies)] = keyword
+                else:
+                    records.extend(_parse_raw_vacancies(raw_vacancies))
+
+            for future in as_completed(parses):
+                records.extend(future.result())
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    inserted, skipped = file_worker.add_vacancies(records)
+    elapsed = time.perf_counter() - started
+    throughput = len(records) / elapsed if elapsed > 0 else 0.0
+
+    print("-" * 80)
+    print(f"Ключевых слов: {len(keywords)} (с ошибкой: {len(failed)})")
+    print(f"Загружено: {fetched}, разобрано: {len(records)}, сохранено новых: {inserted}, дубликатов: {skipped}")
+    print(f"Время: {elapsed:.2f} с, скорость: {throughput:.1f} вакансий/с")
+
+    return {
+        "keywords": len(keywords),
+        "failed": failed,
+        "fetched": fetched,
+        "parsed": len(records),
+        "inserted": inserted,
+        "skipped": skipped,
+        "elapsed": elapsed,
+        "throughput": throughput,
+    }
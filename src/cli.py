@@ -1,25 +1,156 @@
-from .hh import HH
+import argparse
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+from .batch import harvest, read_keywords
+from .currency import CurrencyRates
+from .file_handler import FileHandler
+from .hh import HH, IncompleteCrawlError
 from .json_saver import JSONSaver
+from .jsonl_saver import JSONLinesSaver
+from .mapped_store import DEFAULT_MAPPED_FILE, MappedVacancyStore
+from .response_cache import ResponseCache
+from .snapshot_saver import SnapshotSaver
+from .sqlite_saver import SQLiteSaver
+from .sync import SearchSync
 from .utils import (
-    filter_vacancies,
-    get_top_vacancies,
-    get_vacancies_by_salary,
+    PAGE_SIZE,
     parse_salary_range,
     print_vacancies,
-    sort_vacancies,
 )
 from .vacancy import Vacancy
 
+# Число потоков для параллельной загрузки страниц с hh.ru
+SEARCH_WORKERS = 8
+
+# Доступные хранилища вакансий
+STORAGES: Dict[str, Type[FileHandler]] = {
+    "json": JSONSaver,
+    "jsonl": JSONLinesSaver,
+    "mapped": MappedVacancyStore,
+    "snapshot": SnapshotSaver,
+    "sqlite": SQLiteSaver,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Точка входа: интерактивный режим, пакетная загрузка по списку ключевых слов,
+    инкрементальная синхронизация сохраненных поисков или сборка хранилища mapped
+    из другого хранилища
+    """
+    writable = sorted(name for name, storage in STORAGES.items() if not storage.read_only)
+    parser = argparse.ArgumentParser(description="Поиск вакансий на HeadHunter")
+    parser.add_argument("--batch", metavar="FILE", help="файл с ключевыми словами для пакетной загрузки")
+    parser.add_argument("--sync", metavar="FILE", help="файл с ключевыми словами для инкрементальной синхронизации")
+    parser.add_argument(
+        "--drop-archived", action="store_true", help="удалять архивные вакансии при синхронизации (с --sync)"
+    )
+    parser.add_argument("--storage", choices=sorted(STORAGES), default="json", help="формат хранилища")
+    parser.add_argument(
+        "--build-mapped",
+        metavar="STORAGE",
+        choices=writable,
+        help=f"собрать хранилище mapped ({DEFAULT_MAPPED_FILE}) из хранилища STORAGE: {', '.join(writable)}",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="число одновременно загружаемых ключевых слов")
+    parser.add_argument("--parse-workers", type=int, default=None, help="число процессов для разбора ответов")
+    parser.add_argument("--crawl", action="store_true", help="выгружать все результаты сверх ограничения API")
+    args = parser.parse_args(argv)
+
+    if args.build_mapped:
+        _build_mapped_store(STORAGES[args.build_mapped]())
+        return
+
+    if args.batch and args.sync:
+        parser.error("параметры --batch и --sync нельзя использовать вместе")
+    if args.drop_archived and not args.sync:
+        parser.error("параметр --drop-archived используется только с --sync")
+    if (args.batch or args.sync) and STORAGES[args.storage].read_only:
+        parser.error(f"хранилище {args.storage} доступно только для чтения, соберите его командой --build-mapped")
+
+    file_worker = STORAGES[args.storage]()
+
+    if not args.batch and not args.sync:
+        user_interaction(file_worker)
+        return
+
+    # При пакетной загрузке каждое из --workers ключевых слов загружает страницы в SEARCH_WORKERS потоков
+    pool_size = SEARCH_WORKERS * args.workers if args.batch else None
+    hh_api = HH(file_worker, max_workers=SEARCH_WORKERS, pool_size=pool_size, cache=ResponseCache())
+    try:
+        if args.sync:
+            _sync_searches(SearchSync(hh_api, file_worker), read_keywords(args.sync), args.drop_archived)
+            return
+
+        CurrencyRates.shared().refresh(hh_api)
+        harvest(
+            hh_api,
+            file_worker,
+            read_keywords(args.batch),
+            keyword_workers=args.workers,
+            parse_workers=args.parse_workers,
+            crawl=args.crawl,
+        )
+    finally:
+        hh_api.close()
+        file_worker.close()
+
+
+def _sync_searches(search_sync: SearchSync, keywords: List[str], drop_archived: bool) -> None:
+    """
+    Синхронизация сохраненных поисков по каждому ключевому слову с выводом результатов
+    """
+    for number, keyword in enumerate(keywords, 1):
+        try:
+            counts = search_sync.sync(keyword, drop_archived=drop_archived)
+        except ConnectionError as e:
+            print(f"[{number}/{len(keywords)}] {keyword}: ошибка ({e})")
+            continue
+
+        status = (
+            f"загружено {counts['fetched']}, добавлено {counts['inserted']}, "
+            f"обновлено {counts['updated']}, удалено {counts['deleted']}"
+        )
+        if counts["failed"]:
+            status += f", не загружено окон и страниц: {counts['failed']}"
+        print(f"[{number}/{len(keywords)}] {keyword}: {status}")
+
+
+def _build_mapped_store(source: FileHandler) -> None:
+    """
+    Сборка хранилища mapped из всех записей другого хранилища
+    """
+    try:
+        store = MappedVacancyStore.build(DEFAULT_MAPPED_FILE, source.get_all_vacancies())
+    finally:
+        source.close()
+
+    try:
+        print(f"Хранилище {store.filename} собрано из {source.filename}: {len(store.get_all_vacancies())} вакансий.")
+    finally:
+        store.close()
+
+
+def _check_writable(json_saver: FileHandler) -> bool:
+    """
+    Проверка, что хранилище можно изменять (иначе выводится сообщение)
+    """
+    if json_saver.read_only:
+        print(f"Хранилище {json_saver.filename} доступно только для чтения.")
+        return False
+    return True
 
-def user_interaction() -> None:
+
+def user_interaction(file_worker: Optional[FileHandler] = None) -> None:
     """
     Функция взаимодействия с пользователем через консоль
+    По умолчанию вакансии хранятся в JSONSaver, можно передать любую реализацию FileHandler
     """
     print("Добро пожаловать в программу поиска вакансий!")
     print("=" * 50)
 
-    json_saver = JSONSaver()
-    hh_api = HH(json_saver)
+    json_saver = file_worker if file_worker is not None else JSONSaver()
+    hh_api = HH(json_saver, max_workers=SEARCH_WORKERS, cache=ResponseCache())
 
     while True:
         print("\nВыберите действие:")
@@ -60,14 +191,38 @@ def user_interaction() -> None:
         elif choice_num == 6:
             _delete_vacancy(json_saver)
         elif choice_num == 0:
+            hh_api.close()
+            json_saver.close()
             print("До свидания!")
             break
 
 
-def _search_vacancies(hh_api: HH, json_saver: JSONSaver) -> None:
+def _to_vacancies(raw_vacancies: Sequence[Dict[str, Any]]) -> List[Vacancy]:
+    """
+    Преобразование сохраненных записей в вакансии
+    Записи в формате Vacancy.to_dict() создаются без повторной валидации
+    """
+    try:
+        return Vacancy.from_stored_batch(raw_vacancies)
+    except (KeyError, TypeError):
+        return Vacancy.cast_to_object_list(raw_vacancies)
+
+
+def _iter_vacancies(raw_vacancies: Sequence[Dict[str, Any]]) -> Iterator[Vacancy]:
+    """
+    Ленивое преобразование записей в вакансии порциями по странице вывода
+    """
+    for start in range(0, len(raw_vacancies), PAGE_SIZE):
+        yield from _to_vacancies(raw_vacancies[start : start + PAGE_SIZE])
+
+
+def _search_vacancies(hh_api: HH, json_saver: FileHandler) -> None:
     """
     Поиск и сохранение вакансий
     """
+    if not _check_writable(json_saver):
+        return
+
     keyword = input("Введите поисковый запрос: ").strip()
     if not keyword:
         print("Поисковый запрос не может быть пустым.")
@@ -75,21 +230,28 @@ def _search_vacancies(hh_api: HH, json_saver: JSONSaver) -> None:
 
     try:
         print("Поиск вакансий...")
-        raw_vacancies = hh_api.load_vacancies(keyword)
+        try:
+            raw_vacancies = hh_api.load_vacancies(keyword)
+        except IncompleteCrawlError as e:
+            # Загруженная часть сохраняется, пользователь предупреждается о неполном результате
+            raw_vacancies = e.vacancies
+            print(f"Внимание: результат неполный ({e}).")
 
         if not raw_vacancies:
             print("Вакансии не найдены.")
             return
 
+        # Зарплаты приводятся к рублям при создании вакансий, поэтому курсы обновляются заранее
+        CurrencyRates.shared().refresh(hh_api)
         vacancies = Vacancy.cast_to_object_list(raw_vacancies)
 
         with_salary = [v for v in vacancies if v.salary_from > 0 or v.salary_to > 0]
         print(f"Найдено {len(vacancies)} вакансий (из них {len(with_salary)} с указанной зарплатой).")
 
-        for vacancy in vacancies:
-            json_saver.add_vacancy(vacancy.to_dict())
+        inserted, skipped = json_saver.add_vacancies(vacancy.to_dict() for vacancy in vacancies)
 
-        print(f"Все вакансии сохранены в файл {json_saver._JSONSaver__filename}.")
+        print(f"Сохранено новых вакансий: {inserted}, пропущено дубликатов: {skipped}.")
+        print(f"Все вакансии сохранены в файл {json_saver.filename}.")
 
         show_results = input("Показать найденные вакансии? (y/n): ").strip().lower()
         if show_results == "y":
@@ -99,7 +261,7 @@ def _search_vacancies(hh_api: HH, json_saver: JSONSaver) -> None:
         print(f"Ошибка при поиске вакансий: {e}")
 
 
-def _show_top_vacancies(json_saver: JSONSaver) -> None:
+def _show_top_vacancies(json_saver: FileHandler) -> None:
     """
     Показ топ N вакансий по зарплате
     """
@@ -119,16 +281,13 @@ def _show_top_vacancies(json_saver: JSONSaver) -> None:
             print("Количество должно быть положительным числом.")
             return
 
-        raw_vacancies = json_saver.get_all_vacancies()
-        if not raw_vacancies:
+        # Пустой топ при n > 0 означает, что в хранилище нет вакансий
+        raw_top = json_saver.get_top_vacancies(n)
+        if not raw_top:
             print("Сохраненные вакансии не найдены.")
             return
 
-        vacancies = Vacancy.cast_to_object_list(raw_vacancies)
-        sorted_vacancies = sort_vacancies(vacancies)
-        top_vacancies = get_top_vacancies(sorted_vacancies, n)
-
-        print_vacancies(top_vacancies)
+        print_vacancies(_to_vacancies(raw_top))
 
     except ValueError:
         print("Некорректное число.")
@@ -136,7 +295,7 @@ def _show_top_vacancies(json_saver: JSONSaver) -> None:
         print(f"Ошибка: {e}")
 
 
-def _filter_by_keywords(json_saver: JSONSaver) -> None:
+def _filter_by_keywords(json_saver: FileHandler) -> None:
     """
     Фильтрация по ключевым словам
     """
@@ -148,13 +307,8 @@ def _filter_by_keywords(json_saver: JSONSaver) -> None:
     keywords = keywords_str.split()
 
     try:
-        raw_vacancies = json_saver.get_all_vacancies()
-        if not raw_vacancies:
-            print("Сохраненные вакансии не найдены.")
-            return
-
-        vacancies = Vacancy.cast_to_object_list(raw_vacancies)
-        filtered_vacancies = filter_vacancies(vacancies, keywords)
+        # Поиск выполняет хранилище (по индексу ключевых слов или полнотекстовому индексу)
+        filtered_vacancies = _to_vacancies(json_saver.filter_vacancies(keywords))
 
         print_vacancies(filtered_vacancies)
 
@@ -162,7 +316,7 @@ def _filter_by_keywords(json_saver: JSONSaver) -> None:
         print(f"Ошибка: {e}")
 
 
-def _filter_by_salary(json_saver: JSONSaver) -> None:
+def _filter_by_salary(json_saver: FileHandler) -> None:
     """
     Фильтрация по диапазону зарплат
     """
@@ -174,13 +328,8 @@ def _filter_by_salary(json_saver: JSONSaver) -> None:
     try:
         salary_range = parse_salary_range(salary_str)
 
-        raw_vacancies = json_saver.get_all_vacancies()
-        if not raw_vacancies:
-            print("Сохраненные вакансии не найдены.")
-            return
-
-        vacancies = Vacancy.cast_to_object_list(raw_vacancies)
-        filtered_vacancies = get_vacancies_by_salary(vacancies, salary_range)
+        # Поиск выполняет хранилище (по отсортированному индексу зарплат)
+        filtered_vacancies = _to_vacancies(json_saver.filter_vacancies_by_salary(salary_range))
 
         print_vacancies(filtered_vacancies)
 
@@ -190,7 +339,7 @@ def _filter_by_salary(json_saver: JSONSaver) -> None:
         print(f"Ошибка: {e}")
 
 
-def _show_all_vacancies(json_saver: JSONSaver) -> None:
+def _show_all_vacancies(json_saver: FileHandler) -> None:
     """
     Показ всех сохраненных вакансий
     """
@@ -200,30 +349,33 @@ def _show_all_vacancies(json_saver: JSONSaver) -> None:
             print("Сохраненные вакансии не найдены.")
             return
 
-        vacancies = Vacancy.cast_to_object_list(raw_vacancies)
-
-        print(f"Всего сохранено {len(vacancies)} вакансий.")
+        print(f"Всего сохранено {len(raw_vacancies)} вакансий.")
 
         filter_choice = input("Показать: 1 - Все вакансии, 2 - Только с указанной зарплатой: ").strip()
 
         if filter_choice == "2":
+            vacancies = _to_vacancies(raw_vacancies)
             vacancies_with_salary = [v for v in vacancies if v.salary_from > 0 or v.salary_to > 0]
             if vacancies_with_salary:
                 print(f"Найдено {len(vacancies_with_salary)} вакансий с указанной зарплатой:")
-                print_vacancies(vacancies_with_salary)
+                print_vacancies(vacancies_with_salary, interactive=True)
             else:
                 print("Вакансии с указанной зарплатой не найдены.")
         else:
-            print_vacancies(vacancies)
+            # Записи преобразуются по мере вывода страниц
+            print_vacancies(_iter_vacancies(raw_vacancies), interactive=True)
 
     except Exception as e:
         print(f"Ошибка: {e}")
 
 
-def _delete_vacancy(json_saver: JSONSaver) -> None:
+def _delete_vacancy(json_saver: FileHandler) -> None:
     """
     Удаление вакансии по ID
     """
+    if not _check_writable(json_saver):
+        return
+
     vacancy_id = input("Введите ID вакансии для удаления: ").strip()
     if not vacancy_id:
         print("ID вакансии не может быть пустым.")
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from .hh import HH
+
+# Валюта, к которой приводятся зарплаты (код справочника hh.ru)
+BASE_CURRENCY = "RUR"
+
+# Обозначение неуказанной валюты в вакансиях (такая сумма считается рублевой)
+UNSPECIFIED_CURRENCY = "Не указана"
+
+# Срок актуальности таблицы курсов
+RATES_TTL = timedelta(days=1)
+
+DEFAULT_RATES_FILE = "data/currency_rates.json"
+
+
+class CurrencyRates:
+    """
+    Таблица курсов валют для приведения зарплат к рублям
+
+    Курс задается как в справочнике hh.ru: количество единиц валюты за один рубль.
+    Таблица кэшируется в файле и обновляется из справочника, когда срок ttl истек.
+    """
+
+    _shared_instance: Optional["CurrencyRates"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        filename: Optional[str] = DEFAULT_RATES_FILE,
+        ttl: timedelta = RATES_TTL,
+    ):
+        """
+        Инициализация таблицы курсов
+
+        filename=None отключает файловый кэш
+        """
+        self.__rates: Dict[str, float] = {BASE_CURRENCY: 1.0}
+        self.__filename = filename
+        self.__ttl = ttl
+        self.__updated_at: Optional[datetime] = None
+        if rates:
+            self.update(rates)
+
+    @classmethod
+    def shared(cls) -> "CurrencyRates":
+        """
+        Общая для процесса таблица курсов, используемая при создании вакансий
+
+        При первом обращении загружается из файлового кэша (даже устаревшего)
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                rates = cls()
+                rates.load()
+                cls._shared_instance = rates
+            return cls._shared_instance
+
+    @property
+    def rates(self) -> Dict[str, float]:
+        """Копия таблицы курсов"""
+        return dict(self.__rates)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """Время последнего обновления таблицы"""
+        return self.__updated_at
+
+    def is_fresh(self, now: Optional[datetime] = None) -> bool:
+        """
+        Проверка, что таблица обновлялась не раньше чем ttl назад
+        """
+        if self.__updated_at is None:
+            return False
+        return (now or datetime.now(timezone.utc)) - self.__updated_at < self.__ttl
+
+    def update(self, rates: Dict[str, float], now: Optional[datetime] = None) -> None:
+        """
+        Замена таблицы курсов (некорректные курсы пропускаются)
+        """
+        table = {BASE_CURRENCY: 1.0}
+        for currency, rate in rates.items():
+            if isinstance(rate, (int, float)) and rate > 0:
+                table[currency] = float(rate)
+
+        self.__rates = table
+        self.__updated_at = now or datetime.now(timezone.utc)
+
+    def load(self) -> bool:
+        """
+        Загрузка таблицы из файлового кэша
+        Возвращает False, если файла нет или он поврежден
+        """
+        if self.__filename is None or not os.path.exists(self.__filename):
+            return False
+
+        try:
+            with open(self.__filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self.update(data["rates"], datetime.fromisoformat(data["updated_at"]))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        return True
+
+    def save(self) -> None:
+        """
+        Сохранение таблицы в файловый кэш
+        """
+        if self.__filename is None or self.__updated_at is None:
+            return
+
+        dirname = os.path.dirname(self.__filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(self.__filename, "w", encoding="utf-8") as file:
+            json.dump({"updated_at": self.__updated_at.isoformat(), "rates": self.__rates}, file, indent=2)
+
+    def refresh(self, hh_api: "HH", now: Optional[datetime] = None) -> bool:
+        """
+        Обновление устаревшей таблицы из справочника hh.ru
+
+        Сначала проверяется файловый кэш; при ошибке запроса остаются прежние курсы.
+        Возвращает True, если курсы были загружены из справочника.
+        """
+        if self.is_fresh(now) or (self.load() and self.is_fresh(now)):
+            return False
+
+        try:
+            self.update(hh_api.get_currency_rates(), now)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+
+        self.save()
+        return True
+
+    def normalize(self, amount: float, currency: Optional[str]) -> Optional[float]:
+        """
+        Приведение суммы к рублям (сумма без указанной валюты не изменяется)
+
+        Для валюты с неизвестным курсом возвращается None: сумму нужно пересчитать,
+        когда курс будет загружен
+        """
+        if not amount or not currency or currency == UNSPECIFIED_CURRENCY:
+            return amount
+        rate = self.__rates.get(currency)
+        return amount / rate if rate else None
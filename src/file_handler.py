@@ -1,5 +1,8 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .salary_index import salary_average
 
 
 class FileHandler(ABC):
@@ -7,6 +10,9 @@ class FileHandler(ABC):
     Абстрактный класс для работы с файлами вакансий
     """
 
+    # Хранилище только для чтения: методы изменения вызывают io.UnsupportedOperation
+    read_only = False
+
     @abstractmethod
     def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
         """
@@ -14,6 +20,62 @@ class FileHandler(ABC):
         """
         pass
 
+    @property
+    def filename(self) -> str:
+        """
+        Путь к файлу хранилища
+        """
+        return ""
+
+    def close(self) -> None:
+        """
+        Завершение работы с хранилищем (по умолчанию ничего не делает)
+        """
+        pass
+
+    def add_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Пакетное добавление вакансий (без дубликатов)
+        Возвращает количество добавленных и пропущенных вакансий
+        """
+        known_ids = {vacancy.get("id") for vacancy in self.get_all_vacancies()}
+        inserted = skipped = 0
+
+        for vacancy_data in vacancies_data:
+            vacancy_id = vacancy_data.get("id")
+            if not vacancy_id or vacancy_id in known_ids:
+                skipped += 1
+                continue
+
+            self.add_vacancy(vacancy_data)
+            known_ids.add(vacancy_id)
+            inserted += 1
+
+        return inserted, skipped
+
+    def upsert_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Добавление новых и замена изменившихся вакансий
+        Возвращает количество добавленных и обновленных вакансий
+        """
+        existing = {vacancy.get("id"): vacancy for vacancy in self.get_all_vacancies()}
+        inserted = updated = 0
+
+        for vacancy_data in vacancies_data:
+            vacancy_id = vacancy_data.get("id")
+            if not vacancy_id or existing.get(vacancy_id) == vacancy_data:
+                continue
+
+            if vacancy_id in existing:
+                self.delete_vacancy(vacancy_id)
+                updated += 1
+            else:
+                inserted += 1
+            self.add_vacancy(vacancy_data)
+            existing[vacancy_id] = vacancy_data
+
+        return inserted, updated
+
     @abstractmethod
     def delete_vacancy(self, vacancy_id: str) -> None:
         """
@@ -21,6 +83,22 @@ class FileHandler(ABC):
         """
         pass
 
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Пакетное удаление вакансий по ID
+        Возвращает количество удаленных вакансий (отсутствующие в хранилище ID не учитываются)
+        """
+        known_ids = {vacancy.get("id") for vacancy in self.get_all_vacancies()}
+        deleted = 0
+
+        for vacancy_id in vacancy_ids:
+            if vacancy_id in known_ids:
+                self.delete_vacancy(vacancy_id)
+                known_ids.discard(vacancy_id)
+                deleted += 1
+
+        return deleted
+
     @abstractmethod
     def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
         """
@@ -29,15 +107,28 @@ class FileHandler(ABC):
         pass
 
     @abstractmethod
-    def filter_vacancies_by_salary(self, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+    def filter_vacancies_by_salary(
+        self, salary_range: Tuple[Optional[float], Optional[float]]
+    ) -> Sequence[Dict[str, Any]]:
         """
-        Абстрактный метод фильтрации вакансий по диапазону зарплат
+        Абстрактный метод фильтрации вакансий по диапазону зарплат (включительно)
+
+        Вакансии возвращаются по возрастанию средней зарплаты в рублях, при равной
+        зарплате - в порядке хранения; None вместо границы означает открытый диапазон
         """
         pass
 
+    def get_top_vacancies(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Топ n вакансий по средней зарплате в рублях (при равной зарплате - в порядке хранения)
+        """
+        return heapq.nlargest(n, self.get_all_vacancies(), key=salary_average)
+
     @abstractmethod
-    def get_all_vacancies(self) -> List[Dict[str, Any]]:
+    def get_all_vacancies(self) -> Sequence[Dict[str, Any]]:
         """
         Абстрактный метод получения всех вакансий из файла
+
+        Хранилище может вернуть ленивую последовательность вместо списка
         """
         pass
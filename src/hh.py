@@ -1,8 +1,50 @@
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .parser import Parser
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+
+# API hh.ru отдает не больше 20 страниц по 100 вакансий
+MAX_PAGES = 20
+
+# Окно публикации по умолчанию и минимальное окно при разбиении запроса в crawl_vacancies
+CRAWL_PERIOD = timedelta(days=30)
+CRAWL_MIN_WINDOW = timedelta(minutes=1)
+# Число повторных попыток загрузки окон и страниц, не полученных при выгрузке
+CRAWL_RETRIES = 2
+
+# Заголовки запросов к API hh.ru (общие для синхронного и асинхронного клиентов)
+REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json",
+    "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
+}
+
+# Справочники hh.ru (в том числе курсы валют)
+DICTIONARIES_URL = "https://api.hh.ru/dictionaries"
+
+Task = TypeVar("Task")
+
+
+class IncompleteCrawlError(ConnectionError):
+    """
+    Ошибка загрузки, при которой часть окон или страниц не удалось загрузить после повторов
+
+    Загруженные вакансии доступны в атрибуте vacancies, число потерянных окон и страниц - в failures
+    """
+
+    def __init__(self, vacancies: List[Dict[str, Any]], failures: int):
+        super().__init__(f"Не удалось загрузить окон и страниц результатов: {failures}")
+        self.vacancies = vacancies
+        self.failures = failures
 
 
 class HH(Parser):
@@ -11,60 +53,349 @@ class HH(Parser):
     Класс Parser является родительским классом, который вам необходимо реализовать
     """
 
-    def __init__(self, file_worker):
+    def __init__(
+        self,
+        file_worker,
+        max_workers: int = 1,
+        pool_size: Optional[int] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Инициализация класса для работы с API HeadHunter
+
+        Все запросы идут через одну сессию с пулом постоянных соединений размером pool_size
+        (по умолчанию и не меньше max_workers). Если один экземпляр загружает несколько
+        ключевых слов одновременно, pool_size должен покрывать все потоки загрузки страниц,
+        иначе лишние соединения закрываются после каждого запроса.
+        Ошибки соединения повторяются адаптером сессии (retries попыток с задержкой backoff_factor),
+        ответы 429 и 5xx - ограничителем запросов (по умолчанию общим для процесса).
+        При max_workers > 1 страницы результатов загружаются параллельно.
+        Если передан cache, ответы API сохраняются в дисковый кэш.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers должно быть положительным числом")
+
         self.__url = "https://api.hh.ru/vacancies"
-        self.__headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-            ),
-            "Accept": "application/json",
-            "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
-        }
-        self.__params = {"text": "", "page": 0, "per_page": 100}
-        self.__vacancies = []
+        self.__headers = dict(REQUEST_HEADERS)
+        self.__params: Dict[str, Any] = {"text": "", "page": 0, "per_page": 100}
+        self.__max_workers = max_workers
+        self.__cache = cache
+        self.__retries = retries
+        self.__rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.shared()
+        self.__session = self._create_session(max(pool_size or max_workers, max_workers), retries, backoff_factor)
         super().__init__(file_worker)
 
+    def _create_session(self, pool_size: int, retries: int, backoff_factor: float) -> requests.Session:
+        """
+        Приватный метод создания сессии с пулом соединений и повтором запросов
+
+        Адаптер повторяет только ошибки соединения, повтор по коду ответа выполняет RateLimiter
+        """
+        retry = Retry(
+            total=retries,
+            status=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=("GET",),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.headers.update(self.__headers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Кэш ответов API (если используется)"""
+        return self.__cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Ограничитель частоты запросов"""
+        return self.__rate_limiter
+
+    def _get(
+        self, params: Dict[str, Any], headers: Optional[Dict[str, str]] = None, url: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Приватный метод выполнения запроса через ограничитель частоты (по умолчанию к поиску вакансий)
+        """
+        request_url = url or self.__url
+        request_kwargs: Dict[str, Any] = {"params": params}
+        if headers:
+            request_kwargs["headers"] = headers
+        return self.__rate_limiter.execute(lambda: self.__session.get(request_url, **request_kwargs), self.__retries)
+
+    def get_currency_rates(self) -> Dict[str, float]:
+        """
+        Курсы валют из справочника hh.ru: количество единиц валюты за один рубль
+        """
+        try:
+            response = self._get({}, url=DICTIONARIES_URL)
+        except Exception as e:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {str(e)}")
+        if response.status_code != 200:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {response.status_code}")
+
+        return {
+            currency["code"]: float(currency["rate"])
+            for currency in response.json().get("currency", [])
+            if currency.get("code") and currency.get("rate")
+        }
+
+    def close(self) -> None:
+        """
+        Закрытие сессии и всех соединений пула
+        """
+        self.__session.close()
+
     def _connect(self) -> None:
         """
         Приватный метод подключения к API HeadHunter (проверка доступности)
         """
         try:
-            response = requests.get(self.__url, headers=self.__headers, params={"text": "test", "per_page": 1})
-            if response.status_code != 200:
-                raise ConnectionError(f"Ошибка подключения к API hh.ru: {response.status_code}")
+            response = self._get({"text": "test", "per_page": 1})
+        except Exception as e:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {str(e)}")
+        if response.status_code != 200:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {response.status_code}")
+
+    def _request(self, params: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Приватный метод выполнения запроса с учетом кэша ответов
+        Возвращает код ответа и разобранное тело (None, если код ответа не 200)
+        """
+        if self.__cache is None:
+            response = self._get(params)
+            return response.status_code, response.json() if response.status_code == 200 else None
+
+        entry = self.__cache.get(self.__url, params)
+        if entry is not None and self.__cache.is_fresh(entry):
+            self.__cache.record("hits")
+            return 200, entry["body"]
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry is not None and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._get(params, headers)
+        if response.status_code == 304 and entry is not None:
+            self.__cache.record("revalidated")
+            self.__cache.refresh(self.__url, params, entry)
+            return 200, entry["body"]
+
+        self.__cache.record("misses")
+        if response.status_code != 200:
+            return response.status_code, None
+
+        body = response.json()
+        self.__cache.put(self.__url, params, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return 200, body
+
+    def _fetch_first_page(self, keyword: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Приватный метод загрузки первой страницы результатов
+
+        Ответ первой страницы заменяет отдельную проверку доступности API
+        """
+        try:
+            status_code, first_page = self._request({**self.__params, **(filters or {}), "text": keyword, "page": 0})
         except Exception as e:
             raise ConnectionError(f"Ошибка подключения к API hh.ru: {str(e)}")
+        if first_page is None:
+            raise ConnectionError(f"Ошибка подключения к API hh.ru: {status_code}")
+        return first_page
+
+    def _fetch_page(
+        self, keyword: str, page: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Приватный метод загрузки одной страницы результатов
+        Возвращает None, если страницу получить не удалось
+        """
+        params = {**self.__params, **(filters or {}), "text": keyword, "page": page}
+        try:
+            return self._request(params)[1]
+        except requests.RequestException:
+            return None
+
+    def _iter_pages_concurrently(self, keyword: str, pages: int) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Приватный генератор параллельной загрузки страниц начиная со второй
+
+        Порядок страниц сохраняется, вместо неудачной страницы выдается None
+        """
+        executor = ThreadPoolExecutor(max_workers=min(self.__max_workers, pages - 1))
+        try:
+            yield from executor.map(lambda page: self._fetch_page(keyword, page), range(1, pages))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_pages(self, keyword: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Генератор страниц вакансий по мере их загрузки с API HeadHunter
+
+        Ошибка подключения (ConnectionError) возникает при запросе первой страницы.
+        Страницы, не полученные после повторов, пропускаются; после выдачи остальных
+        страниц возникает IncompleteCrawlError с числом пропущенных страниц (атрибут
+        vacancies пуст, так как загруженные страницы уже выданы).
+        """
+        first_page = self._fetch_first_page(keyword)
+        vacancies = list(first_page.get("items", []))
+        if not vacancies:
+            return
+        yield vacancies
+
+        pages = min(first_page.get("pages", MAX_PAGES), MAX_PAGES)
+        if pages <= 1:
+            return
+
+        if self.__max_workers > 1:
+            other_pages = self._iter_pages_concurrently(keyword, pages)
+        else:
+            other_pages = (self._fetch_page(keyword, page) for page in range(1, pages))
+
+        failures = 0
+        for page_data in other_pages:
+            if page_data is None:
+                failures += 1
+                continue
+
+            vacancies = page_data.get("items", [])
+            if not vacancies:
+                break
+
+            yield vacancies
+
+        if failures:
+            raise IncompleteCrawlError([], failures)
+
+    def iter_vacancies(self, keyword: str) -> Iterator[Dict[str, Any]]:
+        """
+        Генератор вакансий по мере загрузки страниц с API HeadHunter
+        """
+        for page in self.iter_pages(keyword):
+            yield from page
 
     def load_vacancies(self, keyword: str) -> List[Dict[str, Any]]:
         """
         Метод загрузки вакансий с API HeadHunter
+
+        Если часть страниц не загружена, возникает IncompleteCrawlError с загруженными вакансиями
+        """
+        vacancies = []
+        try:
+            for page in self.iter_pages(keyword):
+                vacancies.extend(page)
+        except IncompleteCrawlError as error:
+            raise IncompleteCrawlError(vacancies, error.failures) from error
+
+        return vacancies
+
+    @staticmethod
+    def _window_filters(date_from: datetime, date_to: datetime) -> Dict[str, str]:
+        """
+        Приватный метод построения фильтра по окну даты публикации
         """
-        self._connect()
+        return {
+            "date_from": date_from.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "date_to": date_to.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
 
-        self.__params["text"] = keyword
-        self.__params["page"] = 0
-        self.__vacancies = []
+    @staticmethod
+    def _map_with_retries(
+        executor: ThreadPoolExecutor, fetch: Callable[[Task], Optional[Dict[str, Any]]], tasks: Sequence[Task]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Приватный метод параллельной загрузки с повтором неудачных запросов (до CRAWL_RETRIES раз)
 
-        while self.__params.get("page") < 20:
-            try:
-                response = requests.get(self.__url, headers=self.__headers, params=self.__params)
-                if response.status_code != 200:
-                    break
+        Возвращает результаты в порядке задач, None - для задач, не выполненных после всех повторов
+        """
+        results = list(executor.map(fetch, tasks))
+        for _ in range(CRAWL_RETRIES):
+            failed = [index for index, result in enumerate(results) if result is None]
+            if not failed:
+                break
+            for index, result in zip(failed, executor.map(fetch, [tasks[index] for index in failed])):
+                results[index] = result
+        return results
 
-                data = response.json()
-                vacancies = data.get("items", [])
+    def crawl_vacancies(
+        self, keyword: str, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Загрузка всех вакансий по запросу в обход ограничения API в 2000 результатов
 
-                if not vacancies:
-                    break
+        Окно даты публикации (по умолчанию последние 30 дней) делится пополам, пока число
+        найденных вакансий в каждой части не станет меньше ограничения. Части загружаются
+        параллельно, результаты объединяются без дубликатов по ID.
+        Неудачные запросы окон и страниц повторяются; если часть из них так и не загружена
+        или окно минимальной длины (CRAWL_MIN_WINDOW) все еще превышает ограничение,
+        возникает IncompleteCrawlError с загруженными вакансиями.
+        """
+        date_to = date_to or datetime.now(timezone.utc)
+        date_from = date_from or date_to - CRAWL_PERIOD
+        cap = MAX_PAGES * self.__params["per_page"]
 
-                self.__vacancies.extend(vacancies)
-                self.__params["page"] += 1
+        root = self._fetch_first_page(keyword, self._window_filters(date_from, date_to))
+        probes: List[Tuple[Tuple[datetime, datetime], Optional[Dict[str, Any]]]] = [((date_from, date_to), root)]
+        slices = []
+        failures = 0
 
-            except requests.RequestException:
-                break
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while probes:
+                windows = []
+                for (start, end), first_page in probes:
+                    if first_page is None:
+                        failures += 1
+                        continue
+                    if first_page.get("found", 0) > cap and end - start > CRAWL_MIN_WINDOW:
+                        middle = start + (end - start) / 2
+                        windows.extend([(start, middle), (middle, end)])
+                    else:
+                        # Минимальное окно сверх ограничения загружается частично и считается потерянным
+                        if first_page.get("found", 0) > cap:
+                            failures += 1
+                        slices.append((self._window_filters(start, end), first_page))
+
+                first_pages = self._map_with_retries(
+                    executor, lambda window: self._fetch_page(keyword, 0, self._window_filters(*window)), windows
+                )
+                probes = list(zip(windows, first_pages))
+
+            tasks = [
+                (index, page)
+                for index, (_, first_page) in enumerate(slices)
+                for page in range(1, min(first_page.get("pages", 1), MAX_PAGES))
+            ]
+            other_pages = self._map_with_retries(
+                executor, lambda task: self._fetch_page(keyword, task[1], slices[task[0]][0]), tasks
+            )
+
+            pages_by_slice: List[List[Dict[str, Any]]] = [[first_page] for _, first_page in slices]
+            for (index, _), page_data in zip(tasks, other_pages):
+                if page_data is None:
+                    failures += 1
+                else:
+                    pages_by_slice[index].append(page_data)
+
+        vacancies = []
+        seen_ids = set()
+        for slice_pages in pages_by_slice:
+            for page_data in slice_pages:
+                for vacancy in page_data.get("items", []):
+                    if vacancy.get("id") not in seen_ids:
+                        seen_ids.add(vacancy.get("id"))
+                        vacancies.append(vacancy)
 
-        return self.__vacancies
+        if failures:
+            raise IncompleteCrawlError(vacancies, failures)
+        return vacancies
@@ -1,8 +1,22 @@
 import json
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import IO, Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 from .file_handler import FileHandler
+from .keyword_index import KeywordIndex, is_token
+from .salary_index import SalaryIndex, known_salary_average
+
+WRITE_POLICIES = ("immediate", "deferred", "every_n")
+SYNC_POLICIES = ("none", "always", "group")
+CONCURRENCY_MODES = ("none", "lock", "optimistic")
 
 
 class JSONSaver(FileHandler):
@@ -10,100 +24,625 @@ class JSONSaver(FileHandler):
     Класс для сохранения вакансий в JSON-файл
     """
 
-    def __init__(self, filename: str = "data/vacancies.json"):
+    # Двоичный формат файла (наследники переопределяют _dump и _load)
+    _binary = False
+
+    def __init__(
+        self,
+        filename: str = "data/vacancies.json",
+        write_policy: str = "immediate",
+        flush_every: int = 1,
+        sync_policy: str = "none",
+        sync_interval: float = 1.0,
+        concurrency: str = "none",
+    ):
         """
         Инициализация сохранителя JSON
+
+        write_policy определяет момент записи изменений на диск:
+        "immediate" - после каждого изменения, "deferred" - только при flush()/close(),
+        "every_n" - после каждых flush_every изменений.
+        Файл всегда записывается атомарно (временный файл и переименование), sync_policy
+        определяет вызов fsync: "none" - не вызывается, "always" - при каждой записи,
+        "group" - не чаще раза в sync_interval секунд: запись внутри интервала синхронизируется
+        фоновым таймером по его истечении (а также в sync()/close()).
+        concurrency задает совместную работу нескольких процессов с одним файлом (блокировка fcntl):
+        "none" - без блокировок, "lock" - каждое изменение выполняется под блокировкой
+        с перечитыванием файла, "optimistic" - блокировка только на время записи, изменения
+        других процессов перечитываются и объединяются по ID
         """
+        if write_policy not in WRITE_POLICIES:
+            raise ValueError(f"Неизвестная политика записи: {write_policy}")
+        if flush_every < 1:
+            raise ValueError("flush_every должно быть положительным числом")
+        if sync_policy not in SYNC_POLICIES:
+            raise ValueError(f"Неизвестная политика синхронизации: {sync_policy}")
+        if sync_interval < 0:
+            raise ValueError("sync_interval не может быть отрицательным")
+        if concurrency not in CONCURRENCY_MODES:
+            raise ValueError(f"Неизвестный режим совместной работы: {concurrency}")
+
         # Создаем папку только если есть путь к директории
         dirname = os.path.dirname(filename)
         if dirname:
             os.makedirs(dirname, exist_ok=True)
 
         self.__filename = filename
+        self.__write_policy = write_policy
+        self.__flush_every = flush_every
+        self.__sync_policy = sync_policy
+        self.__sync_interval = sync_interval
+        self.__last_sync: Optional[float] = None
+        self.__unsynced = False
+        self.__sync_lock = threading.Lock()
+        self.__sync_timer: Optional[threading.Timer] = None
+        self.__concurrency = concurrency
+        self.__lock_filename = f"{filename}.lock"
+        self.__lock_file: Optional[IO[str]] = None
+        self.__lock_depth = 0
+        self.__changes: Dict[Any, Optional[Dict[str, Any]]] = {}
+        self.__index: Optional[Dict[Any, Dict[str, Any]]] = None
+        self.__signature: Optional[Tuple[int, ...]] = None
+        self.__pending = 0
+        self.__keywords: Optional[KeywordIndex] = None
+        self.__salaries: Optional[SalaryIndex] = None
+        # ID вакансий, зарплата которых в индексе нулевая из-за неизвестного курса валюты
+        self.__pending_salaries: Set[Any] = set()
+        self.__unindexed: List[Tuple[None, int]] = []
+        # Имя строится от полного имени файла, чтобы vacancies.json и vacancies.snap не делили индекс
+        self.__keywords_filename = f"{filename}.keywords.json"
+
         if not os.path.exists(self.__filename):
             self._create_empty_file()
 
+    @property
+    def filename(self) -> str:
+        """Путь к JSON-файлу"""
+        return self.__filename
+
+    def __enter__(self) -> "JSONSaver":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _create_empty_file(self) -> None:
         """
         Приватный метод создания пустого файла
         """
-        with open(self.__filename, "w", encoding="utf-8") as file:
-            json.dump([], file, ensure_ascii=False, indent=2)
+        with self._open(self.__filename, "w") as file:
+            self._dump([], file)
+
+    def _open(self, filename: str, mode: str) -> IO:
+        """
+        Приватный метод открытия файла данных в текстовом или двоичном режиме
+        """
+        if self._binary:
+            return open(filename, f"{mode}b")
+        return open(filename, mode, encoding="utf-8")
+
+    def _dump(self, data: List[Dict[str, Any]], file: IO) -> None:
+        """
+        Приватный метод записи данных в открытый файл
+        """
+        json.dump(data, file, ensure_ascii=False, indent=2)
+
+    def _load(self, file: IO) -> List[Dict[str, Any]]:
+        """
+        Приватный метод чтения данных из открытого файла
+        """
+        return json.load(file)
 
     def _load_data(self) -> List[Dict[str, Any]]:
         """
-        Приватный метод загрузки данных из файла
+        Приватный метод загрузки данных из файла (поврежденный файл считается пустым)
         """
         try:
-            with open(self.__filename, "r", encoding="utf-8") as file:
-                return json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError):
+            with self._open(self.__filename, "r") as file:
+                return self._load(file)
+        except (ValueError, FileNotFoundError):
             return []
 
     def _save_data(self, data: List[Dict[str, Any]]) -> None:
         """
-        Приватный метод сохранения данных в файл
+        Приватный метод атомарного сохранения данных в файл
+
+        Данные записываются во временный файл рядом с основным, который затем заменяет его
+        одной операцией: при сбое во время записи прежнее содержимое файла сохраняется
+        """
+        temp_filename = f"{self.__filename}.{os.getpid()}.tmp"
+        sync = self._sync_due()
+        try:
+            with self._open(temp_filename, "w") as file:
+                self._dump(data, file)
+                if sync:
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.replace(temp_filename, self.__filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+
+        if sync:
+            self._sync_directory()
+        elif self.__sync_policy == "group":
+            self._defer_sync()
+
+    def _sync_due(self) -> bool:
+        """
+        Приватный метод проверки, нужен ли fsync для очередной записи (группировка по времени)
+        """
+        if self.__sync_policy == "none":
+            return False
+
+        with self.__sync_lock:
+            now = time.monotonic()
+            if (
+                self.__sync_policy == "group"
+                and self.__last_sync is not None
+                and now - self.__last_sync < self.__sync_interval
+            ):
+                return False
+
+            self.__last_sync = now
+            self.__unsynced = False
+            return True
+
+    def _defer_sync(self) -> None:
+        """
+        Приватный метод отложенной синхронизации записи, сделанной внутри интервала группировки
+
+        Файл отмечается несинхронизированным уже после замены, и запускается таймер до конца
+        интервала (один на интервал), поэтому последние записи синхронизируются без sync()
+        """
+        with self.__sync_lock:
+            self.__unsynced = True
+            if self.__sync_timer is not None:
+                return
+            elapsed = time.monotonic() - (self.__last_sync or 0.0)
+            self.__sync_timer = threading.Timer(max(self.__sync_interval - elapsed, 0.0), self._sync_in_background)
+            self.__sync_timer.daemon = True
+            self.__sync_timer.start()
+
+    def _sync_in_background(self) -> None:
+        """
+        Приватный метод синхронизации по таймеру (при ошибке повторяется в sync()/close())
+        """
+        try:
+            self.sync()
+        except OSError:
+            pass
+
+    def _sync_directory(self) -> None:
+        """
+        Приватный метод синхронизации каталога, чтобы переименование файла пережило сбой
+        """
+        try:
+            descriptor = os.open(os.path.dirname(self.__filename) or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+    def sync(self) -> None:
+        """
+        Синхронизация с диском записей, для которых fsync был отложен группировкой
+        """
+        with self.__sync_lock:
+            if self.__sync_timer is not None:
+                self.__sync_timer.cancel()
+                self.__sync_timer = None
+            if not self.__unsynced:
+                return
+
+            descriptor = os.open(self.__filename, os.O_RDONLY)
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+            self._sync_directory()
+            self.__unsynced = False
+            self.__last_sync = time.monotonic()
+
+    def _file_signature(self) -> Optional[Tuple[int, ...]]:
+        """
+        Приватный метод получения отпечатка файла (время изменения, размер и inode)
+
+        Атомарная запись создает новый файл, поэтому inode меняется при каждой записи,
+        даже если время изменения и размер совпали
         """
-        with open(self.__filename, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        try:
+            stat = os.stat(self.__filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Приватный метод эксклюзивной блокировки файла для других процессов (повторно входимой)
+
+        Блокируется отдельный файл .lock, так как сам файл данных заменяется при записи
+        """
+        if self.__concurrency == "none" or fcntl is None:
+            yield
+            return
+
+        if self.__lock_depth == 0:
+            self.__lock_file = open(self.__lock_filename, "a")
+            fcntl.flock(self.__lock_file.fileno(), fcntl.LOCK_EX)
+        self.__lock_depth += 1
+        try:
+            yield
+        finally:
+            self.__lock_depth -= 1
+            if self.__lock_depth == 0 and self.__lock_file is not None:
+                fcntl.flock(self.__lock_file.fileno(), fcntl.LOCK_UN)
+                self.__lock_file.close()
+                self.__lock_file = None
+
+    def _mutation_lock(self) -> ContextManager[None]:
+        """
+        Приватный метод блокировки на время изменения (только в режиме "lock")
+        """
+        return self._locked() if self.__concurrency == "lock" else nullcontext()
+
+    def _merge_external_changes(self) -> None:
+        """
+        Приватный метод объединения незаписанных изменений с изменениями других процессов
+
+        Файл перечитывается, поверх него по ID применяются добавления, замены и удаления,
+        сделанные с момента последней записи
+        """
+        index = self._read_file()
+        for vacancy_id, vacancy_data in self.__changes.items():
+            if vacancy_data is None:
+                index.pop(vacancy_id, None)
+            else:
+                index[vacancy_id] = vacancy_data
+
+    def _get_index(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Приватный метод получения индекса вакансий по ID
+
+        Файл перечитывается только если он изменился с момента последней загрузки.
+        Пока есть незаписанные изменения, данные в памяти считаются актуальными.
+        """
+        if self.__index is not None and (self.__pending or self._file_signature() == self.__signature):
+            return self.__index
+
+        # Отпечаток снимается до чтения, чтобы запись другим процессом во время чтения не осталась незамеченной
+        signature = self._file_signature()
+        index = self._read_file()
+        self.__signature = signature
+        return index
+
+    def _read_file(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Приватный метод построения индекса вакансий по ID из файла (построенные индексы сбрасываются)
+        """
+        index: Dict[Any, Dict[str, Any]] = {}
+        unindexed = []
+        for position, vacancy in enumerate(self._load_data()):
+            # Записи без ID сохраняются, но не участвуют в поиске по ID
+            vacancy_id = vacancy.get("id")
+            if not vacancy_id:
+                vacancy_id = (None, position)
+                unindexed.append(vacancy_id)
+            index[vacancy_id] = vacancy
+
+        self.__index = index
+        self.__unindexed = unindexed
+        self.__keywords = None
+        self.__salaries = None
+        self.__pending_salaries = set()
+        return index
+
+    @staticmethod
+    def _search_text(vacancy: Dict[str, Any]) -> str:
+        """
+        Приватный метод получения текста вакансии для поиска по ключевым словам
+        """
+        return f"{vacancy.get('name') or ''} {vacancy.get('requirement') or ''}"
+
+    def _get_keyword_index(self) -> KeywordIndex:
+        """
+        Приватный метод получения индекса ключевых слов
+
+        Индекс строится при первом поиске, а затем обновляется при каждом изменении.
+        Сохраненный рядом с файлом данных индекс используется, если файл с тех пор не менялся.
+        """
+        index = self._get_index()
+        if self.__keywords is None:
+            keywords = None if self.__pending else KeywordIndex.load(self.__keywords_filename, self.__signature)
+            if keywords is None:
+                keywords = KeywordIndex()
+                for vacancy_id, vacancy in index.items():
+                    if not isinstance(vacancy_id, tuple):
+                        keywords.add(vacancy_id, self._search_text(vacancy))
+            self.__keywords = keywords
+        return self.__keywords
+
+    def _get_salary_index(self) -> SalaryIndex:
+        """
+        Приватный метод получения индекса зарплат
+
+        Индекс строится при первом запросе по зарплате, а затем обновляется при каждом изменении.
+        Зарплаты в валюте с неизвестным курсом пересчитываются, когда курс становится известен
+        """
+        index = self._get_index()
+        if self.__salaries is None:
+            self.__pending_salaries = set()
+            self.__salaries = SalaryIndex(
+                (vacancy_id, self._indexed_salary(vacancy_id, vacancy)) for vacancy_id, vacancy in index.items()
+            )
+        else:
+            self._refresh_pending_salaries(index)
+        return self.__salaries
+
+    def _indexed_salary(self, vacancy_id: Any, vacancy: Dict[str, Any]) -> float:
+        """
+        Приватный метод получения зарплаты для индекса с учетом вакансий с неизвестным курсом валюты
+        """
+        salary = known_salary_average(vacancy)
+        if salary is None:
+            self.__pending_salaries.add(vacancy_id)
+            return 0.0
+        self.__pending_salaries.discard(vacancy_id)
+        return salary
+
+    def _refresh_pending_salaries(self, index: Dict[Any, Dict[str, Any]]) -> None:
+        """
+        Приватный метод пересчета в индексе зарплат, курс валюты которых был неизвестен
+        """
+        if self.__salaries is None:
+            return
+        for vacancy_id in list(self.__pending_salaries):
+            salary = self._indexed_salary(vacancy_id, index[vacancy_id])
+            if vacancy_id not in self.__pending_salaries:
+                self.__salaries.add(vacancy_id, salary)
+
+    def _record_change(self, vacancy_id: Any, vacancy_data: Optional[Dict[str, Any]]) -> None:
+        """
+        Приватный метод учета изменения вакансии в построенных индексах (None - удаление вакансии)
+
+        При совместной работе процессов изменение запоминается для объединения при записи
+        """
+        if self.__concurrency != "none":
+            self.__changes[vacancy_id] = vacancy_data
+
+        if self.__keywords is not None:
+            if vacancy_data is None:
+                self.__keywords.remove(vacancy_id)
+            else:
+                self.__keywords.add(vacancy_id, self._search_text(vacancy_data))
+
+        if self.__salaries is not None:
+            if vacancy_data is None:
+                self.__salaries.remove(vacancy_id)
+                self.__pending_salaries.discard(vacancy_id)
+            else:
+                self.__salaries.add(vacancy_id, self._indexed_salary(vacancy_id, vacancy_data))
+
+    def _save_keyword_index(self) -> None:
+        """
+        Приватный метод сохранения индекса ключевых слов рядом с файлом данных
+
+        Индекс записывается, только если изменился набор слов; если файл данных
+        с тех пор перезаписан, сохраненный индекс отклоняется по отпечатку и перестраивается
+        """
+        if self.__keywords is None or not self.__keywords.changed or self.__pending:
+            return
+        if self.__signature is not None and self.__signature == self._file_signature():
+            self.__keywords.save(self.__keywords_filename, self.__signature)
+
+    def _mark_changed(self, changes: int = 1) -> None:
+        """
+        Приватный метод учета изменений согласно политике записи
+        """
+        self.__pending += changes
+        if self.__write_policy == "immediate":
+            self.flush()
+        elif self.__write_policy == "every_n" and self.__pending >= self.__flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Запись накопленных изменений в файл
+        """
+        if not self.__pending or self.__index is None:
+            return
+
+        with self._locked():
+            if self.__concurrency != "none" and self._file_signature() != self.__signature:
+                self._merge_external_changes()
+
+            self._save_data(list(self.__index.values()))
+            self.__pending = 0
+            self.__changes.clear()
+            self.__signature = self._file_signature()
+        # При записи после каждого изменения индекс сохраняется только в close()
+        if self.__write_policy != "immediate":
+            self._save_keyword_index()
+
+    def close(self) -> None:
+        """
+        Завершение работы с хранилищем (запись накопленных изменений и индекса ключевых слов)
+        """
+        self.flush()
+        self.sync()
+        self._save_keyword_index()
 
     def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
         """
         Добавление вакансии в файл (без дубликатов)
         """
-        vacancies = self._load_data()
+        with self._mutation_lock():
+            index = self._get_index()
+
+            vacancy_id = vacancy_data.get("id")
+            if vacancy_id and vacancy_id not in index:
+                index[vacancy_id] = vacancy_data
+                self._record_change(vacancy_id, vacancy_data)
+                self._mark_changed()
+
+    def add_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Пакетное добавление вакансий: одно чтение и одна запись файла
+        Возвращает количество добавленных и пропущенных вакансий
+        """
+        with self._mutation_lock():
+            index = self._get_index()
+            inserted = skipped = 0
+
+            for vacancy_data in vacancies_data:
+                vacancy_id = vacancy_data.get("id")
+                if not vacancy_id or vacancy_id in index:
+                    skipped += 1
+                    continue
+
+                index[vacancy_id] = vacancy_data
+                self._record_change(vacancy_id, vacancy_data)
+                inserted += 1
+
+            if inserted:
+                self._mark_changed(inserted)
+
+            return inserted, skipped
+
+    def upsert_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Добавление новых и замена изменившихся вакансий одной записью файла
+        Возвращает количество добавленных и обновленных вакансий
+        """
+        with self._mutation_lock():
+            index = self._get_index()
+            inserted = updated = 0
+
+            for vacancy_data in vacancies_data:
+                vacancy_id = vacancy_data.get("id")
+                if not vacancy_id or index.get(vacancy_id) == vacancy_data:
+                    continue
+
+                if vacancy_id in index:
+                    updated += 1
+                else:
+                    inserted += 1
+                index[vacancy_id] = vacancy_data
+                self._record_change(vacancy_id, vacancy_data)
+
+            if inserted or updated:
+                self._mark_changed(inserted + updated)
 
-        vacancy_id = vacancy_data.get("id")
-        if vacancy_id and not any(v.get("id") == vacancy_id for v in vacancies):
-            vacancies.append(vacancy_data)
-            self._save_data(vacancies)
+            return inserted, updated
 
     def delete_vacancy(self, vacancy_id: str) -> None:
         """
         Удаление вакансии из файла по ID
         """
-        vacancies = self._load_data()
-        filtered_vacancies = [v for v in vacancies if v.get("id") != vacancy_id]
-        self._save_data(filtered_vacancies)
+        with self._mutation_lock():
+            index = self._get_index()
+            if index.pop(vacancy_id, None) is not None:
+                self._record_change(vacancy_id, None)
+                self._mark_changed()
+
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Пакетное удаление вакансий по ID одной записью файла
+        Возвращает количество удаленных вакансий
+        """
+        with self._mutation_lock():
+            index = self._get_index()
+            deleted = 0
+            for vacancy_id in vacancy_ids:
+                if index.pop(vacancy_id, None) is not None:
+                    self._record_change(vacancy_id, None)
+                    deleted += 1
+            if deleted:
+                self._mark_changed(deleted)
+            return deleted
 
     def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
         """
-        Фильтрация вакансий по ключевым словам
+        Фильтрация вакансий по ключевым словам (вхождение подстроки в название или требования)
+
+        Кандидаты отбираются по индексу ключевых слов: слово без пробелов и знаков препинания
+        входит в текст вакансии тогда и только тогда, когда оно входит в одно из ее слов.
+        Остальные слова проверяются по тексту отобранных вакансий.
         """
-        vacancies = self._load_data()
-        filtered = []
+        index = self._get_index()
+        keywords = self._get_keyword_index()
+        words = [word.lower() for word in filter_words]
 
-        for vacancy in vacancies:
-            name = vacancy.get("name", "").lower()
-            requirement = vacancy.get("requirement", "").lower()
-            search_text = f"{name} {requirement}"
+        candidates = None
+        for word in words:
+            if is_token(word):
+                found = keywords.search_substring(word)
+                candidates = found if candidates is None else candidates & found
 
-            if all(word.lower() in search_text for word in filter_words):
+        if candidates is None:
+            vacancy_ids = [vacancy_id for vacancy_id in index if vacancy_id in keywords]
+        else:
+            vacancy_ids = keywords.ordered(candidates)
+        # Записи без ID не попадают в индекс и проверяются перебором
+        vacancy_ids.extend(self.__unindexed)
+
+        filtered = []
+        for vacancy_id in vacancy_ids:
+            vacancy = index[vacancy_id]
+            search_text = self._search_text(vacancy).lower()
+            if all(word in search_text for word in words):
                 filtered.append(vacancy)
 
         return filtered
 
-    def filter_vacancies_by_salary(self, salary_range: Tuple[float, float]) -> List[Dict[str, Any]]:
+    def search_vacancies(self, words: Iterable[str], mode: str = "all", prefix: bool = False) -> List[Dict[str, Any]]:
         """
-        Фильтрация вакансий по диапазону зарплат
+        Поиск вакансий по целым словам названия и требований
+
+        mode="all" - вакансия содержит все слова (AND), mode="any" - хотя бы одно (OR);
+        prefix=True - слово запроса совпадает с началом слова вакансии. В отличие от
+        filter_vacancies подстроки внутри слов не ищутся, зато каждое слово находится
+        по индексу ключевых слов без перебора словаря. Вакансии возвращаются в порядке хранения.
         """
-        vacancies = self._load_data()
-        min_salary, max_salary = salary_range
-        filtered = []
+        index = self._get_index()
+        keywords = self._get_keyword_index()
+        found = [index[vacancy_id] for vacancy_id in keywords.ordered(keywords.search(words, mode, prefix))]
 
-        for vacancy in vacancies:
-            salary_from = vacancy.get("salary_from", 0) or 0
-            salary_to = vacancy.get("salary_to", 0) or 0
+        # Записи без ID не попадают в индекс и проверяются отдельным индексом
+        if self.__unindexed:
+            unindexed = KeywordIndex()
+            for vacancy_id in self.__unindexed:
+                unindexed.add(vacancy_id, self._search_text(index[vacancy_id]))
+            found.extend(index[vacancy_id] for vacancy_id in unindexed.ordered(unindexed.search(words, mode, prefix)))
+        return found
 
-            avg_salary = (salary_from + salary_to) / 2 if salary_from and salary_to else salary_from or salary_to
+    def filter_vacancies_by_salary(
+        self, salary_range: Tuple[Optional[float], Optional[float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по диапазону зарплат (по индексу средней зарплаты)
 
-            if min_salary <= avg_salary <= max_salary:
-                filtered.append(vacancy)
+        Вакансии возвращаются по возрастанию средней зарплаты; None вместо границы
+        означает открытый диапазон
+        """
+        index = self._get_index()
+        min_salary, max_salary = salary_range
+        return [index[vacancy_id] for vacancy_id in self._get_salary_index().range(min_salary, max_salary)]
 
-        return filtered
+    def salary_percentile(self, percent: float, only_with_salary: bool = True) -> Optional[float]:
+        """
+        Перцентиль средней зарплаты сохраненных вакансий (0-100)
+        """
+        return self._get_salary_index().percentile(percent, only_with_salary)
 
     def get_all_vacancies(self) -> List[Dict[str, Any]]:
         """
         Получение всех вакансий из файла
         """
-        return self._load_data()
+        return list(self._get_index().values())
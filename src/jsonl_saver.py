@@ -0,0 +1,251 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .file_handler import FileHandler
+from .salary_index import salary_average
+
+TOMBSTONE_KEY = "_deleted"
+
+
+class JSONLinesSaver(FileHandler):
+    """
+    Класс для хранения вакансий в журнале формата JSON Lines
+
+    Каждая вакансия записывается отдельной строкой в конец файла, удаление
+    добавляет строку-надгробие. Компактификация переписывает журнал, оставляя
+    только актуальные записи.
+    """
+
+    def __init__(
+        self,
+        filename: str = "data/vacancies.jsonl",
+        compact_ratio: float = 0.5,
+        compact_min_records: int = 1000,
+    ):
+        """
+        Инициализация журнала JSON Lines
+
+        Журнал компактифицируется автоматически, когда доля устаревших строк
+        превышает compact_ratio и в журнале не меньше compact_min_records строк
+        """
+        if not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio должно быть в диапазоне (0, 1]")
+
+        dirname = os.path.dirname(filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.__filename = filename
+        self.__compact_ratio = compact_ratio
+        self.__compact_min_records = compact_min_records
+        self.__ids: Set[Any] = set()
+        self.__log_records = 0
+
+        if not os.path.exists(self.__filename):
+            open(self.__filename, "w", encoding="utf-8").close()
+
+        self._load_live()
+
+    @property
+    def filename(self) -> str:
+        """Путь к файлу журнала"""
+        return self.__filename
+
+    def _read_log(self) -> Iterator[Dict[str, Any]]:
+        """
+        Приватный метод построчного чтения журнала
+
+        Поврежденные строки (например, недописанные при сбое) пропускаются
+        """
+        try:
+            with open(self.__filename, "r", encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except FileNotFoundError:
+            return
+
+    def _load_live(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Приватный метод получения актуальных вакансий из журнала
+
+        Попутно обновляет множество ID и счетчик строк журнала
+        """
+        live: Dict[Any, Dict[str, Any]] = {}
+        log_records = 0
+
+        for record in self._read_log():
+            log_records += 1
+            vacancy_id = record.get("id")
+            if record.get(TOMBSTONE_KEY):
+                live.pop(vacancy_id, None)
+            elif vacancy_id:
+                live[vacancy_id] = record
+
+        self.__ids = set(live)
+        self.__log_records = log_records
+        return live
+
+    def _append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Приватный метод дописывания строк в конец журнала
+        """
+        lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+        if not lines:
+            return
+
+        # Недописанная при сбое последняя строка завершается, чтобы новые записи не склеились с ней
+        prefix = "" if self._ends_with_newline() else "\n"
+
+        with open(self.__filename, "a", encoding="utf-8") as file:
+            file.write(prefix)
+            file.writelines(lines)
+        self.__log_records += len(lines)
+
+    def _ends_with_newline(self) -> bool:
+        """
+        Приватный метод проверки, что журнал пуст или заканчивается переводом строки
+        """
+        try:
+            with open(self.__filename, "rb") as file:
+                if file.seek(0, os.SEEK_END) == 0:
+                    return True
+                file.seek(-1, os.SEEK_END)
+                return file.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def _needs_compaction(self) -> bool:
+        """
+        Приватный метод проверки необходимости компактификации
+        """
+        if not self.__log_records or self.__log_records < self.__compact_min_records:
+            return False
+        garbage = self.__log_records - len(self.__ids)
+        return garbage / self.__log_records > self.__compact_ratio
+
+    def compact(self) -> None:
+        """
+        Переписывание журнала с сохранением только актуальных вакансий
+        """
+        vacancies = list(self._load_live().values())
+        temp_filename = f"{self.__filename}.tmp"
+
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(vacancy, ensure_ascii=False) + "\n" for vacancy in vacancies)
+        os.replace(temp_filename, self.__filename)
+
+        self.__log_records = len(vacancies)
+
+    def close(self) -> None:
+        """
+        Завершение работы с журналом (компактификация при необходимости)
+        """
+        if self._needs_compaction():
+            self.compact()
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """
+        Добавление вакансии в конец журнала (без дубликатов)
+        """
+        self.add_vacancies([vacancy_data])
+
+    def add_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Пакетное добавление вакансий одной операцией дозаписи
+        Возвращает количество добавленных и пропущенных вакансий
+        """
+        new_records = []
+        skipped = 0
+
+        for vacancy_data in vacancies_data:
+            vacancy_id = vacancy_data.get("id")
+            if not vacancy_id or vacancy_id in self.__ids:
+                skipped += 1
+                continue
+
+            new_records.append(vacancy_data)
+            self.__ids.add(vacancy_id)
+
+        self._append(new_records)
+        return len(new_records), skipped
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """
+        Удаление вакансии по ID (дозапись надгробия)
+        """
+        if vacancy_id not in self.__ids:
+            return
+
+        self.__ids.discard(vacancy_id)
+        self._append([{"id": vacancy_id, TOMBSTONE_KEY: True}])
+
+        if self._needs_compaction():
+            self.compact()
+
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Пакетное удаление вакансий по ID одной дозаписью надгробий
+        Возвращает количество удаленных вакансий
+        """
+        tombstones = []
+        for vacancy_id in vacancy_ids:
+            if vacancy_id in self.__ids:
+                self.__ids.discard(vacancy_id)
+                tombstones.append({"id": vacancy_id, TOMBSTONE_KEY: True})
+
+        self._append(tombstones)
+        if tombstones and self._needs_compaction():
+            self.compact()
+        return len(tombstones)
+
+    def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по ключевым словам
+        """
+        filtered = []
+
+        for vacancy in self._load_live().values():
+            name = vacancy.get("name", "").lower()
+            requirement = vacancy.get("requirement", "").lower()
+            search_text = f"{name} {requirement}"
+
+            if all(word.lower() in search_text for word in filter_words):
+                filtered.append(vacancy)
+
+        return filtered
+
+    def filter_vacancies_by_salary(
+        self, salary_range: Tuple[Optional[float], Optional[float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по диапазону зарплат
+
+        Вакансии возвращаются по возрастанию средней зарплаты (при равной - в порядке журнала);
+        None вместо границы означает открытый диапазон
+        """
+        min_salary, max_salary = salary_range
+        filtered = []
+
+        for vacancy in self._load_live().values():
+            salary = salary_average(vacancy)
+            if (min_salary is None or salary >= min_salary) and (max_salary is None or salary <= max_salary):
+                filtered.append((salary, vacancy))
+
+        # Сортировка устойчива, поэтому вакансии с равной зарплатой сохраняют порядок журнала
+        filtered.sort(key=lambda item: item[0])
+        return [vacancy for _, vacancy in filtered]
+
+    def get_all_vacancies(self) -> List[Dict[str, Any]]:
+        """
+        Получение всех актуальных вакансий из журнала
+        """
+        return list(self._load_live().values())
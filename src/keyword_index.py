@@ -0,0 +1,248 @@
+import json
+import os
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Версия формата файла индекса
+INDEX_VERSION = 1
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Разбиение текста на слова в нижнем регистре
+    """
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+
+def is_token(word: str) -> bool:
+    """
+    Проверка, что слово целиком состоит из символов, попадающих в токены
+    """
+    return TOKEN_PATTERN.fullmatch(word) is not None
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс ключевых слов: слово -> множество ID вакансий
+
+    Обновляется по одной вакансии при добавлении и удалении, поддерживает
+    запросы "все слова" (AND), "любое слово" (OR), поиск по началу слова
+    и по подстроке слова.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация пустого индекса
+        """
+        self.__postings: Dict[str, Set[Any]] = {}
+        self.__documents: Dict[Any, Set[str]] = {}
+        self.__positions: Dict[Any, int] = {}
+        self.__next_position = 0
+        self.__vocabulary: Optional[List[str]] = None
+        self.__changed = False
+
+    def __len__(self) -> int:
+        return len(self.__documents)
+
+    def __contains__(self, vacancy_id: Any) -> bool:
+        return vacancy_id in self.__documents
+
+    @property
+    def changed(self) -> bool:
+        """Есть ли изменения, не сохраненные в файл"""
+        return self.__changed
+
+    def add(self, vacancy_id: Any, text: str) -> None:
+        """
+        Индексация текста вакансии (повторная индексация заменяет прежние слова,
+        сохраняя место вакансии в порядке добавления; те же слова не считаются изменением)
+        """
+        tokens = tokenize(text)
+        if vacancy_id in self.__documents:
+            if self.__documents[vacancy_id] == tokens:
+                return
+            self._unlink(vacancy_id)
+        else:
+            self.__positions[vacancy_id] = self.__next_position
+            self.__next_position += 1
+
+        self.__documents[vacancy_id] = tokens
+        for token in tokens:
+            postings = self.__postings.get(token)
+            if postings is None:
+                self.__postings[token] = postings = set()
+                self.__vocabulary = None
+            postings.add(vacancy_id)
+        self.__changed = True
+
+    def remove(self, vacancy_id: Any) -> None:
+        """
+        Удаление вакансии из индекса
+        """
+        if vacancy_id in self.__documents:
+            self._unlink(vacancy_id)
+            del self.__documents[vacancy_id]
+            del self.__positions[vacancy_id]
+            self.__changed = True
+
+    def _unlink(self, vacancy_id: Any) -> None:
+        """
+        Приватный метод удаления ID вакансии из списков ее слов
+        """
+        for token in self.__documents[vacancy_id]:
+            postings = self.__postings[token]
+            postings.discard(vacancy_id)
+            if not postings:
+                del self.__postings[token]
+                self.__vocabulary = None
+
+    def clear(self) -> None:
+        """
+        Очистка индекса
+        """
+        self.__postings.clear()
+        self.__documents.clear()
+        self.__positions.clear()
+        self.__vocabulary = None
+        self.__changed = True
+
+    def _get_vocabulary(self) -> List[str]:
+        """
+        Приватный метод получения отсортированного словаря для поиска по началу слова
+        """
+        if self.__vocabulary is None:
+            self.__vocabulary = sorted(self.__postings)
+        return self.__vocabulary
+
+    def _lookup(self, word: str, prefix: bool) -> Set[Any]:
+        """
+        Приватный метод получения ID вакансий для одного слова
+        """
+        if not prefix:
+            return self.__postings.get(word, set())
+
+        vocabulary = self._get_vocabulary()
+        result: Set[Any] = set()
+        for position in range(bisect_left(vocabulary, word), len(vocabulary)):
+            token = vocabulary[position]
+            if not token.startswith(word):
+                break
+            result |= self.__postings[token]
+        return result
+
+    def search(self, words: Iterable[str], mode: str = "all", prefix: bool = False) -> Set[Any]:
+        """
+        Поиск ID вакансий по словам
+
+        mode="all" - вакансия содержит все слова (AND), mode="any" - хотя бы одно (OR);
+        prefix=True - слово запроса совпадает с началом слова вакансии
+        """
+        if mode not in ("all", "any"):
+            raise ValueError(f"Неизвестный режим поиска: {mode}")
+
+        query = [token for word in words for token in sorted(tokenize(word))]
+        if not query:
+            return set()
+
+        if mode == "any":
+            result: Set[Any] = set()
+            for word in query:
+                result |= self._lookup(word, prefix)
+            return result
+
+        postings = sorted((self._lookup(word, prefix) for word in query), key=len)
+        result = set(postings[0])
+        for other in postings[1:]:
+            result &= other
+            if not result:
+                break
+        return result
+
+    def search_substring(self, word: str) -> Set[Any]:
+        """
+        Поиск ID вакансий, у которых какое-либо слово содержит подстроку
+
+        Перебирается словарь индекса, а не вакансии
+        """
+        word = word.lower()
+        result: Set[Any] = set()
+        for token, postings in self.__postings.items():
+            if word in token:
+                result |= postings
+        return result
+
+    def ordered(self, vacancy_ids: Iterable[Any]) -> List[Any]:
+        """
+        Упорядочивание найденных ID в порядке добавления вакансий в индекс
+        """
+        return sorted(vacancy_ids, key=self.__positions.__getitem__)
+
+    def save(self, filename: str, signature: Tuple[int, ...]) -> None:
+        """
+        Сохранение индекса в файл вместе с отпечатком файла данных
+
+        ID хранятся одним списком в порядке добавления, списки слов ссылаются на позиции в нем.
+        Файл записывается атомарно (временный файл и переименование), как и файл данных
+        """
+        vacancy_ids = self.ordered(self.__documents)
+        positions = {vacancy_id: position for position, vacancy_id in enumerate(vacancy_ids)}
+        data = {
+            "version": INDEX_VERSION,
+            "signature": list(signature),
+            "ids": vacancy_ids,
+            "postings": {
+                token: [positions[vacancy_id] for vacancy_id in postings]
+                for token, postings in self.__postings.items()
+            },
+        }
+        temp_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_filename, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(temp_filename, filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+        self.__changed = False
+
+    @classmethod
+    def load(cls, filename: str, signature: Optional[Tuple[int, ...]]) -> Optional["KeywordIndex"]:
+        """
+        Загрузка индекса из файла
+
+        Возвращает None, если файла нет, он поврежден или построен для другой версии файла данных
+        """
+        if signature is None or not os.path.exists(filename):
+            return None
+
+        try:
+            with open(filename, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("signature") != list(signature)
+        ):
+            return None
+
+        index = cls()
+        vacancy_ids = data.get("ids", [])
+        for vacancy_id in vacancy_ids:
+            index.__documents[vacancy_id] = set()
+            index.__positions[vacancy_id] = index.__next_position
+            index.__next_position += 1
+
+        for token, positions in data.get("postings", {}).items():
+            postings = index.__postings[token] = set()
+            for position in positions:
+                vacancy_id = vacancy_ids[position]
+                postings.add(vacancy_id)
+                index.__documents[vacancy_id].add(token)
+        return index
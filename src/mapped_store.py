@@ -0,0 +1,332 @@
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .file_handler import FileHandler
+from .salary_index import salary_average
+
+DEFAULT_MAPPED_FILE = "data/vacancies.vmap"
+
+# Сигнатура и версия формата хранилища
+STORE_MAGIC = b"VMAP"
+STORE_VERSION = 1
+
+# Заголовок файла: сигнатура, версия, флаги (зарезервированы), число записей
+HEADER = struct.Struct("<4sHHQ")
+
+# Поля записи в формате Vacancy.to_dict(), хранящиеся в таблице записей
+STRING_FIELDS = ("id", "name", "alternate_url", "salary_currency", "requirement")
+NUMBER_FIELDS = ("salary_from", "salary_to", "salary_normalized")
+RECORD_FIELD_NAMES = frozenset(STRING_FIELDS + NUMBER_FIELDS)
+
+# Запись таблицы фиксированной длины: тип записи, ссылки (смещение в куче строк, длина) на строковые
+# поля и на JSON с прочими ключами, числовые поля
+RECORD = struct.Struct("<B" + "QI" * (len(STRING_FIELDS) + 1) + "d" * len(NUMBER_FIELDS))
+
+# Позиции ссылок в распакованной записи (без типа записи)
+NAME_REFERENCE = 2 * STRING_FIELDS.index("name")
+REQUIREMENT_REFERENCE = 2 * STRING_FIELDS.index("requirement")
+EXTRA_REFERENCE = 2 * len(STRING_FIELDS)
+NUMBERS_START = EXTRA_REFERENCE + 2
+
+# Типы записей
+RECORD_FIELDS = 0  # поля Vacancy.to_dict() в таблице, прочие ключи в JSON
+RECORD_JSON = 1  # запись другого формата целиком в JSON
+
+READ_ONLY_MESSAGE = "Хранилище доступно только для чтения"
+
+
+def _is_table_record(record: Dict[str, Any]) -> bool:
+    """
+    Приватная функция проверки, что запись хранится полями таблицы (формат Vacancy.to_dict())
+    """
+    return all(isinstance(record.get(field), str) for field in STRING_FIELDS) and all(
+        type(record.get(field)) in (int, float) for field in NUMBER_FIELDS
+    )
+
+
+class MappedRecords(Sequence):
+    """
+    Ленивая последовательность записей хранилища: запись декодируется только при обращении к ней
+    """
+
+    def __init__(self, decode: Callable[[int], Dict[str, Any]], positions: Sequence) -> None:
+        """
+        Инициализация функцией декодирования записи и номерами записей в таблице
+        """
+        self.__decode = decode
+        self.__positions = positions
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.__decode(position) for position in self.__positions[index]]
+        return self.__decode(self.__positions[index])
+
+
+class MappedVacancyStore(FileHandler):
+    """
+    Хранилище вакансий только для чтения, отображаемое в память (mmap)
+
+    Файл состоит из заголовка, столбца средних зарплат по возрастанию, номеров записей
+    в этом порядке, таблицы записей фиксированной длины и кучи строк. Открытие не читает
+    записи: запись декодируется при обращении, поэтому память расходуется только на
+    затронутые записи. Файл создается методом build() из записей другого хранилища.
+    """
+
+    read_only = True
+
+    def __init__(self, filename: str = DEFAULT_MAPPED_FILE):
+        """
+        Открытие хранилища (отсутствующий файл создается пустым)
+
+        Вызывает ValueError, если файл не является хранилищем поддерживаемой версии
+        """
+        if sys.byteorder != "little":  # pragma: no cover - платформы big-endian
+            raise ValueError("Хранилище поддерживается только на платформах little-endian")
+
+        if not os.path.exists(filename):
+            self._write(filename, [])
+
+        self.__filename = filename
+        self.__file = open(filename, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.__salaries, self.__order = self._open_sections(self.__map)
+            except BaseException:
+                self.__map.close()
+                raise
+        except (ValueError, struct.error) as error:
+            self.__file.close()
+            raise ValueError(f"Поврежденное хранилище {filename}: {error}") from error
+
+    def _open_sections(self, mapped: mmap.mmap) -> Tuple["memoryview[float]", "memoryview[int]"]:
+        """
+        Приватный метод проверки заголовка и разметки разделов файла
+
+        Возвращает столбец зарплат и номера записей в порядке зарплат
+        """
+        magic, version, _, count = HEADER.unpack_from(mapped)
+        if magic != STORE_MAGIC:
+            raise ValueError("файл не является хранилищем вакансий")
+        if version != STORE_VERSION:
+            raise ValueError(f"неподдерживаемая версия {version}")
+
+        order_offset = HEADER.size + 8 * count
+        self.__table_offset = order_offset + 4 * count
+        self.__heap_offset = self.__table_offset + RECORD.size * count
+        if self.__heap_offset > len(mapped):
+            raise ValueError("файл обрезан")
+
+        self.__count = count
+        with memoryview(mapped) as view:
+            return view[HEADER.size : order_offset].cast("d"), view[order_offset : self.__table_offset].cast("I")
+
+    @property
+    def filename(self) -> str:
+        """Путь к файлу хранилища"""
+        return self.__filename
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __enter__(self) -> "MappedVacancyStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие отображения файла
+        """
+        self.__salaries.release()
+        self.__order.release()
+        self.__map.close()
+        self.__file.close()
+
+    @classmethod
+    def build(cls, filename: str, records: Iterable[Dict[str, Any]]) -> "MappedVacancyStore":
+        """
+        Создание (замена) файла хранилища из записей и его открытие
+
+        Записи в формате Vacancy.to_dict() хранятся полями таблицы, прочие - в JSON
+        """
+        cls._write(filename, list(records))
+        return cls(filename)
+
+    @staticmethod
+    def _write(filename: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Приватный метод атомарной записи файла хранилища (временный файл и переименование)
+        """
+        heap = io.BytesIO()
+        references: Dict[str, Tuple[int, int]] = {}
+
+        def reference(text: str) -> Tuple[int, int]:
+            # Одинаковые строки (валюта, требования) хранятся в куче один раз
+            if text not in references:
+                encoded = text.encode("utf-8")
+                references[text] = (heap.tell(), len(encoded))
+                heap.write(encoded)
+            return references[text]
+
+        table = bytearray()
+        for record in records:
+            if _is_table_record(record):
+                extra = {key: value for key, value in record.items() if key not in RECORD_FIELD_NAMES}
+                strings = [record[field] for field in STRING_FIELDS]
+                strings.append(json.dumps(extra, ensure_ascii=False) if extra else "")
+                numbers = [float(record[field]) for field in NUMBER_FIELDS]
+                kind = RECORD_FIELDS
+            else:
+                strings = [""] * len(STRING_FIELDS) + [json.dumps(record, ensure_ascii=False)]
+                numbers = [0.0] * len(NUMBER_FIELDS)
+                kind = RECORD_JSON
+            table += RECORD.pack(kind, *(part for text in strings for part in reference(text)), *numbers)
+
+        salaries = [float(salary_average(record)) for record in records]
+        order = sorted(range(len(records)), key=salaries.__getitem__)
+
+        dirname = os.path.dirname(filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        temp_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_filename, "wb") as file:
+                file.write(HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, len(records)))
+                file.write(array("d", [salaries[position] for position in order]).tobytes())
+                file.write(array("I", order).tobytes())
+                file.write(table)
+                file.write(heap.getbuffer())
+            os.replace(temp_filename, filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+
+    def _string(self, offset: int, size: int) -> str:
+        """
+        Приватный метод чтения строки из кучи
+        """
+        start = self.__heap_offset + offset
+        return self.__map[start : start + size].decode("utf-8")
+
+    def _record(self, position: int) -> Dict[str, Any]:
+        """
+        Приватный метод декодирования записи по номеру в таблице
+        """
+        kind, *fields = RECORD.unpack_from(self.__map, self.__table_offset + position * RECORD.size)
+        extra_offset, extra_size = fields[EXTRA_REFERENCE : EXTRA_REFERENCE + 2]
+        if kind == RECORD_JSON:
+            return json.loads(self._string(extra_offset, extra_size))
+
+        record: Dict[str, Any] = {
+            field: self._string(fields[2 * number], fields[2 * number + 1])
+            for number, field in enumerate(STRING_FIELDS)
+        }
+        record.update(zip(NUMBER_FIELDS, fields[NUMBERS_START:]))
+        if extra_size:
+            record.update(json.loads(self._string(extra_offset, extra_size)))
+        return record
+
+    def _search_text(self, position: int) -> str:
+        """
+        Приватный метод получения текста записи для поиска без декодирования остальных полей
+        """
+        kind, *fields = RECORD.unpack_from(self.__map, self.__table_offset + position * RECORD.size)
+        if kind == RECORD_JSON:
+            record = self._record(position)
+            return f"{record.get('name') or ''} {record.get('requirement') or ''}"
+        name = self._string(fields[NAME_REFERENCE], fields[NAME_REFERENCE + 1])
+        requirement = self._string(fields[REQUIREMENT_REFERENCE], fields[REQUIREMENT_REFERENCE + 1])
+        return f"{name} {requirement}"
+
+    def get_all_vacancies(self) -> MappedRecords:
+        """
+        Все вакансии в порядке записи (ленивая последовательность)
+        """
+        return MappedRecords(self._record, range(self.__count))
+
+    def get_top_vacancies(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Топ n вакансий по средней зарплате в рублях: декодируются только n записей
+        """
+        n = min(n, self.__count)
+        if n <= 0:
+            return []
+
+        # Вакансии с зарплатой на границе топа берутся в порядке записи, как в heapq.nlargest
+        boundary = self.__salaries[self.__count - n]
+        start = bisect_left(self.__salaries, boundary)
+        end = bisect_right(self.__salaries, boundary)
+        above = sorted(range(end, self.__count), key=lambda number: (-self.__salaries[number], self.__order[number]))
+        positions = [self.__order[number] for number in above]
+        positions.extend(self.__order[start : start + n - len(positions)].tolist())
+        return [self._record(position) for position in positions]
+
+    def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по ключевым словам (вхождение подстроки в название или требования)
+
+        Перебираются только строки названия и требований, декодируются найденные записи
+        """
+        words = [word.lower() for word in filter_words]
+        return [
+            self._record(position)
+            for position in range(self.__count)
+            if all(word in self._search_text(position).lower() for word in words)
+        ]
+
+    def filter_vacancies_by_salary(self, salary_range: Tuple[Optional[float], Optional[float]]) -> MappedRecords:
+        """
+        Фильтрация вакансий по диапазону зарплат двоичным поиском по столбцу зарплат
+
+        Вакансии возвращаются по возрастанию средней зарплаты ленивой последовательностью;
+        None вместо границы означает открытый диапазон
+        """
+        min_salary, max_salary = salary_range
+        start = 0 if min_salary is None else bisect_left(self.__salaries, min_salary)
+        end = self.__count if max_salary is None else bisect_right(self.__salaries, max_salary)
+        # Номера копируются, чтобы результат не удерживал отображение файла после close()
+        return MappedRecords(self._record, self.__order[start : max(start, end)].tolist())
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """
+        Хранилище только для чтения: вызывает io.UnsupportedOperation
+        """
+        raise io.UnsupportedOperation(READ_ONLY_MESSAGE)
+
+    def add_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Хранилище только для чтения: вызывает io.UnsupportedOperation
+        """
+        raise io.UnsupportedOperation(READ_ONLY_MESSAGE)
+
+    def upsert_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Хранилище только для чтения: вызывает io.UnsupportedOperation
+        """
+        raise io.UnsupportedOperation(READ_ONLY_MESSAGE)
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """
+        Хранилище только для чтения: вызывает io.UnsupportedOperation
+        """
+        raise io.UnsupportedOperation(READ_ONLY_MESSAGE)
+
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Хранилище только для чтения: вызывает io.UnsupportedOperation
+        """
+        raise io.UnsupportedOperation(READ_ONLY_MESSAGE)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 
 class Parser(ABC):
@@ -26,3 +26,10 @@ class Parser(ABC):
         Абстрактный метод для загрузки вакансий
         """
         pass
+
+    def iter_vacancies(self, keyword: str) -> Iterator[Dict[str, Any]]:
+        """
+        Генератор вакансий по ключевому слову
+        По умолчанию выдает результат load_vacancies, наследники могут выдавать вакансии по мере загрузки
+        """
+        yield from self.load_vacancies(keyword)
@@ -0,0 +1,163 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+
+# Коды ответа, после которых запрос повторяется с задержкой
+THROTTLE_STATUS = 429
+RETRY_STATUSES = (THROTTLE_STATUS, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Класс адаптивного ограничителя частоты запросов
+
+    Сочетает корзину токенов (не больше rate запросов в секунду с запасом burst)
+    и ограничение числа одновременных запросов по схеме AIMD: после ответа 429
+    предел уменьшается вдвое, после каждого успешного ответа плавно растет.
+    Заголовок Retry-After приостанавливает все запросы, использующие ограничитель.
+    Остальные повторы выполняются с экспоненциальной задержкой со случайным разбросом.
+    """
+
+    _shared_instance: Optional["RateLimiter"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rate: Optional[float] = 20,
+        burst: int = 20,
+        max_concurrency: int = 16,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30,
+    ):
+        """
+        Инициализация ограничителя
+
+        rate=None отключает ограничение частоты, оставляя только ограничение одновременности
+        """
+        if (rate is not None and rate <= 0) or burst < 1 or max_concurrency < 1:
+            raise ValueError("rate, burst и max_concurrency должны быть положительными числами")
+
+        self.__rate = rate
+        self.__burst = burst
+        self.__tokens = float(burst)
+        self.__refilled_at = time.monotonic()
+        self.__max_concurrency = max_concurrency
+        self.__limit = float(max_concurrency)
+        self.__in_flight = 0
+        self.__paused_until = 0.0
+        self.__backoff_base = backoff_base
+        self.__backoff_cap = backoff_cap
+        self.__condition = threading.Condition()
+        self.__stats = {"requests": 0, "throttles": 0, "retries": 0}
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        """
+        Общий для процесса ограничитель, используемый клиентами HH по умолчанию
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Счетчики запросов, ответов 429 и повторов, а также текущий предел одновременности"""
+        with self.__condition:
+            return {**self.__stats, "concurrency": self.__limit}
+
+    def _refill(self, now: float) -> None:
+        """
+        Приватный метод пополнения корзины токенов (вызывается под блокировкой)
+        """
+        if self.__rate is not None:
+            self.__tokens = min(self.__burst, self.__tokens + (now - self.__refilled_at) * self.__rate)
+        self.__refilled_at = now
+
+    def acquire(self) -> None:
+        """
+        Ожидание разрешения на запрос
+        """
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.__paused_until:
+                    timeout: Optional[float] = self.__paused_until - now
+                elif self.__in_flight >= int(self.__limit):
+                    timeout = None
+                elif self.__rate is not None and self.__tokens < 1:
+                    timeout = (1 - self.__tokens) / self.__rate
+                else:
+                    if self.__rate is not None:
+                        self.__tokens -= 1
+                    self.__in_flight += 1
+                    self.__stats["requests"] += 1
+                    return
+
+                self.__condition.wait(timeout)
+
+    def release(self, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Освобождение разрешения и учет результата запроса
+        """
+        with self.__condition:
+            self.__in_flight -= 1
+            if status_code == THROTTLE_STATUS:
+                self.__stats["throttles"] += 1
+                self.__limit = max(1.0, self.__limit / 2)
+            elif status_code is not None and status_code < 500:
+                self.__limit = min(float(self.__max_concurrency), self.__limit + 1 / self.__limit)
+            if retry_after:
+                self.__paused_until = max(self.__paused_until, time.monotonic() + retry_after)
+            self.__condition.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Задержка перед повтором с номером attempt (экспоненциальная со случайным разбросом)
+        """
+        return random.uniform(0, min(self.__backoff_cap, self.__backoff_base * 2**attempt))
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Приватный метод чтения заголовка Retry-After (в секундах)
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def execute(self, send: Callable[[], requests.Response], retries: int = 3) -> requests.Response:
+        """
+        Выполнение запроса с ограничением частоты и повтором при ответах 429 и 5xx
+
+        После исчерпания повторов возвращается последний ответ
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            status_code = retry_after = None
+            try:
+                response = send()
+                status_code = response.status_code
+                if status_code in RETRY_STATUSES:
+                    retry_after = self._retry_after(response)
+            finally:
+                self.release(status_code, retry_after)
+
+            if status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+
+            with self.__condition:
+                self.__stats["retries"] += 1
+            if retry_after is None:
+                time.sleep(self.backoff(attempt))
+            attempt += 1
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Класс дискового кэша ответов API
+
+    Каждый ответ хранится в отдельном файле с ключом по URL и параметрам запроса.
+    Записи имеют срок жизни (ttl), при превышении общего размера вытесняются
+    давно не использованные записи. Устаревшие записи с ETag или Last-Modified
+    можно перепроверить условным запросом.
+    """
+
+    def __init__(self, directory: str = "data/cache", ttl: float = 3600, max_size: int = 50 * 1024 * 1024):
+        """
+        Инициализация кэша
+
+        ttl - срок жизни записи в секундах, max_size - предельный размер кэша в байтах
+        """
+        if ttl < 0 or max_size <= 0:
+            raise ValueError("ttl и max_size должны быть положительными числами")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.__directory = directory
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.__stats = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+        self.__entries: "OrderedDict[str, int]" = OrderedDict()
+        self.__size = 0
+        self._scan()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Статистика обращений к кэшу"""
+        with self.__lock:
+            return dict(self.__stats)
+
+    @property
+    def size(self) -> int:
+        """Текущий размер кэша в байтах"""
+        return self.__size
+
+    def _scan(self) -> None:
+        """
+        Приватный метод восстановления порядка использования записей по времени изменения файлов
+        """
+        files = []
+        for name in os.listdir(self.__directory):
+            if not name.endswith(".json"):
+                continue
+            stat = os.stat(os.path.join(self.__directory, name))
+            files.append((stat.st_mtime_ns, name[:-5], stat.st_size))
+
+        for _, key, size in sorted(files):
+            self.__entries[key] = size
+            self.__size += size
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """
+        Построение ключа записи по URL и параметрам запроса
+        """
+        raw = json.dumps([url, sorted((str(k), str(v)) for k, v in params.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        Приватный метод получения пути к файлу записи
+        """
+        return os.path.join(self.__directory, f"{key}.json")
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Получение записи кэша (в том числе устаревшей) или None
+        """
+        key = self.make_key(url, params)
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Проверка, не истек ли срок жизни записи
+        """
+        return entry.get("expires_at", 0) > time.time()
+
+    def put(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Сохранение ответа в кэш
+        """
+        now = time.time()
+        entry = {
+            "url": url,
+            "params": params,
+            "stored_at": now,
+            "expires_at": now + self.__ttl,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        self._write(self.make_key(url, params), entry)
+        return entry
+
+    def refresh(self, url: str, params: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Продление срока жизни записи после успешной перепроверки
+        """
+        entry = {**entry, "expires_at": time.time() + self.__ttl}
+        self._write(self.make_key(url, params), entry)
+        return entry
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Приватный метод атомарной записи файла и вытеснения старых записей
+        """
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+        with self.__lock:
+            self.__size += len(data) - self.__entries.pop(key, 0)
+            self.__entries[key] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Приватный метод вытеснения давно не использованных записей (вызывается под блокировкой)
+        """
+        while self.__size > self.__max_size and len(self.__entries) > 1:
+            key, size = self.__entries.popitem(last=False)
+            self.__size -= size
+            self.__stats["evictions"] += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def record(self, event: str) -> None:
+        """
+        Учет события в статистике (hits, misses, revalidated)
+        """
+        with self.__lock:
+            self.__stats[event] += 1
+
+    def clear(self) -> None:
+        """
+        Удаление всех записей кэша
+        """
+        with self.__lock:
+            for key in self.__entries:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self.__entries.clear()
+            self.__size = 0
@@ -0,0 +1,149 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .currency import CurrencyRates
+
+# Ключ индекса: средняя зарплата и порядковый номер добавления (для одинаковых зарплат)
+SalaryKey = Tuple[float, int]
+
+INFINITY = float("inf")
+
+
+def salary_amount(vacancy: Dict[str, Any]) -> float:
+    """
+    Средняя зарплата записи вакансии в ее валюте (как в Vacancy.get_salary_average)
+    """
+    salary_from = vacancy.get("salary_from", 0) or 0
+    salary_to = vacancy.get("salary_to", 0) or 0
+    return (salary_from + salary_to) / 2 if salary_from and salary_to else salary_from or salary_to
+
+
+def known_salary_average(vacancy: Dict[str, Any]) -> Optional[float]:
+    """
+    Средняя зарплата записи вакансии в рублях (None, пока курс ее валюты неизвестен)
+
+    Записи, сохраненные до приведения к рублям или до загрузки курса их валюты,
+    пересчитываются по текущему курсу
+    """
+    normalized = vacancy.get("salary_normalized")
+    if normalized is not None:
+        return normalized
+    return CurrencyRates.shared().normalize(salary_amount(vacancy), vacancy.get("salary_currency"))
+
+
+def salary_average(vacancy: Dict[str, Any]) -> float:
+    """
+    Средняя зарплата записи вакансии в рублях (как в Vacancy.get_normalized_salary)
+
+    Зарплата в валюте с неизвестным курсом считается нулевой
+    """
+    normalized = known_salary_average(vacancy)
+    return 0.0 if normalized is None else normalized
+
+
+class SalaryIndex:
+    """
+    Индекс вакансий, упорядоченный по средней зарплате
+
+    Ключи хранятся в отсортированном списке и обновляются через bisect, поэтому
+    запрос диапазона стоит O(log n + k). Вакансии с одинаковой зарплатой
+    упорядочены по времени добавления.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Any, float]] = ()) -> None:
+        """
+        Инициализация индекса парами (ID вакансии, средняя зарплата)
+        """
+        self.__keys_by_id: Dict[Any, SalaryKey] = {}
+        for sequence, (vacancy_id, salary) in enumerate(items):
+            self.__keys_by_id[vacancy_id] = (float(salary), sequence)
+        self.__sequence = len(self.__keys_by_id)
+
+        entries = sorted((key, vacancy_id) for vacancy_id, key in self.__keys_by_id.items())
+        self.__keys: List[SalaryKey] = [key for key, _ in entries]
+        self.__ids: List[Any] = [vacancy_id for _, vacancy_id in entries]
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, vacancy_id: Any) -> bool:
+        return vacancy_id in self.__keys_by_id
+
+    def add(self, vacancy_id: Any, salary: float) -> None:
+        """
+        Добавление вакансии (для существующего ID зарплата обновляется)
+
+        Обновленная вакансия сохраняет свой порядковый номер, поэтому среди равных зарплат
+        остается на месте, как и запись в хранилище
+        """
+        old_key = self.__keys_by_id.get(vacancy_id)
+        if old_key is None:
+            sequence = self.__sequence
+            self.__sequence += 1
+        else:
+            self.remove(vacancy_id)
+            sequence = old_key[1]
+
+        key = (float(salary), sequence)
+        position = bisect_right(self.__keys, key)
+        self.__keys.insert(position, key)
+        self.__ids.insert(position, vacancy_id)
+        self.__keys_by_id[vacancy_id] = key
+
+    def remove(self, vacancy_id: Any) -> None:
+        """
+        Удаление вакансии из индекса
+        """
+        key = self.__keys_by_id.pop(vacancy_id, None)
+        if key is None:
+            return
+
+        position = bisect_left(self.__keys, key)
+        del self.__keys[position]
+        del self.__ids[position]
+
+    def _bounds(self, min_salary: Optional[float], max_salary: Optional[float]) -> Tuple[int, int]:
+        """
+        Приватный метод поиска границ диапазона зарплат (включительно) в списке ключей
+        """
+        start = 0 if min_salary is None else bisect_left(self.__keys, (min_salary, -1))
+        end = len(self.__keys) if max_salary is None else bisect_right(self.__keys, (max_salary, INFINITY))
+        return start, max(start, end)
+
+    def range(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None) -> List[Any]:
+        """
+        ID вакансий со средней зарплатой в диапазоне [min_salary, max_salary] по возрастанию зарплаты
+
+        None вместо границы означает открытый диапазон
+        """
+        start, end = self._bounds(min_salary, max_salary)
+        return self.__ids[start:end]
+
+    def count(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None) -> int:
+        """
+        Количество вакансий в диапазоне зарплат без построения списка
+        """
+        start, end = self._bounds(min_salary, max_salary)
+        return end - start
+
+    def percentile(self, percent: float, only_with_salary: bool = True) -> Optional[float]:
+        """
+        Перцентиль средней зарплаты (0-100) с линейной интерполяцией между соседними значениями
+
+        При only_with_salary=True вакансии без указанной зарплаты не учитываются.
+        Возвращает None, если подходящих вакансий нет.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Перцентиль должен быть в диапазоне от 0 до 100")
+
+        start = self._bounds(0.0, 0.0)[1] if only_with_salary else 0
+        size = len(self.__keys) - start
+        if size <= 0:
+            return None
+
+        rank = percent / 100 * (size - 1)
+        lower = int(rank)
+        upper = min(lower + 1, size - 1)
+        low_value = self.__keys[start + lower][0]
+        high_value = self.__keys[start + upper][0]
+        return low_value + (high_value - low_value) * (rank - lower)
@@ -0,0 +1,212 @@
+import json
+import struct
+import sys
+from array import array
+from itertools import compress
+from typing import IO, Any, Dict, List, Tuple
+
+from .json_saver import JSONSaver
+
+# Сигнатура и версия формата снимка
+SNAPSHOT_MAGIC = b"VSNP"
+SNAPSHOT_VERSION = 1
+
+# Заголовок файла: сигнатура, версия, флаги (зарезервированы), число записей и столбцов
+HEADER = struct.Struct("<4sHHII")
+# Заголовок столбца: тип, флаг пропущенных значений, длина имени, длина данных
+COLUMN_HEADER = struct.Struct("<BBHI")
+
+# Типы столбцов
+KIND_STRING = 1  # строки, разделенные нулевым символом
+KIND_TABLE = 2  # таблица уникальных строк и номера строк в ней
+KIND_INTEGER = 3  # 64-битные целые
+KIND_FLOAT = 4  # 64-битные числа с плавающей точкой
+KIND_JSON = 5  # прочие значения одним JSON-массивом
+
+# Столбец хранится таблицей строк, если уникальных значений не больше этой доли записей
+TABLE_RATIO = 0.25
+
+SEPARATOR = "\0"
+
+# Таблица инвертирования маски наличия (0 - ключ пропущен, 1 - присутствует)
+INVERT_MASK = bytes.maketrans(b"\0\1", b"\1\0")
+
+
+def _column_kind(values: List[Any]) -> int:
+    """
+    Приватная функция выбора типа столбца по его значениям
+    """
+    types = {type(value) for value in values}
+    if types == {str}:
+        if any(SEPARATOR in value for value in values):
+            return KIND_JSON
+        return KIND_TABLE if len(set(values)) <= len(values) * TABLE_RATIO else KIND_STRING
+    if types == {int} and all(-(2**63) <= value < 2**63 for value in values):
+        return KIND_INTEGER
+    if types == {float}:
+        return KIND_FLOAT
+    # Смешанные целые и дробные числа хранятся в JSON, чтобы целые не превратились в дробные
+    return KIND_JSON
+
+
+def _pack_numbers(typecode: str, values: List[Any]) -> bytes:
+    """
+    Приватная функция упаковки чисел в массив с порядком байт little-endian
+    """
+    numbers = array(typecode, values)
+    if sys.byteorder == "big":  # pragma: no cover - платформы big-endian
+        numbers.byteswap()
+    return numbers.tobytes()
+
+
+def _unpack_numbers(typecode: str, payload: bytes) -> List[Any]:
+    """
+    Приватная функция распаковки массива чисел
+    """
+    numbers = array(typecode)
+    numbers.frombytes(payload)
+    if sys.byteorder == "big":  # pragma: no cover - платформы big-endian
+        numbers.byteswap()
+    return numbers.tolist()
+
+
+def _encode_column(kind: int, values: List[Any]) -> bytes:
+    """
+    Приватная функция кодирования значений столбца
+    """
+    if kind == KIND_STRING:
+        return SEPARATOR.join(values).encode("utf-8")
+    if kind == KIND_TABLE:
+        table = list(dict.fromkeys(values))
+        numbers = {value: number for number, value in enumerate(table)}
+        blob = SEPARATOR.join(table).encode("utf-8")
+        return struct.pack("<I", len(blob)) + blob + _pack_numbers("I", [numbers[value] for value in values])
+    if kind == KIND_INTEGER:
+        return _pack_numbers("q", values)
+    if kind == KIND_FLOAT:
+        return _pack_numbers("d", values)
+    return json.dumps(values, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_column(kind: int, payload: bytes, count: int) -> List[Any]:
+    """
+    Приватная функция декодирования значений столбца (строки разбираются одним вызовом split)
+    """
+    if kind == KIND_STRING:
+        return payload.decode("utf-8").split(SEPARATOR) if count else []
+    if kind == KIND_TABLE:
+        (size,) = struct.unpack_from("<I", payload)
+        table = payload[4 : 4 + size].decode("utf-8").split(SEPARATOR)
+        return list(map(table.__getitem__, _unpack_numbers("I", payload[4 + size :])))
+    if kind == KIND_INTEGER:
+        return _unpack_numbers("q", payload)
+    if kind == KIND_FLOAT:
+        return _unpack_numbers("d", payload)
+    if kind == KIND_JSON:
+        return json.loads(payload.decode("utf-8"))
+    raise ValueError(f"Неизвестный тип столбца: {kind}")
+
+
+def encode_snapshot(records: List[Dict[str, Any]]) -> bytes:
+    """
+    Кодирование списка записей в снимок
+
+    Записи хранятся по столбцам (один столбец на ключ), отсутствующие ключи
+    отмечаются маской наличия
+    """
+    names: Dict[str, None] = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+
+    parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(records), len(names))]
+    for name in names:
+        present = [name in record for record in records]
+        missing = not all(present)
+        values = [record[name] for record in records if name in record]
+        kind = _column_kind(values)
+        if missing:
+            # Пропуски заполняются значением того же типа, чтобы столбец остался однородным
+            placeholder = {KIND_INTEGER: 0, KIND_FLOAT: 0.0, KIND_JSON: None}.get(kind, "")
+            values = [record.get(name, placeholder) for record in records]
+
+        encoded_name = name.encode("utf-8")
+        payload = _encode_column(kind, values)
+        parts.append(COLUMN_HEADER.pack(kind, missing, len(encoded_name), len(payload)))
+        parts.append(encoded_name)
+        if missing:
+            parts.append(bytes(present))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def decode_snapshot(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Декодирование снимка в список записей
+
+    Вызывает ValueError, если данные не являются снимком поддерживаемой версии или повреждены
+    """
+    try:
+        magic, version, _, count, column_count = HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Файл не является снимком вакансий")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+
+        offset = HEADER.size
+        names: List[str] = []
+        columns: List[List[Any]] = []
+        masks: List[Tuple[str, bytes]] = []
+        for _ in range(column_count):
+            kind, missing, name_size, payload_size = COLUMN_HEADER.unpack_from(data, offset)
+            offset += COLUMN_HEADER.size
+            name = data[offset : offset + name_size].decode("utf-8")
+            offset += name_size
+            if missing:
+                masks.append((name, data[offset : offset + count]))
+                offset += count
+            values = _decode_column(kind, data[offset : offset + payload_size], count)
+            offset += payload_size
+            if len(values) != count:
+                raise ValueError(f"Поврежден столбец {name}")
+            names.append(name)
+            columns.append(values)
+    except (struct.error, UnicodeDecodeError, IndexError) as error:
+        raise ValueError(f"Поврежденный снимок: {error}") from error
+
+    records = [dict(zip(names, row)) for row in zip(*columns)] if columns else [{} for _ in range(count)]
+    # Пропущенные ключи удаляются только у записей без них: их номера выбираются по инвертированной маске
+    for name, mask in masks:
+        for position in compress(range(count), mask.translate(INVERT_MASK)):
+            del records[position][name]
+    return records
+
+
+class SnapshotSaver(JSONSaver):
+    """
+    Класс для хранения вакансий в компактном двоичном снимке
+
+    Работает как JSONSaver (индексы, политики записи, атомарная запись, блокировки),
+    но файл хранится по столбцам: строки объединяются в один блок и разбираются одним
+    вызовом, повторяющиеся строки заменяются номерами в таблице строк, числа хранятся
+    массивами. Заголовок содержит версию формата.
+    """
+
+    _binary = True
+
+    def __init__(self, filename: str = "data/vacancies.snap", **options: Any):
+        """
+        Инициализация хранилища снимка (параметры те же, что у JSONSaver)
+        """
+        super().__init__(filename, **options)
+
+    def _dump(self, data: List[Dict[str, Any]], file: IO[bytes]) -> None:
+        """
+        Приватный метод записи данных в открытый файл
+        """
+        file.write(encode_snapshot(data))
+
+    def _load(self, file: IO[bytes]) -> List[Dict[str, Any]]:
+        """
+        Приватный метод чтения данных из открытого файла
+        """
+        return decode_snapshot(file.read())
@@ -0,0 +1,245 @@
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .currency import CurrencyRates
+from .file_handler import FileHandler
+from .salary_index import salary_amount, salary_average
+
+# Триграммный токенизатор FTS5 ищет подстроки длиной от трех символов
+FTS_MIN_WORD_LENGTH = 3
+
+# Условие записей, зарплата которых еще не приведена к рублям: курс был неизвестен
+# (значение null) или запись сохранена без поля salary_normalized (json_type возвращает NULL)
+PENDING_SALARY = "(json_type(data, '$.salary_normalized') IS NULL OR json_type(data, '$.salary_normalized') = 'null')"
+
+
+class SQLiteSaver(FileHandler):
+    """
+    Класс для хранения вакансий в базе данных SQLite
+
+    Средняя зарплата хранится в индексируемом столбце, а название и требования -
+    в полнотекстовом индексе FTS5, поэтому фильтры выполняются запросами по индексам.
+    Зарплаты в валюте с неизвестным курсом пересчитываются перед запросами по зарплате,
+    когда курс становится известен.
+    """
+
+    def __init__(self, filename: str = "data/vacancies.db"):
+        """
+        Инициализация базы данных и схемы
+        """
+        dirname = os.path.dirname(filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.__filename = filename
+        self.__connection = sqlite3.connect(filename)
+        self.__fts_enabled = False
+        self._create_schema()
+
+    @property
+    def filename(self) -> str:
+        """Путь к файлу базы данных"""
+        return self.__filename
+
+    @property
+    def fts_enabled(self) -> bool:
+        """Доступен ли полнотекстовый индекс FTS5"""
+        return self.__fts_enabled
+
+    def _create_schema(self) -> None:
+        """
+        Приватный метод создания таблиц, индексов и триггеров
+        """
+        with self.__connection:
+            self.__connection.execute("""
+                CREATE TABLE IF NOT EXISTS vacancies (
+                    id TEXT PRIMARY KEY,
+                    salary_average REAL NOT NULL,
+                    search_text TEXT NOT NULL,
+                    data TEXT NOT NULL
+                )
+                """)
+            self.__connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_vacancies_salary_average ON vacancies (salary_average)"
+            )
+            self.__connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_vacancies_salary_pending ON vacancies (id) WHERE {PENDING_SALARY}"
+            )
+
+        try:
+            with self.__connection:
+                self.__connection.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+                        search_text, content='vacancies', content_rowid='rowid', tokenize='trigram'
+                    )
+                    """)
+                self.__connection.execute("""
+                    CREATE TRIGGER IF NOT EXISTS vacancies_fts_insert AFTER INSERT ON vacancies BEGIN
+                        INSERT INTO vacancies_fts (rowid, search_text) VALUES (new.rowid, new.search_text);
+                    END
+                    """)
+                self.__connection.execute("""
+                    CREATE TRIGGER IF NOT EXISTS vacancies_fts_delete AFTER DELETE ON vacancies BEGIN
+                        INSERT INTO vacancies_fts (vacancies_fts, rowid, search_text)
+                        VALUES ('delete', old.rowid, old.search_text);
+                    END
+                    """)
+            self.__fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite собран без FTS5 или без триграммного токенизатора
+            self.__fts_enabled = False
+
+    def _refresh_pending_salaries(self) -> None:
+        """
+        Приватный метод пересчета зарплат, курс валюты которых был неизвестен при сохранении
+        """
+        normalize = CurrencyRates.shared().normalize
+        rows = []
+        for rowid, data in self.__connection.execute(f"SELECT rowid, data FROM vacancies WHERE {PENDING_SALARY}"):
+            record = json.loads(data)
+            record["salary_normalized"] = normalize(salary_amount(record), record.get("salary_currency"))
+            if record["salary_normalized"] is not None:
+                rows.append((record["salary_normalized"], json.dumps(record, ensure_ascii=False), rowid))
+
+        if rows:
+            with self.__connection:
+                self.__connection.executemany(
+                    "UPDATE vacancies SET salary_average = ?, data = ? WHERE rowid = ?", rows
+                )
+
+    @staticmethod
+    def _search_text(vacancy_data: Dict[str, Any]) -> str:
+        """
+        Приватный метод построения текста для поиска по ключевым словам
+        """
+        name = vacancy_data.get("name", "") or ""
+        requirement = vacancy_data.get("requirement", "") or ""
+        return f"{name} {requirement}".lower()
+
+    def close(self) -> None:
+        """
+        Закрытие соединения с базой данных
+        """
+        self.__connection.close()
+
+    def add_vacancy(self, vacancy_data: Dict[str, Any]) -> None:
+        """
+        Добавление вакансии в базу (без дубликатов)
+        """
+        self.add_vacancies([vacancy_data])
+
+    def add_vacancies(self, vacancies_data: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Пакетное добавление вакансий в одной транзакции
+        Возвращает количество добавленных и пропущенных вакансий
+        """
+        rows = []
+        skipped = 0
+
+        for vacancy_data in vacancies_data:
+            vacancy_id = vacancy_data.get("id")
+            if not vacancy_id:
+                skipped += 1
+                continue
+            rows.append(
+                (
+                    str(vacancy_id),
+                    salary_average(vacancy_data),
+                    self._search_text(vacancy_data),
+                    json.dumps(vacancy_data, ensure_ascii=False),
+                )
+            )
+
+        with self.__connection:
+            cursor = self.__connection.executemany(
+                "INSERT OR IGNORE INTO vacancies (id, salary_average, search_text, data) VALUES (?, ?, ?, ?)", rows
+            )
+        inserted = max(cursor.rowcount, 0)
+
+        return inserted, skipped + len(rows) - inserted
+
+    def delete_vacancy(self, vacancy_id: str) -> None:
+        """
+        Удаление вакансии из базы по ID
+        """
+        with self.__connection:
+            self.__connection.execute("DELETE FROM vacancies WHERE id = ?", (str(vacancy_id),))
+
+    def delete_vacancies(self, vacancy_ids: Iterable[str]) -> int:
+        """
+        Пакетное удаление вакансий по ID в одной транзакции
+        Возвращает количество удаленных вакансий
+        """
+        with self.__connection:
+            cursor = self.__connection.executemany(
+                "DELETE FROM vacancies WHERE id = ?", [(str(vacancy_id),) for vacancy_id in vacancy_ids]
+            )
+        return max(cursor.rowcount, 0)
+
+    def filter_vacancies(self, filter_words: List[str]) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по ключевым словам
+
+        Слова от трех символов отбираются через FTS5, точное совпадение подстрок
+        проверяется тем же запросом
+        """
+        words = [word.lower() for word in filter_words]
+        conditions = ["instr(search_text, ?) > 0" for _ in words]
+        params: List[Any] = list(words)
+
+        fts_words = [word for word in words if len(word) >= FTS_MIN_WORD_LENGTH]
+        if self.__fts_enabled and fts_words:
+            match_query = " AND ".join('"{}"'.format(word.replace('"', '""')) for word in fts_words)
+            conditions.insert(0, "rowid IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)")
+            params.insert(0, match_query)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.__connection.execute(f"SELECT data FROM vacancies {where} ORDER BY rowid", params)
+        return [json.loads(row[0]) for row in cursor]
+
+    def filter_vacancies_by_salary(
+        self, salary_range: Tuple[Optional[float], Optional[float]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Фильтрация вакансий по диапазону зарплат (по индексу средней зарплаты)
+
+        Вакансии возвращаются по возрастанию средней зарплаты (при равной - в порядке добавления);
+        None вместо границы означает открытый диапазон
+        """
+        self._refresh_pending_salaries()
+        conditions = []
+        parameters = []
+        for condition, bound in zip(("salary_average >= ?", "salary_average <= ?"), salary_range):
+            if bound is not None:
+                conditions.append(condition)
+                parameters.append(bound)
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        cursor = self.__connection.execute(
+            f"SELECT data FROM vacancies {where}ORDER BY salary_average, rowid",
+            parameters,
+        )
+        return [json.loads(row[0]) for row in cursor]
+
+    def get_top_vacancies(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Топ n вакансий по средней зарплате в рублях (по индексу средней зарплаты)
+
+        Читаются только n записей; при равной зарплате - в порядке добавления
+        """
+        if n <= 0:
+            return []
+        self._refresh_pending_salaries()
+        cursor = self.__connection.execute(
+            "SELECT data FROM vacancies ORDER BY salary_average DESC, rowid LIMIT ?", (n,)
+        )
+        return [json.loads(row[0]) for row in cursor]
+
+    def get_all_vacancies(self) -> List[Dict[str, Any]]:
+        """
+        Получение всех вакансий из базы
+        """
+        cursor = self.__connection.execute("SELECT data FROM vacancies ORDER BY rowid")
+        return [json.loads(row[0]) for row in cursor]
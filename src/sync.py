@@ -0,0 +1,139 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Set
+
+from .currency import CurrencyRates
+from .file_handler import FileHandler
+from .hh import HH, IncompleteCrawlError
+from .vacancy import Vacancy
+
+# Формат даты публикации в ответах API hh.ru
+PUBLISHED_AT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# Вакансии на hh.ru автоматически уходят в архив через 30 дней после публикации
+ARCHIVE_AFTER = timedelta(days=30)
+
+# Перекрытие окна, чтобы не потерять вакансии, опубликованные в секунду отметки
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+class SearchSync:
+    """
+    Класс инкрементальной синхронизации сохраненных поисков
+
+    Для каждого ключевого слова хранится отметка - самая поздняя дата публикации
+    среди загруженных вакансий. Повторная синхронизация запрашивает только вакансии,
+    опубликованные (или обновленные) после отметки, и обновляет их в хранилище.
+    Даты публикации вакансий хранятся, пока синхронизация с drop_archived не удалит эти вакансии.
+    """
+
+    def __init__(self, hh_api: HH, file_worker: FileHandler, state_filename: str = "data/sync_state.json"):
+        """
+        Инициализация синхронизации
+        """
+        dirname = os.path.dirname(state_filename)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+
+        self.__hh_api = hh_api
+        self.__file_worker = file_worker
+        self.__state_filename = state_filename
+        self.__state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Приватный метод загрузки состояния синхронизации
+        """
+        try:
+            with open(self.__state_filename, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _save_state(self) -> None:
+        """
+        Приватный метод сохранения состояния синхронизации
+        """
+        with open(self.__state_filename, "w", encoding="utf-8") as file:
+            json.dump(self.__state, file, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def _parse_date(value: Optional[str]) -> Optional[datetime]:
+        """
+        Приватный метод разбора даты публикации
+        """
+        if value is None:
+            return None
+        try:
+            return datetime.strptime(value, PUBLISHED_AT_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    def high_water_mark(self, keyword: str) -> Optional[datetime]:
+        """
+        Отметка синхронизации для ключевого слова (None, если синхронизации не было)
+        """
+        return self._parse_date(self.__state.get(keyword, {}).get("high_water_mark"))
+
+    def sync(self, keyword: str, drop_archived: bool = False, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Синхронизация сохраненного поиска по ключевому слову
+
+        При drop_archived удаляются вакансии, помеченные в ответе как архивные,
+        и вакансии этого поиска, опубликованные раньше срока автоматической архивации;
+        их даты публикации удаляются из состояния только этого ключевого слова.
+        Возвращает количество загруженных, добавленных, обновленных и удаленных вакансий
+        и число окон и страниц, не загруженных при выгрузке (failed). Отметка сдвигается
+        только после полной выгрузки, иначе пропущенные вакансии запрашиваются повторно.
+        """
+        now = now or datetime.now(timezone.utc)
+        keyword_state = self.__state.setdefault(keyword, {"high_water_mark": None, "published": {}})
+        mark = self.high_water_mark(keyword)
+
+        date_from = mark - SYNC_OVERLAP if mark else None
+        failed = 0
+        try:
+            raw_vacancies = self.__hh_api.crawl_vacancies(keyword, date_from=date_from, date_to=now)
+        except IncompleteCrawlError as e:
+            # Загруженная часть сохраняется, но отметка остается прежней
+            raw_vacancies = e.vacancies
+            failed = e.failures
+
+        published = keyword_state["published"]
+        archived_ids: Set[str] = set()
+        for item in raw_vacancies:
+            published_at = self._parse_date(item.get("published_at"))
+            if item.get("archived"):
+                archived_ids.add(item["id"])
+            elif published_at is not None:
+                published[item.get("id")] = item["published_at"]
+                if mark is None or published_at > mark:
+                    mark = published_at
+
+        CurrencyRates.shared().refresh(self.__hh_api)
+        vacancies = Vacancy.cast_to_object_list([item for item in raw_vacancies if item.get("id") not in archived_ids])
+        inserted, updated = self.__file_worker.upsert_vacancies(vacancy.to_dict() for vacancy in vacancies)
+
+        deleted = 0
+        if drop_archived:
+            for vacancy_id, published_at in list(published.items()):
+                moment = self._parse_date(published_at)
+                if moment is not None and now - moment > ARCHIVE_AFTER:
+                    archived_ids.add(vacancy_id)
+            for vacancy_id in archived_ids:
+                published.pop(vacancy_id, None)
+            deleted = self.__file_worker.delete_vacancies(archived_ids)
+
+        if not failed:
+            keyword_state["high_water_mark"] = mark.strftime(PUBLISHED_AT_FORMAT) if mark else None
+            keyword_state["synced_at"] = now.strftime(PUBLISHED_AT_FORMAT)
+        self._save_state()
+
+        return {
+            "fetched": len(raw_vacancies),
+            "inserted": inserted,
+            "updated": updated,
+            "deleted": deleted,
+            "failed": failed,
+        }
@@ -1,7 +1,15 @@
-from typing import List, Tuple
+import heapq
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Sized, Tuple
 
 from .vacancy import Vacancy
 
+# Количество вакансий на одной странице вывода
+PAGE_SIZE = 20
+
+# Ответы, завершающие постраничный просмотр
+PAGER_QUIT = ("q", "й")
+
 
 def filter_vacancies(vacancies: List[Vacancy], filter_words: List[str]) -> List[Vacancy]:
     """
@@ -17,12 +25,12 @@ def filter_vacancies(vacancies: List[Vacancy], filter_words: List[str]) -> List[
 
 def get_vacancies_by_salary(vacancies: List[Vacancy], salary_range: Tuple[float, float]) -> List[Vacancy]:
     """
-    Фильтрация вакансий по диапазону зарплат
+    Фильтрация вакансий по диапазону зарплат (в рублях)
     """
     min_salary, max_salary = salary_range
     filtered = []
     for vacancy in vacancies:
-        avg_salary = vacancy.get_salary_average()
+        avg_salary = vacancy.get_normalized_salary()
         if min_salary <= avg_salary <= max_salary:
             filtered.append(vacancy)
     return filtered
@@ -30,34 +38,89 @@ def get_vacancies_by_salary(vacancies: List[Vacancy], salary_range: Tuple[float,
 
 def sort_vacancies(vacancies: List[Vacancy], reverse: bool = True) -> List[Vacancy]:
     """
-    Сортировка вакансий по средней зарплате
+    Сортировка вакансий по средней зарплате в рублях
     """
-    return sorted(vacancies, key=lambda x: x.get_salary_average(), reverse=reverse)
+    return sorted(vacancies, key=Vacancy.get_normalized_salary, reverse=reverse)
 
 
-def get_top_vacancies(vacancies: List[Vacancy], n: int) -> List[Vacancy]:
+def get_top_vacancies(
+    vacancies: Iterable[Vacancy],
+    n: int,
+    reverse: bool = True,
+    key: Optional[Callable[[Vacancy], Any]] = None,
+) -> List[Vacancy]:
     """
-    Получение топ N вакансий
+    Получение топ N вакансий по средней зарплате в рублях
+
+    Принимает несортированную последовательность или поток и выбирает N вакансий
+    ограниченной кучей за O(n log N) без полной сортировки. reverse=True - самые
+    высокие зарплаты, reverse=False - самые низкие. При равенстве ключа сохраняется
+    исходный порядок; другой критерий можно задать через key, например
+    key=lambda v: (v.get_salary_average(), v.name).
     """
-    return vacancies[:n] if n > 0 else []
+    if n <= 0:
+        return []
+    if key is None:
+        key = Vacancy.get_normalized_salary
+    if reverse:
+        return heapq.nlargest(n, vacancies, key=key)
+    return heapq.nsmallest(n, vacancies, key=key)
 
 
-def print_vacancies(vacancies: List[Vacancy]) -> None:
+def format_vacancy(number: int, vacancy: Vacancy) -> str:
+    """
+    Текст одной вакансии для вывода
+    """
+    text = f"{number}. {vacancy}\n"
+    if vacancy.requirement and vacancy.requirement != "Не указаны":
+        text += f"   Требования: {vacancy.requirement[:100]}...\n"
+    return text + "\n"
+
+
+def print_vacancies(
+    vacancies: Iterable[Vacancy],
+    limit: Optional[int] = None,
+    offset: int = 0,
+    page_size: int = PAGE_SIZE,
+    interactive: bool = False,
+) -> None:
     """
     Печать вакансий в человекочитаемом виде
+
+    Вакансии выводятся страницами по page_size, каждая страница - одной записью в stdout.
+    Последовательность читается лениво, поэтому в памяти находится только текущая страница.
+    offset и limit задают пропуск и максимальное число выводимых вакансий; при interactive=True
+    перед каждой следующей страницей запрашивается подтверждение (q - выход).
     """
-    if not vacancies:
+    if page_size < 1:
+        raise ValueError("page_size должно быть положительным числом")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset и limit не могут быть отрицательными")
+
+    total = len(vacancies) if isinstance(vacancies, Sized) else None
+    stop = None if limit is None else offset + limit
+    remaining = islice(vacancies, offset, stop)
+
+    page = list(islice(remaining, page_size))
+    if not page:
         print("Вакансии не найдены.")
         return
 
-    print(f"\nНайдено вакансий: {len(vacancies)}")
-    print("-" * 80)
-
-    for i, vacancy in enumerate(vacancies, 1):
-        print(f"{i}. {vacancy}")
-        if vacancy.requirement and vacancy.requirement != "Не указаны":
-            print(f"   Требования: {vacancy.requirement[:100]}...")
-        print()
+    header = f"\nНайдено вакансий: {total}\n" if total is not None else "\n"
+    chunks = [header, "-" * 80, "\n"]
+    number = offset
+    while page:
+        for vacancy in page:
+            number += 1
+            chunks.append(format_vacancy(number, vacancy))
+        print("".join(chunks), end="", flush=True)
+        chunks = []
+
+        page = list(islice(remaining, page_size))
+        if page and interactive:
+            answer = input(f"Показано {number}. Enter - следующая страница, q - выход: ").strip().lower()
+            if answer in PAGER_QUIT:
+                break
 
 
 def parse_salary_range(salary_input: str) -> Tuple[float, float]:
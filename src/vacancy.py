@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .currency import BASE_CURRENCY, UNSPECIFIED_CURRENCY, CurrencyRates
 
 
 class Vacancy:
@@ -6,7 +8,17 @@ class Vacancy:
     Класс для работы с вакансиями
     """
 
-    __slots__ = ("id", "name", "alternate_url", "salary_from", "salary_to", "salary_currency", "requirement")
+    __slots__ = (
+        "id",
+        "name",
+        "alternate_url",
+        "_salary_from",
+        "_salary_to",
+        "_salary_average",
+        "_salary_normalized",
+        "_salary_currency",
+        "requirement",
+    )
 
     def __init__(
         self,
@@ -24,9 +36,10 @@ class Vacancy:
         self.id = self._validate_string(id, "ID")
         self.name = self._validate_string(name, "Name")
         self.alternate_url = self._validate_string(alternate_url, "URL")
-        self.salary_from = self._validate_salary(salary_from)
-        self.salary_to = self._validate_salary(salary_to)
-        self.salary_currency = salary_currency or "Не указана"
+        self._salary_from = self._validate_salary(salary_from)
+        self._salary_to = self._validate_salary(salary_to)
+        self._salary_currency = salary_currency or UNSPECIFIED_CURRENCY
+        self._update_salary_average()
         self.requirement = requirement or "Не указаны"
 
     def _validate_string(self, value: Any, field_name: str) -> str:
@@ -47,37 +60,120 @@ class Vacancy:
             return 0.0
         return float(value)
 
+    def _calculate_salary_average(self) -> float:
+        """
+        Приватный метод вычисления средней зарплаты
+        """
+        if self._salary_from > 0 and self._salary_to > 0:
+            return (self._salary_from + self._salary_to) / 2
+        return self._salary_from or self._salary_to or 0.0
+
+    def _update_salary_average(self) -> None:
+        """
+        Приватный метод пересчета средней зарплаты
+
+        Значение в рублях сбрасывается и вычисляется при первом обращении
+        """
+        self._salary_average = self._calculate_salary_average()
+        self._salary_normalized: Optional[float] = None
+
+    @property
+    def salary_from(self) -> float:
+        """
+        Нижняя граница зарплаты
+        """
+        return self._salary_from
+
+    @salary_from.setter
+    def salary_from(self, value: Optional[Union[int, float]]) -> None:
+        """
+        Изменение нижней границы зарплаты с пересчетом средней
+        """
+        self._salary_from = self._validate_salary(value)
+        self._update_salary_average()
+
+    @property
+    def salary_to(self) -> float:
+        """
+        Верхняя граница зарплаты
+        """
+        return self._salary_to
+
+    @salary_to.setter
+    def salary_to(self, value: Optional[Union[int, float]]) -> None:
+        """
+        Изменение верхней границы зарплаты с пересчетом средней
+        """
+        self._salary_to = self._validate_salary(value)
+        self._update_salary_average()
+
+    @property
+    def salary_currency(self) -> str:
+        """
+        Валюта зарплаты
+        """
+        return self._salary_currency
+
+    @salary_currency.setter
+    def salary_currency(self, value: Optional[str]) -> None:
+        """
+        Изменение валюты зарплаты с пересчетом значения в рублях
+        """
+        self._salary_currency = value or UNSPECIFIED_CURRENCY
+        self._update_salary_average()
+
     def get_salary_average(self) -> float:
         """
-        Вычисление средней зарплаты
+        Средняя зарплата (вычисляется один раз при изменении границ)
+        """
+        return self._salary_average
+
+    def _get_known_salary(self) -> Optional[float]:
+        """
+        Приватный метод получения зарплаты в рублях (None, пока курс валюты неизвестен)
+
+        Зарплата вычисляется при первом обращении; таблица курсов нужна только для иностранной валюты.
+        Пока курс неизвестен, зарплата пересчитывается по текущему курсу при каждом обращении
+        """
+        if self._salary_normalized is None:
+            if not self._salary_average or self._salary_currency in (BASE_CURRENCY, UNSPECIFIED_CURRENCY):
+                self._salary_normalized = self._salary_average
+            else:
+                self._salary_normalized = CurrencyRates.shared().normalize(self._salary_average, self._salary_currency)
+        return self._salary_normalized
+
+    def get_normalized_salary(self) -> float:
         """
-        if self.salary_from > 0 and self.salary_to > 0:
-            return (self.salary_from + self.salary_to) / 2
-        return self.salary_from or self.salary_to or 0.0
+        Средняя зарплата в рублях по курсу на момент первого обращения (используется для сравнения)
+
+        Пока курс валюты не загружен, зарплата считается нулевой
+        """
+        normalized = self._get_known_salary()
+        return 0.0 if normalized is None else normalized
 
     def __lt__(self, other: "Vacancy") -> bool:
         """Сравнение вакансий (меньше)"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary_average() < other.get_salary_average()
+        return self.get_normalized_salary() < other.get_normalized_salary()
 
     def __le__(self, other: "Vacancy") -> bool:
         """Сравнение вакансий (меньше или равно)"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary_average() <= other.get_salary_average()
+        return self.get_normalized_salary() <= other.get_normalized_salary()
 
     def __gt__(self, other: "Vacancy") -> bool:
         """Сравнение вакансий (больше)"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary_average() > other.get_salary_average()
+        return self.get_normalized_salary() > other.get_normalized_salary()
 
     def __ge__(self, other: "Vacancy") -> bool:
         """Сравнение вакансий (больше или равно)"""
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.get_salary_average() >= other.get_salary_average()
+        return self.get_normalized_salary() >= other.get_normalized_salary()
 
     def __eq__(self, other: "Vacancy") -> bool:
         """Сравнение вакансий (равенство)"""
@@ -85,6 +181,10 @@ class Vacancy:
             return NotImplemented
         return self.id == other.id
 
+    def __hash__(self) -> int:
+        """Хеш вакансии (согласован с равенством по ID)"""
+        return hash(self.id)
+
     def __str__(self) -> str:
         """Строковое представление вакансии"""
         if self.salary_from == 0.0 and self.salary_to == 0.0:
@@ -116,10 +216,11 @@ class Vacancy:
             "salary_to": self.salary_to,
             "salary_currency": self.salary_currency,
             "requirement": self.requirement,
+            "salary_normalized": self._get_known_salary(),
         }
 
     @classmethod
-    def cast_to_object_list(cls, raw_data: List[Dict[str, Any]]) -> List["Vacancy"]:
+    def cast_to_object_list(cls, raw_data: Iterable[Dict[str, Any]]) -> List["Vacancy"]:
         """
         Преобразование списка словарей в список объектов Vacancy
         """
@@ -155,3 +256,31 @@ class Vacancy:
             except (ValueError, KeyError):
                 continue
         return vacancies
+
+    @classmethod
+    def from_stored_batch(cls, records: Iterable[Dict[str, Any]]) -> List["Vacancy"]:
+        """
+        Быстрое создание списка вакансий из записей хранилища без валидации
+
+        Предназначен для доверенных записей в формате to_dict(), которые уже прошли
+        валидацию при создании. Для необработанных данных используйте cast_to_object_list.
+        """
+        new = cls.__new__
+        vacancies = []
+        for record in records:
+            vacancy = new(cls)
+            vacancy.id = record["id"]
+            vacancy.name = record["name"]
+            vacancy.alternate_url = record["alternate_url"]
+            vacancy._salary_from = salary_from = record["salary_from"]
+            vacancy._salary_to = salary_to = record["salary_to"]
+            if salary_from > 0 and salary_to > 0:
+                vacancy._salary_average = (salary_from + salary_to) / 2
+            else:
+                vacancy._salary_average = salary_from or salary_to or 0.0
+            vacancy._salary_currency = record["salary_currency"]
+            # Записи, сохраненные до приведения к рублям или до загрузки курса, пересчитываются при первом обращении
+            vacancy._salary_normalized = record.get("salary_normalized")
+            vacancy.requirement = record["requirement"]
+            vacancies.append(vacancy)
+        return vacancies
@@ -7,11 +7,29 @@ from unittest.mock import Mock
 
 import pytest
 
+from src.currency import CurrencyRates
 from src.hh import HH
 from src.json_saver import JSONSaver
+from src.rate_limiter import RateLimiter
 from src.vacancy import Vacancy
 
 
+@pytest.fixture(autouse=True)
+def shared_rate_limiter(monkeypatch):
+    """Отдельный общий ограничитель запросов без задержек для каждого теста"""
+    limiter = RateLimiter(rate=None, backoff_base=0)
+    monkeypatch.setattr(RateLimiter, "_shared_instance", limiter)
+    return limiter
+
+
+@pytest.fixture(autouse=True)
+def shared_currency_rates(monkeypatch):
+    """Отдельная общая таблица курсов без файлового кэша для каждого теста"""
+    rates = CurrencyRates(filename=None)
+    monkeypatch.setattr(CurrencyRates, "_shared_instance", rates)
+    return rates
+
+
 @pytest.fixture
 def temp_json_file():
     """Создает временный JSON файл для тестов"""
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.async_hh import AsyncHH, SearchManyError
+from src.hh import IncompleteCrawlError
+
+
+class StubHHHandler(BaseHTTPRequestHandler):
+    """Заглушка API hh.ru: по три страницы с одной вакансией для каждого запроса"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        text = query.get("text", [""])[0]
+        page = int(query.get("page", ["0"])[0])
+        self.server.requests.append((text, page, self.client_address))
+
+        if text == "down" or (text == "broken" and page == 1):
+            status, payload = 500, {}
+        else:
+            status, payload = 200, {"items": [{"id": f"{text}-{page}"}], "pages": 3, "found": 3}
+
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Локальный HTTP-сервер, имитирующий API hh.ru"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHHHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_url(stub_server):
+    """Адрес заглушки API"""
+    return f"http://127.0.0.1:{stub_server.server_address[1]}/vacancies"
+
+
+class TestAsyncHH:
+    """Тесты для класса AsyncHH"""
+
+    def test_invalid_limits(self):
+        """Тест ошибки при некорректных ограничениях"""
+        with pytest.raises(ValueError):
+            AsyncHH(Mock(), max_in_flight=0)
+
+    def test_load_vacancies(self, stub_url):
+        """Тест синхронной загрузки всех страниц по порядку"""
+        hh = AsyncHH(Mock(), url=stub_url)
+
+        result = hh.load_vacancies("python")
+        hh.close()
+
+        assert [v["id"] for v in result] == ["python-0", "python-1", "python-2"]
+
+    def test_failed_page_reported(self, stub_url):
+        """Тест ошибки неполной загрузки с сохранением остальных страниц"""
+        hh = AsyncHH(Mock(), url=stub_url)
+
+        with pytest.raises(IncompleteCrawlError) as error:
+            hh.load_vacancies("broken")
+        hh.close()
+
+        assert error.value.failures == 1
+        assert [v["id"] for v in error.value.vacancies] == ["broken-0", "broken-2"]
+
+    def test_connection_error(self, stub_url):
+        """Тест ошибки подключения при неудачной первой странице"""
+        hh = AsyncHH(Mock(), url=stub_url)
+
+        with pytest.raises(ConnectionError, match="500"):
+            hh.load_vacancies("down")
+        hh.close()
+
+    def test_connect(self, stub_url):
+        """Тест проверки доступности API"""
+        hh = AsyncHH(Mock(), url=stub_url)
+        hh._connect()
+        hh.close()
+
+    def test_search_many(self, stub_server, stub_url):
+        """Тест одновременного поиска по нескольким ключевым словам через общий пул соединений"""
+
+        async def run():
+            async with AsyncHH(Mock(), max_in_flight=2, pool_size=2, url=stub_url) as hh:
+                return await hh.search_many(["python", "java", "down", "go"])
+
+        with pytest.raises(SearchManyError, match="down") as error:
+            asyncio.run(run())
+
+        result = error.value.results
+        assert [v["id"] for v in result["java"]] == ["java-0", "java-1", "java-2"]
+        assert [v["id"] for v in result["go"]] == ["go-0", "go-1", "go-2"]
+        assert "down" not in result
+        assert isinstance(error.value.errors["down"], ConnectionError)
+        # Три страницы для трех запросов и четыре попытки для недоступного
+        assert len(stub_server.requests) == 13
+        connections = {client_address for _, _, client_address in stub_server.requests}
+        assert len(connections) <= 2
+
+    def test_search_many_partial(self, stub_url):
+        """Тест частичных результатов по ключевому слову с потерянной страницей"""
+
+        async def run():
+            async with AsyncHH(Mock(), url=stub_url) as hh:
+                return await hh.search_many(["python", "broken"])
+
+        with pytest.raises(SearchManyError) as error:
+            asyncio.run(run())
+
+        assert [v["id"] for v in error.value.results["python"]] == ["python-0", "python-1", "python-2"]
+        assert [v["id"] for v in error.value.results["broken"]] == ["broken-0", "broken-2"]
+        assert error.value.errors["broken"].failures == 1
+
+    def test_search_many_complete(self, stub_url):
+        """Тест результатов без ошибки при полной загрузке всех ключевых слов"""
+
+        async def run():
+            async with AsyncHH(Mock(), url=stub_url) as hh:
+                return await hh.search_many(["python", "go"])
+
+        result = asyncio.run(run())
+
+        assert list(result) == ["python", "go"]
@@ -0,0 +1,124 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.batch import harvest, read_keywords
+from src.hh import IncompleteCrawlError
+from src.json_saver import JSONSaver
+
+
+def make_raw_vacancies(keyword, count):
+    """Вакансии в формате API hh.ru"""
+    return [
+        {
+            "id": f"{keyword}-{i}",
+            "name": f"{keyword} developer",
+            "alternate_url": f"https://hh.ru/vacancy/{keyword}-{i}",
+            "salary": {"from": 100000 + i, "to": None, "currency": "RUR"},
+            "snippet": {"requirement": keyword},
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def fake_hh():
+    """Заглушка HH: по три вакансии на запрос, запрос "down" недоступен"""
+
+    def load(keyword):
+        if keyword == "down":
+            raise ConnectionError("Ошибка подключения к API hh.ru: 503")
+        return make_raw_vacancies(keyword, 3)
+
+    hh_api = Mock()
+    hh_api.load_vacancies.side_effect = load
+    hh_api.crawl_vacancies.side_effect = load
+    return hh_api
+
+
+class TestReadKeywords:
+    """Тесты чтения списка ключевых слов"""
+
+    def test_read_keywords(self, tmp_path):
+        """Тест пропуска пустых строк, комментариев и повторов"""
+        filename = tmp_path / "keywords.txt"
+        filename.write_text("python\n\n# комментарий\n  java  \npython\nаналитик\n", encoding="utf-8")
+
+        assert read_keywords(str(filename)) == ["python", "java", "аналитик"]
+
+
+class TestHarvest:
+    """Тесты пакетной загрузки"""
+
+    def test_harvest_in_process(self, fake_hh, tmp_path, capsys):
+        """Тест пакетной загрузки с разбором в текущем процессе"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+
+        result = harvest(fake_hh, saver, ["python", "java", "down"], keyword_workers=2, parse_workers=0)
+
+        assert result["failed"] == ["down"]
+        assert result["fetched"] == result["parsed"] == result["inserted"] == 6
+        assert result["throughput"] > 0
+        assert len(saver.get_all_vacancies()) == 6
+        output = capsys.readouterr().out
+        assert "вакансий/с" in output
+        assert "down: ошибка" in output
+
+    def test_harvest_with_process_pool(self, fake_hh, tmp_path):
+        """Тест разбора ответов в пуле процессов"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+
+        result = harvest(fake_hh, saver, ["python", "java", "go"], parse_workers=2)
+
+        assert result["inserted"] == 9
+        assert {v["id"] for v in saver.get_all_vacancies()} == {
+            f"{keyword}-{i}" for keyword in ("python", "java", "go") for i in range(3)
+        }
+
+    def test_harvest_process_pool_uses_parent_rates(self, shared_currency_rates):
+        """Тест передачи курсов валют процессам-обработчикам"""
+        shared_currency_rates.update({"USD": 0.01})
+        raw_vacancies = make_raw_vacancies("python", 1)
+        raw_vacancies[0]["salary"] = {"from": 1000, "to": None, "currency": "USD"}
+        hh_api = Mock()
+        hh_api.load_vacancies.return_value = raw_vacancies
+        file_worker = Mock()
+        file_worker.add_vacancies.return_value = (1, 0)
+
+        harvest(hh_api, file_worker, ["python"], parse_workers=1)
+
+        (records,) = file_worker.add_vacancies.call_args.args
+        assert records[0]["salary_normalized"] == 100000
+
+    def test_harvest_single_bulk_write(self, fake_hh):
+        """Тест сохранения всех вакансий одной пакетной операцией"""
+        file_worker = Mock()
+        file_worker.add_vacancies.return_value = (6, 0)
+
+        harvest(fake_hh, file_worker, ["python", "java"], parse_workers=0)
+
+        file_worker.add_vacancies.assert_called_once()
+        assert len(file_worker.add_vacancies.call_args.args[0]) == 6
+        file_worker.add_vacancy.assert_not_called()
+
+    def test_harvest_crawl(self, fake_hh):
+        """Тест пакетной загрузки в режиме полной выгрузки"""
+        file_worker = Mock()
+        file_worker.add_vacancies.return_value = (3, 0)
+
+        harvest(fake_hh, file_worker, ["python"], parse_workers=0, crawl=True)
+
+        fake_hh.crawl_vacancies.assert_called_once_with("python")
+        fake_hh.load_vacancies.assert_not_called()
+
+    def test_harvest_incomplete_crawl(self, fake_hh):
+        """Тест сохранения частично выгруженных вакансий с отметкой ключевого слова как неудачного"""
+        fake_hh.crawl_vacancies.side_effect = IncompleteCrawlError(make_raw_vacancies("python", 2), 1)
+        file_worker = Mock()
+        file_worker.add_vacancies.return_value = (2, 0)
+
+        result = harvest(fake_hh, file_worker, ["python"], parse_workers=0, crawl=True)
+
+        assert result["failed"] == ["python"]
+        assert result["fetched"] == result["parsed"] == 2
+        assert len(file_worker.add_vacancies.call_args.args[0]) == 2
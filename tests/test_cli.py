@@ -1,6 +1,18 @@
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
-from src.cli import user_interaction
+import pytest
+
+from src.cli import SEARCH_WORKERS, _to_vacancies, main, user_interaction
+from src.file_handler import FileHandler
+from src.hh import IncompleteCrawlError
+from src.mapped_store import MappedVacancyStore
+
+
+@pytest.fixture(autouse=True)
+def mock_response_cache():
+    """Подмена кэша ответов, чтобы тесты не создавали каталог data/cache"""
+    with patch("src.cli.ResponseCache") as mock_cache_class:
+        yield mock_cache_class
 
 
 class TestUserInteraction:
@@ -15,6 +27,20 @@ class TestUserInteraction:
         mock_print.assert_any_call("Добро пожаловать в программу поиска вакансий!")
         mock_print.assert_any_call("До свидания!")
 
+    @patch("src.cli.HH")
+    @patch("src.cli.JSONSaver")
+    @patch("builtins.input", side_effect=["0"])
+    @patch("builtins.print")
+    def test_user_interaction_custom_file_worker(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
+        """Тест работы с переданной реализацией FileHandler"""
+        file_worker = Mock(spec=FileHandler)
+
+        user_interaction(file_worker)
+
+        _mock_saver_class.assert_not_called()
+        _mock_hh_class.assert_called_once_with(file_worker, max_workers=SEARCH_WORKERS, cache=ANY)
+        file_worker.close.assert_called_once()
+
     @patch("builtins.input", side_effect=["", "   ", "\t", "0"])
     @patch("builtins.print")
     def test_user_interaction_invalid_empty_input(self, mock_print, mock_input):
@@ -47,6 +73,7 @@ class TestUserInteraction:
         self, mock_print, mock_input, _mock_saver_class, _mock_hh_class
     ):
         """Тест выбора опции поиска с пустым ключевым словом"""
+        _mock_saver_class.return_value.read_only = False
         with patch("builtins.input", side_effect=["1", "", "0"]):
             user_interaction()
 
@@ -62,18 +89,22 @@ class TestUserInteraction:
     ):
         """Тест успешного поиска вакансий"""
         mock_hh = Mock()
-        mock_saver = Mock()
+        mock_saver = Mock(read_only=False)
         _mock_hh_class.return_value = mock_hh
         _mock_saver_class.return_value = mock_saver
 
         raw_data = [v.to_dict() for v in sample_vacancies]
         mock_hh.load_vacancies.return_value = raw_data
         mock_vacancy.cast_to_object_list.return_value = sample_vacancies
+        mock_saver.add_vacancies.return_value = (3, 0)
 
         user_interaction()
 
         mock_hh.load_vacancies.assert_called_with("python")
         mock_print.assert_any_call("Поиск вакансий...")
+        mock_saver.add_vacancies.assert_called_once()
+        mock_saver.add_vacancy.assert_not_called()
+        mock_print.assert_any_call("Сохранено новых вакансий: 3, пропущено дубликатов: 0.")
 
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
@@ -108,8 +139,6 @@ class TestUserInteraction:
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
     @patch("src.cli.Vacancy")
-    @patch("src.cli.sort_vacancies")
-    @patch("src.cli.get_top_vacancies")
     @patch("src.cli.print_vacancies")
     @patch("builtins.input", side_effect=["2", "5", "0"])
     @patch("builtins.print")
@@ -118,8 +147,6 @@ class TestUserInteraction:
         mock_print,
         mock_input,
         mock_print_vacancies,
-        mock_get_top,
-        mock_sort,
         mock_vacancy,
         _mock_saver_class,
         _mock_hh_class,
@@ -130,14 +157,30 @@ class TestUserInteraction:
         _mock_saver_class.return_value = mock_saver
 
         raw_data = [v.to_dict() for v in sample_vacancies]
-        mock_saver.get_all_vacancies.return_value = raw_data
-        mock_vacancy.cast_to_object_list.return_value = sample_vacancies
-        mock_sort.return_value = sample_vacancies
-        mock_get_top.return_value = sample_vacancies[:2]
+        mock_saver.get_top_vacancies.return_value = raw_data[:2]
+        mock_vacancy.from_stored_batch.return_value = sample_vacancies[:2]
 
         user_interaction()
 
-        mock_print_vacancies.assert_called_once()
+        mock_saver.get_top_vacancies.assert_called_once_with(5)
+        mock_saver.get_all_vacancies.assert_not_called()
+        mock_vacancy.from_stored_batch.assert_called_once_with(raw_data[:2])
+        mock_print_vacancies.assert_called_once_with(sample_vacancies[:2])
+
+    @patch("src.cli.HH")
+    @patch("src.cli.JSONSaver")
+    @patch("builtins.input", side_effect=["2", "5", "0"])
+    @patch("builtins.print")
+    def test_user_interaction_show_top_no_data(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
+        """Тест показа топ вакансий без сохраненных данных"""
+        mock_saver = Mock()
+        _mock_saver_class.return_value = mock_saver
+        mock_saver.get_top_vacancies.return_value = []
+
+        user_interaction()
+
+        mock_saver.get_all_vacancies.assert_not_called()
+        mock_print.assert_any_call("Сохраненные вакансии не найдены.")
 
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
@@ -152,7 +195,6 @@ class TestUserInteraction:
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
     @patch("src.cli.Vacancy")
-    @patch("src.cli.filter_vacancies")
     @patch("src.cli.print_vacancies")
     @patch("builtins.input", side_effect=["3", "python", "0"])
     @patch("builtins.print")
@@ -161,7 +203,6 @@ class TestUserInteraction:
         mock_print,
         mock_input,
         mock_print_vacancies,
-        mock_filter,
         mock_vacancy,
         _mock_saver_class,
         _mock_hh_class,
@@ -172,13 +213,32 @@ class TestUserInteraction:
         _mock_saver_class.return_value = mock_saver
 
         raw_data = [v.to_dict() for v in sample_vacancies]
-        mock_saver.get_all_vacancies.return_value = raw_data
-        mock_vacancy.cast_to_object_list.return_value = sample_vacancies
-        mock_filter.return_value = sample_vacancies
+        mock_saver.filter_vacancies.return_value = raw_data[:1]
+        mock_vacancy.from_stored_batch.return_value = sample_vacancies[:1]
 
         user_interaction()
 
-        mock_print_vacancies.assert_called_once()
+        mock_saver.filter_vacancies.assert_called_once_with(["python"])
+        mock_saver.get_all_vacancies.assert_not_called()
+        mock_vacancy.from_stored_batch.assert_called_once_with(raw_data[:1])
+        mock_print_vacancies.assert_called_once_with(sample_vacancies[:1])
+
+    @patch("src.cli.HH")
+    @patch("src.cli.JSONSaver")
+    @patch("builtins.input", side_effect=["3", "python", "0"])
+    @patch("builtins.print")
+    def test_user_interaction_filter_keywords_not_found(
+        self, mock_print, mock_input, _mock_saver_class, _mock_hh_class
+    ):
+        """Тест фильтрации по ключевым словам без совпадений"""
+        mock_saver = Mock()
+        _mock_saver_class.return_value = mock_saver
+        mock_saver.filter_vacancies.return_value = []
+
+        user_interaction()
+
+        mock_saver.get_all_vacancies.assert_not_called()
+        mock_print.assert_any_call("Вакансии не найдены.")
 
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
@@ -203,6 +263,27 @@ class TestUserInteraction:
         calls = [str(call) for call in mock_print.call_args_list]
         assert any("Ошибка в формате зарплаты" in call for call in calls)
 
+    @patch("src.cli.HH")
+    @patch("src.cli.JSONSaver")
+    @patch("src.cli.print_vacancies")
+    @patch("builtins.input", side_effect=["4", "100000-200000", "0"])
+    @patch("builtins.print")
+    def test_user_interaction_filter_salary_success(
+        self, mock_print, mock_input, mock_print_vacancies, _mock_saver_class, _mock_hh_class, sample_vacancies
+    ):
+        """Тест фильтрации по зарплате через индекс хранилища"""
+        mock_saver = Mock()
+        _mock_saver_class.return_value = mock_saver
+
+        raw_data = [v.to_dict() for v in sample_vacancies]
+        mock_saver.filter_vacancies_by_salary.return_value = raw_data[:1]
+
+        user_interaction()
+
+        mock_saver.filter_vacancies_by_salary.assert_called_once_with((100000.0, 200000.0))
+        mock_saver.get_all_vacancies.assert_not_called()
+        mock_print_vacancies.assert_called_once_with(sample_vacancies[:1])
+
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
     @patch("builtins.input", side_effect=["5", "0"])
@@ -240,19 +321,44 @@ class TestUserInteraction:
 
         raw_data = [v.to_dict() for v in sample_vacancies]
         mock_saver.get_all_vacancies.return_value = raw_data
-        mock_vacancy.cast_to_object_list.return_value = sample_vacancies
+        mock_vacancy.from_stored_batch.return_value = sample_vacancies
 
         user_interaction()
 
         mock_print.assert_any_call("Всего сохранено 3 вакансий.")
         mock_print_vacancies.assert_called_once()
 
+    @patch("src.cli.HH")
+    @patch("src.cli.JSONSaver")
+    @patch("src.cli.print_vacancies")
+    @patch("builtins.input", side_effect=["1", "python", "n", "0"])
+    @patch("builtins.print")
+    def test_user_interaction_search_option_partial(
+        self, mock_print, mock_input, mock_print_vacancies, _mock_saver_class, _mock_hh_class, sample_vacancies
+    ):
+        """Тест предупреждения о неполном результате поиска и сохранения загруженной части"""
+        mock_saver = Mock(read_only=False)
+        _mock_saver_class.return_value = mock_saver
+        raw_data = [v.to_dict() for v in sample_vacancies]
+        _mock_hh_class.return_value.load_vacancies.side_effect = IncompleteCrawlError(raw_data, 2)
+        mock_saver.add_vacancies.return_value = (len(raw_data), 0)
+
+        user_interaction()
+
+        mock_print.assert_any_call(
+            "Внимание: результат неполный (Не удалось загрузить окон и страниц результатов: 2)."
+        )
+        assert [record["id"] for record in mock_saver.add_vacancies.call_args[0][0]] == [
+            v.id for v in sample_vacancies
+        ]
+
     @patch("src.cli.HH")
     @patch("src.cli.JSONSaver")
     @patch("builtins.input", side_effect=["6", "", "0"])
     @patch("builtins.print")
     def test_user_interaction_delete_vacancy_empty_id(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
         """Тест удаления вакансии с пустым ID"""
+        _mock_saver_class.return_value.read_only = False
         user_interaction()
 
         mock_print.assert_any_call("ID вакансии не может быть пустым.")
@@ -263,7 +369,7 @@ class TestUserInteraction:
     @patch("builtins.print")
     def test_user_interaction_delete_vacancy_success(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
         """Тест успешного удаления вакансии"""
-        mock_saver = Mock()
+        mock_saver = Mock(read_only=False)
         _mock_saver_class.return_value = mock_saver
 
         user_interaction()
@@ -277,7 +383,7 @@ class TestUserInteraction:
     @patch("builtins.print")
     def test_user_interaction_delete_vacancy_error(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
         """Тест обработки ошибки при удалении вакансии"""
-        mock_saver = Mock()
+        mock_saver = Mock(read_only=False)
         _mock_saver_class.return_value = mock_saver
         mock_saver.delete_vacancy.side_effect = Exception("Vacancy not found")
 
@@ -285,6 +391,20 @@ class TestUserInteraction:
 
         mock_print.assert_any_call("Ошибка при удалении: Vacancy not found")
 
+    @patch("src.cli.HH")
+    @patch("builtins.input", side_effect=["1", "6", "0"])
+    @patch("builtins.print")
+    def test_user_interaction_read_only_storage(self, mock_print, mock_input, mock_hh_class):
+        """Тест отказа в поиске и удалении для хранилища только для чтения до запроса данных"""
+        file_worker = Mock(spec=FileHandler, read_only=True, filename="data/vacancies.vmap")
+
+        user_interaction(file_worker)
+
+        assert mock_input.call_count == 3
+        mock_hh_class.return_value.load_vacancies.assert_not_called()
+        file_worker.delete_vacancy.assert_not_called()
+        mock_print.assert_any_call("Хранилище data/vacancies.vmap доступно только для чтения.")
+
 
 class TestComplexScenarios:
     """Тестирование сложных сценариев использования CLI"""
@@ -329,7 +449,7 @@ class TestComplexScenarios:
     ):
         """Тест последовательности операций"""
         mock_hh = Mock()
-        mock_saver = Mock()
+        mock_saver = Mock(read_only=False)
         _mock_hh_class.return_value = mock_hh
         _mock_saver_class.return_value = mock_saver
 
@@ -351,6 +471,7 @@ class TestComplexScenarios:
     @patch("builtins.print")
     def test_api_error_handling(self, mock_print, mock_input, _mock_saver_class, _mock_hh_class):
         """Тест обработки ошибок API"""
+        _mock_saver_class.return_value.read_only = False
         mock_hh = Mock()
         _mock_hh_class.return_value = mock_hh
         mock_hh.load_vacancies.side_effect = Exception("API Error")
@@ -374,8 +495,148 @@ class TestComplexScenarios:
         mixed_vacancies = complex_vacancy_scenarios["mixed_salary_vacancies"]
         raw_data = [v.to_dict() for v in mixed_vacancies]
         mock_saver.get_all_vacancies.return_value = raw_data
-        mock_vacancy.cast_to_object_list.return_value = mixed_vacancies
+        mock_vacancy.from_stored_batch.return_value = mixed_vacancies
 
         with patch("src.cli.print_vacancies") as mock_print_vacancies:
             user_interaction()
             mock_print_vacancies.assert_called_once()
+
+
+class TestMain:
+    """Тестирование точки входа"""
+
+    @patch("src.cli.user_interaction")
+    def test_main_interactive(self, mock_user_interaction):
+        """Тест запуска интерактивного режима с выбранным хранилищем"""
+        storage_class = Mock()
+
+        with patch.dict("src.cli.STORAGES", {"jsonl": storage_class}):
+            main(["--storage", "jsonl"])
+
+        mock_user_interaction.assert_called_once_with(storage_class.return_value)
+
+    @patch("src.cli.harvest")
+    @patch("src.cli.HH")
+    def test_main_batch(self, mock_hh_class, mock_harvest, tmp_path):
+        """Тест пакетного режима"""
+        storage_class = Mock(read_only=False)
+        file_worker = storage_class.return_value
+        keywords_file = tmp_path / "keywords.txt"
+        keywords_file.write_text("python\njava\n", encoding="utf-8")
+
+        with patch.dict("src.cli.STORAGES", {"json": storage_class}):
+            main(["--batch", str(keywords_file), "--workers", "3", "--parse-workers", "0", "--crawl"])
+
+        mock_hh_class.assert_called_once_with(
+            file_worker, max_workers=SEARCH_WORKERS, pool_size=SEARCH_WORKERS * 3, cache=ANY
+        )
+        mock_harvest.assert_called_once_with(
+            mock_hh_class.return_value, file_worker, ["python", "java"], keyword_workers=3, parse_workers=0, crawl=True
+        )
+        mock_hh_class.return_value.close.assert_called_once()
+        file_worker.close.assert_called_once()
+
+    @patch("src.cli.HH")
+    def test_main_batch_rejects_read_only_storage(self, mock_hh_class, tmp_path, capsys):
+        """Тест отказа в пакетной загрузке в хранилище только для чтения до начала работы"""
+        storage_class = Mock(read_only=True)
+        keywords_file = tmp_path / "keywords.txt"
+        keywords_file.write_text("python\n", encoding="utf-8")
+
+        with patch.dict("src.cli.STORAGES", {"mapped": storage_class}):
+            with pytest.raises(SystemExit):
+                main(["--batch", str(keywords_file), "--storage", "mapped"])
+
+        storage_class.assert_not_called()
+        mock_hh_class.assert_not_called()
+        assert "только для чтения" in capsys.readouterr().err
+
+    @patch("src.cli.SearchSync")
+    @patch("src.cli.HH")
+    def test_main_sync(self, mock_hh_class, mock_sync_class, tmp_path, capsys):
+        """Тест синхронизации сохраненных поисков по списку ключевых слов"""
+        storage_class = Mock(read_only=False)
+        file_worker = storage_class.return_value
+        keywords_file = tmp_path / "keywords.txt"
+        keywords_file.write_text("python\njava\ndown\n", encoding="utf-8")
+        counts = {"fetched": 5, "inserted": 2, "updated": 3, "deleted": 1, "failed": 0}
+        mock_sync = mock_sync_class.return_value
+        mock_sync.sync.side_effect = [
+            counts,
+            {**counts, "failed": 2},
+            ConnectionError("Ошибка подключения к API hh.ru: 503"),
+        ]
+
+        with patch.dict("src.cli.STORAGES", {"json": storage_class}):
+            main(["--sync", str(keywords_file), "--drop-archived"])
+
+        mock_hh_class.assert_called_once_with(file_worker, max_workers=SEARCH_WORKERS, pool_size=None, cache=ANY)
+        mock_sync_class.assert_called_once_with(mock_hh_class.return_value, file_worker)
+        assert [call.args for call in mock_sync.sync.call_args_list] == [("python",), ("java",), ("down",)]
+        assert all(call.kwargs == {"drop_archived": True} for call in mock_sync.sync.call_args_list)
+        output = capsys.readouterr().out
+        assert "[1/3] python: загружено 5, добавлено 2, обновлено 3, удалено 1\n" in output
+        assert "[2/3] java: загружено 5, добавлено 2, обновлено 3, удалено 1, не загружено окон и страниц: 2" in output
+        assert "[3/3] down: ошибка (Ошибка подключения к API hh.ru: 503)" in output
+        mock_hh_class.return_value.close.assert_called_once()
+        file_worker.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--drop-archived"],
+            ["--batch", "keywords.txt", "--sync", "keywords.txt"],
+            ["--sync", "keywords.txt", "--storage", "mapped"],
+        ],
+    )
+    @patch("src.cli.HH")
+    def test_main_sync_invalid_arguments(self, mock_hh_class, argv):
+        """Тест отказа при неверном сочетании параметров синхронизации"""
+        with pytest.raises(SystemExit):
+            main(argv)
+
+        mock_hh_class.assert_not_called()
+
+    def test_main_build_mapped(self, tmp_path, sample_vacancies):
+        """Тест сборки хранилища mapped из другого хранилища"""
+        source = Mock(read_only=False, filename="data/vacancies.db")
+        source.get_all_vacancies.return_value = [v.to_dict() for v in sample_vacancies]
+        filename = str(tmp_path / "vacancies.vmap")
+
+        with patch.dict("src.cli.STORAGES", {"sqlite": Mock(read_only=False, return_value=source)}):
+            with patch("src.cli.DEFAULT_MAPPED_FILE", filename), patch("builtins.print") as mock_print:
+                main(["--build-mapped", "sqlite"])
+
+        source.close.assert_called_once()
+        mock_print.assert_called_once_with(
+            f"Хранилище {filename} собрано из data/vacancies.db: {len(sample_vacancies)} вакансий."
+        )
+        store = MappedVacancyStore(filename)
+        assert [v["id"] for v in store.get_all_vacancies()] == [v.id for v in sample_vacancies]
+        store.close()
+
+    def test_main_build_mapped_rejects_read_only_source(self):
+        """Тест отказа в сборке хранилища mapped из самого себя"""
+        with pytest.raises(SystemExit):
+            main(["--build-mapped", "mapped"])
+
+
+class TestToVacancies:
+    """Тестирование преобразования сохраненных записей"""
+
+    def test_to_vacancies_trusted_records(self, sample_vacancies):
+        """Тест создания вакансий из записей в формате to_dict()"""
+        records = [v.to_dict() for v in sample_vacancies]
+
+        with patch("src.cli.Vacancy.cast_to_object_list") as mock_cast:
+            result = _to_vacancies(records)
+            mock_cast.assert_not_called()
+
+        assert [v.id for v in result] == ["1", "2", "3"]
+
+    def test_to_vacancies_fallback_for_raw_records(self, sample_vacancy_data):
+        """Тест проверяемого создания для записей в формате API"""
+        result = _to_vacancies(sample_vacancy_data)
+
+        assert [v.id for v in result] == ["12345", "67890"]
+        assert result[0].salary_from == 100000.0
@@ -0,0 +1,81 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from src.currency import CurrencyRates
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class TestCurrencyRates:
+    """Тесты для таблицы курсов валют"""
+
+    def test_normalize(self):
+        """Тест приведения сумм к рублям"""
+        rates = CurrencyRates({"USD": 0.01, "BAD": -1}, filename=None)
+
+        assert rates.normalize(1000, "USD") == 100000
+        assert rates.normalize(1000, "RUR") == 1000
+        assert rates.normalize(1000, "EUR") is None
+        assert rates.normalize(0, "EUR") == 0
+        assert rates.normalize(1000, None) == 1000
+        assert rates.normalize(1000, "Не указана") == 1000
+        assert "BAD" not in rates.rates
+
+    def test_is_fresh(self):
+        """Тест срока актуальности таблицы"""
+        rates = CurrencyRates(filename=None, ttl=timedelta(hours=1))
+        assert not rates.is_fresh(NOW)
+
+        rates.update({"USD": 0.01}, NOW)
+
+        assert rates.is_fresh(NOW + timedelta(minutes=59))
+        assert not rates.is_fresh(NOW + timedelta(hours=1))
+
+    def test_save_and_load(self, tmp_path):
+        """Тест файлового кэша курсов"""
+        filename = str(tmp_path / "rates.json")
+        CurrencyRates({"USD": 0.01}, filename=filename).save()
+
+        rates = CurrencyRates(filename=filename)
+
+        assert rates.load()
+        assert rates.rates == {"RUR": 1.0, "USD": 0.01}
+        assert not CurrencyRates(filename=str(tmp_path / "missing.json")).load()
+
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump({"rates": []}, file)
+        assert not rates.load()
+
+    def test_refresh_from_hh(self, tmp_path):
+        """Тест обновления устаревшей таблицы из справочника hh.ru"""
+        filename = str(tmp_path / "rates.json")
+        hh_api = Mock()
+        hh_api.get_currency_rates.return_value = {"USD": 0.0125}
+        rates = CurrencyRates(filename=filename)
+
+        assert rates.refresh(hh_api, NOW)
+        assert not rates.refresh(hh_api, NOW + timedelta(hours=1))
+        hh_api.get_currency_rates.assert_called_once()
+
+        cached = CurrencyRates(filename=filename)
+        assert not cached.refresh(hh_api, NOW + timedelta(hours=1))
+        assert cached.normalize(100, "USD") == 8000
+
+    def test_refresh_keeps_rates_on_error(self):
+        """Тест сохранения прежних курсов при ошибке запроса"""
+        hh_api = Mock()
+        hh_api.get_currency_rates.side_effect = ConnectionError("нет сети")
+        rates = CurrencyRates({"USD": 0.01}, filename=None)
+
+        assert not rates.refresh(hh_api, datetime.now(timezone.utc) + timedelta(days=2))
+        assert rates.normalize(1, "USD") == 100
+
+    def test_shared_loads_file_cache(self, monkeypatch, tmp_path):
+        """Тест загрузки общей таблицы из файлового кэша по умолчанию"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(CurrencyRates, "_shared_instance", None)
+        CurrencyRates({"USD": 0.01}).save()
+
+        assert CurrencyRates.shared().normalize(1, "USD") == 100
+        assert CurrencyRates.shared() is CurrencyRates.shared()
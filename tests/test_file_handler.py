@@ -5,6 +5,28 @@ import pytest
 from src.file_handler import FileHandler
 
 
+class ListFileHandler(FileHandler):
+    """Хранилище в списке для проверки реализаций FileHandler по умолчанию"""
+
+    def __init__(self, data):
+        self.data = list(data)
+
+    def add_vacancy(self, vacancy_data):
+        self.data.append(vacancy_data)
+
+    def delete_vacancy(self, vacancy_id):
+        self.data = [v for v in self.data if v.get("id") != vacancy_id]
+
+    def filter_vacancies(self, filter_words):
+        return []
+
+    def filter_vacancies_by_salary(self, salary_range):
+        return []
+
+    def get_all_vacancies(self):
+        return self.data
+
+
 class TestFileHandler:
     """Тесты для абстрактного класса FileHandler"""
 
@@ -76,3 +98,36 @@ class TestFileHandler:
 
         handler.delete_vacancy("1")
         assert len(handler.get_all_vacancies()) == 0
+
+    def test_add_vacancies_default_implementation(self):
+        """Тест пакетного добавления через реализацию по умолчанию"""
+        handler = ListFileHandler([{"id": "1", "name": "Existing"}])
+        result = handler.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "2"}, {"name": "Without ID"}])
+
+        assert result == (1, 3)
+        assert [v["id"] for v in handler.data] == ["1", "2"]
+
+    def test_upsert_and_delete_default_implementation(self):
+        """Тест обновления и пакетного удаления через реализацию по умолчанию"""
+        handler = ListFileHandler([{"id": "1", "name": "Old"}, {"id": "2", "name": "Same"}])
+        result = handler.upsert_vacancies([{"id": "1", "name": "New"}, {"id": "2", "name": "Same"}, {"id": "3"}])
+
+        assert result == (1, 1)
+        assert handler.data == [{"id": "2", "name": "Same"}, {"id": "1", "name": "New"}, {"id": "3"}]
+
+        assert handler.delete_vacancies(["1", "3", "missing"]) == 2
+        assert handler.data == [{"id": "2", "name": "Same"}]
+
+    def test_get_top_vacancies_default_implementation(self):
+        """Тест топа вакансий через реализацию по умолчанию (равные зарплаты в порядке хранения)"""
+        handler = ListFileHandler(
+            [
+                {"id": "1", "salary_from": 100, "salary_to": 0},
+                {"id": "2", "salary_from": 300, "salary_to": 0},
+                {"id": "3", "salary_from": 100, "salary_to": 0},
+                {"id": "4", "salary_normalized": 200.0},
+            ]
+        )
+
+        assert [v["id"] for v in handler.get_top_vacancies(3)] == ["2", "4", "1"]
+        assert handler.get_top_vacancies(0) == []
@@ -1,9 +1,13 @@
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
-from src.hh import HH
+from src.hh import CRAWL_RETRIES, HH, IncompleteCrawlError
 from src.json_saver import JSONSaver
+from src.response_cache import ResponseCache
 
 
 class TestHH:
@@ -18,9 +22,8 @@ class TestHH:
         assert hasattr(hh, "_HH__url")
         assert hasattr(hh, "_HH__headers")
         assert hasattr(hh, "_HH__params")
-        assert hasattr(hh, "_HH__vacancies")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_connect_success(self, mock_get):
         """Тест успешного подключения к API"""
         mock_response = Mock()
@@ -33,7 +36,7 @@ class TestHH:
         hh._connect()
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_connect_failure(self, mock_get):
         """Тест неудачного подключения к API"""
         mock_response = Mock()
@@ -46,12 +49,9 @@ class TestHH:
         with pytest.raises(ConnectionError):
             hh._connect()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_vacancies_success(self, mock_get):
         """Тест успешной загрузки вакансий"""
-        mock_connect_response = Mock()
-        mock_connect_response.status_code = 200
-
         mock_load_response = Mock()
         mock_load_response.status_code = 200
         mock_load_response.json.return_value = {
@@ -70,7 +70,7 @@ class TestHH:
         mock_empty_response.status_code = 200
         mock_empty_response.json.return_value = {"items": []}
 
-        mock_get.side_effect = [mock_connect_response, mock_load_response, mock_empty_response]
+        mock_get.side_effect = [mock_load_response, mock_empty_response]
 
         json_saver = JSONSaver("test.json")
         hh = HH(json_saver)
@@ -81,7 +81,7 @@ class TestHH:
         assert result[0]["id"] == "12345"
         assert result[0]["name"] == "Python Developer"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_vacancies_connection_error(self, mock_get):
         """Тест обработки ошибки подключения при загрузке вакансий"""
         mock_get.side_effect = Exception("Connection error")
@@ -92,17 +92,14 @@ class TestHH:
         with pytest.raises(ConnectionError):
             hh.load_vacancies("Python")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_load_vacancies_empty_result(self, mock_get):
         """Тест загрузки пустого результата"""
-        mock_connect_response = Mock()
-        mock_connect_response.status_code = 200
-
         mock_load_response = Mock()
         mock_load_response.status_code = 200
         mock_load_response.json.return_value = {"items": []}
 
-        mock_get.side_effect = [mock_connect_response, mock_load_response]
+        mock_get.side_effect = [mock_load_response]
 
         json_saver = JSONSaver("test.json")
         hh = HH(json_saver)
@@ -110,3 +107,421 @@ class TestHH:
         result = hh.load_vacancies("Python")
 
         assert len(result) == 0
+
+    @patch("requests.Session.get")
+    def test_load_vacancies_without_separate_probe(self, mock_get):
+        """Тест загрузки без отдельного запроса проверки доступности"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"items": [{"id": "1"}], "pages": 1}
+        mock_get.return_value = mock_response
+
+        hh = HH(Mock())
+        result = hh.load_vacancies("Python")
+
+        assert result == [{"id": "1"}]
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["params"]["text"] == "Python"
+        assert mock_get.call_args.kwargs["params"]["page"] == 0
+
+    def test_session_pool_and_retries(self):
+        """Тест настройки пула соединений и повтора запросов"""
+        hh = HH(Mock(), pool_size=4, retries=5)
+        adapter = hh._HH__session.get_adapter("https://api.hh.ru/vacancies")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.status == 0
+        assert not adapter.max_retries.respect_retry_after_header
+        assert hh._HH__session.headers["Accept"] == "application/json"
+        hh.close()
+
+    def test_session_pool_defaults_to_workers(self):
+        """Тест размера пула по умолчанию по числу потоков"""
+        hh = HH(Mock(), max_workers=8)
+        adapter = hh._HH__session.get_adapter("https://api.hh.ru/vacancies")
+
+        assert adapter._pool_maxsize == 8
+        hh.close()
+
+    def test_session_pool_fits_workers(self):
+        """Тест размера пула не меньше числа потоков"""
+        hh = HH(Mock(), max_workers=16, pool_size=4)
+        adapter = hh._HH__session.get_adapter("https://api.hh.ru/vacancies")
+
+        assert adapter._pool_maxsize == 16
+        hh.close()
+
+    @patch("requests.Session.get")
+    def test_get_currency_rates(self, mock_get):
+        """Тест загрузки курсов валют из справочника hh.ru"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "currency": [
+                {"code": "RUR", "rate": 1.0},
+                {"code": "USD", "rate": 0.0125},
+                {"code": "XXX", "rate": None},
+            ]
+        }
+        mock_get.return_value = mock_response
+
+        hh = HH(JSONSaver("test.json"))
+
+        assert hh.get_currency_rates() == {"RUR": 1.0, "USD": 0.0125}
+        assert mock_get.call_args.args[0] == "https://api.hh.ru/dictionaries"
+
+    @patch("requests.Session.get")
+    def test_get_currency_rates_failure(self, mock_get):
+        """Тест ошибки при недоступном справочнике"""
+        mock_get.return_value = Mock(status_code=503)
+
+        hh = HH(JSONSaver("test.json"))
+
+        with pytest.raises(ConnectionError):
+            hh.get_currency_rates()
+
+
+def make_page_response(page, pages, status_code=200):
+    """Ответ API с одной вакансией на странице"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = {"items": [{"id": str(page)}], "pages": pages, "found": pages}
+    return response
+
+
+class TestHHConcurrent:
+    """Тесты параллельной загрузки страниц"""
+
+    def test_invalid_max_workers(self):
+        """Тест ошибки при некорректном числе потоков"""
+        with pytest.raises(ValueError):
+            HH(Mock(), max_workers=0)
+
+    @patch("requests.Session.get")
+    def test_load_vacancies_keeps_page_order(self, mock_get):
+        """Тест сохранения порядка страниц при параллельной загрузке"""
+
+        def fake_get(url, params=None):
+            # Поздние страницы отвечают быстрее ранних
+            time.sleep((5 - params["page"]) * 0.005)
+            return make_page_response(params["page"], 5)
+
+        mock_get.side_effect = fake_get
+        hh = HH(Mock(), max_workers=4)
+
+        result = hh.load_vacancies("Python")
+
+        assert [v["id"] for v in result] == ["0", "1", "2", "3", "4"]
+        assert mock_get.call_count == 5
+        assert all(call.kwargs["params"]["text"] == "Python" for call in mock_get.call_args_list)
+
+    @patch("requests.Session.get")
+    def test_load_vacancies_page_limit(self, mock_get):
+        """Тест ограничения числа страниц"""
+        mock_get.side_effect = lambda url, params=None: make_page_response(params["page"], 50)
+        hh = HH(Mock(), max_workers=8)
+
+        result = hh.load_vacancies("Python")
+
+        assert len(result) == 20
+        assert mock_get.call_count == 20
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @patch("requests.Session.get")
+    def test_load_vacancies_failed_page_reported(self, mock_get, max_workers):
+        """Тест сохранения загруженных страниц и ошибки о неполной загрузке при сбое части страниц"""
+
+        def fake_get(url, params=None):
+            if params["page"] == 1:
+                raise requests.ConnectionError("reset")
+            if params["page"] == 2:
+                return make_page_response(2, 4, status_code=503)
+            return make_page_response(params["page"], 4)
+
+        mock_get.side_effect = fake_get
+        hh = HH(Mock(), max_workers=max_workers)
+
+        with pytest.raises(IncompleteCrawlError) as error:
+            hh.load_vacancies("Python")
+
+        assert [v["id"] for v in error.value.vacancies] == ["0", "3"]
+        assert error.value.failures == 2
+
+    @patch("requests.Session.get")
+    def test_load_vacancies_first_page_failure(self, mock_get):
+        """Тест ошибки подключения при неудачной первой странице"""
+        mock_get.return_value = make_page_response(0, 1, status_code=503)
+        hh = HH(Mock(), max_workers=4)
+
+        with pytest.raises(ConnectionError, match="503"):
+            hh.load_vacancies("Python")
+
+
+def make_cached_response(status_code=200, payload=None, headers=None):
+    """Ответ API с заголовками кэширования"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    return response
+
+
+class TestHHCache:
+    """Тесты кэширования ответов API"""
+
+    @patch("requests.Session.get")
+    def test_repeated_search_served_from_cache(self, mock_get, tmp_path):
+        """Тест повторного поиска из кэша без запросов к API"""
+        mock_get.return_value = make_cached_response(payload={"items": [{"id": "1"}], "pages": 1})
+        cache = ResponseCache(str(tmp_path))
+        hh = HH(Mock(), cache=cache)
+
+        first = hh.load_vacancies("Python")
+        second = hh.load_vacancies("Python")
+
+        assert first == second == [{"id": "1"}]
+        mock_get.assert_called_once()
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 1
+        assert hh.cache is cache
+
+    @patch("requests.Session.get")
+    def test_stale_entry_revalidated(self, mock_get, tmp_path):
+        """Тест условного запроса для устаревшей записи"""
+        cache = ResponseCache(str(tmp_path), ttl=0)
+        hh = HH(Mock(), cache=cache)
+        mock_get.return_value = make_cached_response(
+            payload={"items": [{"id": "1"}], "pages": 1},
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"},
+        )
+        hh.load_vacancies("Python")
+
+        mock_get.return_value = make_cached_response(status_code=304)
+        result = hh.load_vacancies("Python")
+
+        assert result == [{"id": "1"}]
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+        assert cache.stats["revalidated"] == 1
+
+    @patch("requests.Session.get")
+    def test_error_response_not_cached(self, mock_get, tmp_path):
+        """Тест отсутствия кэширования ответов с ошибкой"""
+        cache = ResponseCache(str(tmp_path))
+        hh = HH(Mock(), cache=cache)
+        mock_get.return_value = make_cached_response(status_code=500)
+
+        with pytest.raises(ConnectionError):
+            hh.load_vacancies("Python")
+
+        assert cache.size == 0
+
+
+class TestHHStreaming:
+    """Тесты потоковой загрузки вакансий"""
+
+    @patch("requests.Session.get")
+    def test_iter_vacancies_is_lazy(self, mock_get):
+        """Тест выдачи первой вакансии после загрузки только первой страницы"""
+        mock_get.side_effect = lambda url, params=None: make_page_response(params["page"], 3)
+        hh = HH(Mock())
+
+        vacancies = hh.iter_vacancies("Python")
+        assert mock_get.call_count == 0
+
+        assert next(vacancies) == {"id": "0"}
+        assert mock_get.call_count == 1
+        assert [v["id"] for v in vacancies] == ["1", "2"]
+        assert mock_get.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_iter_pages_concurrent_order(self, mock_get):
+        """Тест порядка страниц при параллельной потоковой загрузке"""
+
+        def fake_get(url, params=None):
+            time.sleep((4 - params["page"]) * 0.005)
+            return make_page_response(params["page"], 4)
+
+        mock_get.side_effect = fake_get
+        hh = HH(Mock(), max_workers=3)
+
+        pages = list(hh.iter_pages("Python"))
+
+        assert pages == [[{"id": "0"}], [{"id": "1"}], [{"id": "2"}], [{"id": "3"}]]
+
+    @patch("requests.Session.get")
+    def test_iter_pages_failed_page(self, mock_get):
+        """Тест выдачи всех загруженных страниц до ошибки о пропущенной странице"""
+
+        def fake_get(url, params=None):
+            if params["page"] == 1:
+                return make_page_response(1, 3, status_code=503)
+            return make_page_response(params["page"], 3)
+
+        mock_get.side_effect = fake_get
+        pages = HH(Mock()).iter_pages("Python")
+
+        assert next(pages) == [{"id": "0"}]
+        assert next(pages) == [{"id": "2"}]
+        with pytest.raises(IncompleteCrawlError, match="1"):
+            next(pages)
+
+    @patch("requests.Session.get")
+    def test_iter_pages_connection_error(self, mock_get):
+        """Тест ошибки подключения при запросе первой страницы"""
+        mock_get.return_value = make_page_response(0, 1, status_code=500)
+        hh = HH(Mock())
+
+        with pytest.raises(ConnectionError):
+            next(hh.iter_pages("Python"))
+
+
+class TestHHCrawl:
+    """Тесты загрузки с разбиением запроса по окнам даты публикации"""
+
+    @staticmethod
+    def make_fake_api(published):
+        """Имитация API с фильтрацией по дате публикации и ограничением в 2000 результатов"""
+        date_format = "%Y-%m-%dT%H:%M:%S%z"
+
+        def fake_get(url, params=None):
+            date_from = datetime.strptime(params["date_from"], date_format)
+            date_to = datetime.strptime(params["date_to"], date_format)
+            found = [str(i) for i, moment in enumerate(published) if date_from <= moment <= date_to]
+            per_page = params["per_page"]
+            visible = found[: 20 * per_page]
+            start = params["page"] * per_page
+
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {
+                "items": [{"id": vacancy_id} for vacancy_id in visible[start : start + per_page]],
+                "found": len(found),
+                "pages": -(-len(visible) // per_page),
+            }
+            return response
+
+        return fake_get
+
+    @patch("requests.Session.get")
+    def test_crawl_bypasses_result_cap(self, mock_get):
+        """Тест получения всех результатов сверх ограничения API"""
+        date_to = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        date_from = date_to - timedelta(days=10)
+        published = [date_from + timedelta(minutes=6 * i) for i in range(2400)]
+        mock_get.side_effect = self.make_fake_api(published)
+        hh = HH(Mock(), max_workers=4)
+
+        result = hh.crawl_vacancies("Python", date_from=date_from, date_to=date_to)
+
+        ids = [v["id"] for v in result]
+        assert len(ids) == len(set(ids)) == 2400
+        assert {call.kwargs["params"]["text"] for call in mock_get.call_args_list} == {"Python"}
+
+    @patch("requests.Session.get")
+    def test_crawl_without_split(self, mock_get):
+        """Тест загрузки без разбиения, если результатов меньше ограничения"""
+        date_to = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        published = [date_to - timedelta(hours=i) for i in range(150)]
+        mock_get.side_effect = self.make_fake_api(published)
+        hh = HH(Mock())
+
+        result = hh.crawl_vacancies("Python", date_to=date_to)
+
+        assert len(result) == 150
+        assert mock_get.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_crawl_retries_failed_pages(self, mock_get):
+        """Тест повторной загрузки страницы, не полученной с первой попытки"""
+        date_to = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        published = [date_to - timedelta(hours=i) for i in range(150)]
+        fake_get = self.make_fake_api(published)
+        failed_once = []
+
+        def flaky_get(url, params=None):
+            if params["page"] == 1 and not failed_once:
+                failed_once.append(params["page"])
+                raise requests.ConnectionError("timeout")
+            return fake_get(url, params)
+
+        mock_get.side_effect = flaky_get
+        hh = HH(Mock())
+
+        result = hh.crawl_vacancies("Python", date_to=date_to)
+
+        assert len(result) == 150
+        assert mock_get.call_count == 3
+
+    @patch("requests.Session.get")
+    def test_crawl_incomplete(self, mock_get):
+        """Тест ошибки с загруженной частью вакансий, если страница не получена после повторов"""
+        date_to = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        published = [date_to - timedelta(hours=i) for i in range(150)]
+        fake_get = self.make_fake_api(published)
+
+        def broken_get(url, params=None):
+            if params["page"] == 1:
+                raise requests.ConnectionError("timeout")
+            return fake_get(url, params)
+
+        mock_get.side_effect = broken_get
+        hh = HH(Mock())
+
+        with pytest.raises(IncompleteCrawlError) as error:
+            hh.crawl_vacancies("Python", date_to=date_to)
+
+        assert error.value.failures == 1
+        assert len(error.value.vacancies) == 100
+        assert mock_get.call_count == 2 + CRAWL_RETRIES
+
+    @patch("requests.Session.get")
+    def test_crawl_min_window_over_cap(self, mock_get):
+        """Тест ошибки, если окно минимальной длины все еще превышает ограничение API"""
+        date_to = datetime(2025, 10, 1, tzinfo=timezone.utc)
+        date_from = date_to - timedelta(hours=1)
+        published = [date_to - timedelta(minutes=17, seconds=13)] * 2100 + [date_from + timedelta(minutes=5)]
+        mock_get.side_effect = self.make_fake_api(published)
+        hh = HH(Mock(), max_workers=4)
+
+        with pytest.raises(IncompleteCrawlError) as error:
+            hh.crawl_vacancies("Python", date_from=date_from, date_to=date_to)
+
+        assert error.value.failures == 1
+        assert len(error.value.vacancies) == 2001
+
+    @patch("requests.Session.get")
+    def test_crawl_connection_error(self, mock_get):
+        """Тест ошибки подключения при неудачном первом запросе"""
+        mock_get.return_value = make_page_response(0, 1, status_code=500)
+        hh = HH(Mock())
+
+        with pytest.raises(ConnectionError):
+            hh.crawl_vacancies("Python")
+
+
+class TestHHRateLimiting:
+    """Тесты повтора запросов при ограничении частоты"""
+
+    @patch("requests.Session.get")
+    def test_throttled_page_not_lost(self, mock_get, shared_rate_limiter):
+        """Тест повторной загрузки страницы после ответа 429"""
+        throttled = {2}
+
+        def fake_get(url, params=None):
+            if params["page"] in throttled:
+                throttled.discard(params["page"])
+                return make_page_response(params["page"], 4, status_code=429)
+            return make_page_response(params["page"], 4)
+
+        mock_get.side_effect = fake_get
+        hh = HH(Mock(), max_workers=2)
+
+        result = hh.load_vacancies("Python")
+
+        assert [v["id"] for v in result] == ["0", "1", "2", "3"]
+        assert hh.rate_limiter is shared_rate_limiter
+        assert shared_rate_limiter.stats["throttles"] == 1
+        assert shared_rate_limiter.stats["retries"] == 1
@@ -1,9 +1,21 @@
 import json
+import multiprocessing
+import os
+import time
 from unittest.mock import mock_open, patch
 
+import pytest
+
 from src.json_saver import JSONSaver
 
 
+def add_vacancies_in_process(filename, concurrency, write_policy, first_id, count):
+    """Добавление вакансий по одной из отдельного процесса"""
+    with JSONSaver(filename, write_policy=write_policy, flush_every=5, concurrency=concurrency) as saver:
+        for vacancy_id in range(first_id, first_id + count):
+            saver.add_vacancy({"id": str(vacancy_id), "name": f"Vacancy {vacancy_id}"})
+
+
 class TestJSONSaver:
     """Тесты для класса JSONSaver"""
 
@@ -63,20 +75,23 @@ class TestJSONSaver:
                 assert result == []
 
     def test_save_data(self):
-        """Тест сохранения данных в файл"""
+        """Тест атомарного сохранения данных в файл"""
         test_data = [{"id": "123", "name": "Test Vacancy"}]
+        temp_filename = f"test.json.{os.getpid()}.tmp"
 
         with patch("os.path.exists", return_value=True):
             saver = JSONSaver("test.json")
 
             with patch("builtins.open", mock_open()) as mock_file:
                 with patch("json.dump") as mock_json_dump:
-                    saver._save_data(test_data)
+                    with patch("os.replace") as mock_replace:
+                        saver._save_data(test_data)
 
-                    mock_file.assert_called_once_with("test.json", "w", encoding="utf-8")
-                    mock_json_dump.assert_called_once_with(
-                        test_data, mock_file.return_value, ensure_ascii=False, indent=2
-                    )
+                        mock_file.assert_called_once_with(temp_filename, "w", encoding="utf-8")
+                        mock_json_dump.assert_called_once_with(
+                            test_data, mock_file.return_value, ensure_ascii=False, indent=2
+                        )
+                        mock_replace.assert_called_once_with(temp_filename, "test.json")
 
     def test_add_vacancy_new(self):
         """Тест добавления новой вакансии"""
@@ -106,6 +121,48 @@ class TestJSONSaver:
 
                     mock_save.assert_not_called()
 
+    def test_add_vacancies_batch(self):
+        """Тест пакетного добавления вакансий одной записью"""
+        existing_data = [{"id": "1", "name": "Existing Vacancy"}]
+        batch = [
+            {"id": "1", "name": "Duplicate Vacancy"},
+            {"id": "2", "name": "New Vacancy"},
+            {"id": "2", "name": "Duplicate In Batch"},
+            {"name": "Without ID"},
+            {"id": "3", "name": "Another New Vacancy"},
+        ]
+
+        with patch("os.path.exists", return_value=True):
+            saver = JSONSaver("test.json")
+
+            with patch.object(saver, "_load_data", return_value=existing_data) as mock_load:
+                with patch.object(saver, "_save_data") as mock_save:
+                    result = saver.add_vacancies(iter(batch))
+
+                    assert result == (2, 3)
+                    mock_load.assert_called_once()
+                    mock_save.assert_called_once_with(
+                        [
+                            {"id": "1", "name": "Existing Vacancy"},
+                            {"id": "2", "name": "New Vacancy"},
+                            {"id": "3", "name": "Another New Vacancy"},
+                        ]
+                    )
+
+    def test_add_vacancies_only_duplicates(self):
+        """Тест пакетного добавления без новых вакансий"""
+        existing_data = [{"id": "1", "name": "Existing Vacancy"}]
+
+        with patch("os.path.exists", return_value=True):
+            saver = JSONSaver("test.json")
+
+            with patch.object(saver, "_load_data", return_value=existing_data):
+                with patch.object(saver, "_save_data") as mock_save:
+                    result = saver.add_vacancies([{"id": "1", "name": "Duplicate"}])
+
+                    assert result == (0, 1)
+                    mock_save.assert_not_called()
+
     def test_delete_vacancy(self):
         """Тест удаления вакансии"""
         existing_data = [{"id": "123", "name": "To Delete"}, {"id": "456", "name": "To Keep"}]
@@ -167,3 +224,370 @@ class TestJSONSaver:
 
                 assert result == test_data
                 mock_load.assert_called_once()
+
+    def test_index_cached_between_reads(self, temp_json_file):
+        """Тест повторного чтения без повторного разбора файла"""
+        saver = JSONSaver(temp_json_file)
+        saver.add_vacancy({"id": "1", "name": "Python Developer"})
+
+        with patch.object(saver, "_load_data", wraps=saver._load_data) as mock_load:
+            saver.get_all_vacancies()
+            saver.filter_vacancies(["python"])
+            saver.filter_vacancies_by_salary((0, 100))
+
+            mock_load.assert_not_called()
+
+    def test_index_invalidated_on_external_change(self, temp_json_file):
+        """Тест перечитывания файла после его изменения извне"""
+        saver = JSONSaver(temp_json_file)
+        assert saver.get_all_vacancies() == []
+
+        with open(temp_json_file, "w", encoding="utf-8") as file:
+            json.dump([{"id": "1", "name": "External"}], file)
+        stat = os.stat(temp_json_file)
+        os.utime(temp_json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert saver.get_all_vacancies() == [{"id": "1", "name": "External"}]
+
+    def test_deferred_write_policy(self, temp_json_file):
+        """Тест отложенной записи до вызова flush()"""
+        saver = JSONSaver(temp_json_file, write_policy="deferred")
+        saver.add_vacancy({"id": "1", "name": "First"})
+        saver.add_vacancy({"id": "2", "name": "Second"})
+        saver.delete_vacancy("1")
+
+        with open(temp_json_file, encoding="utf-8") as file:
+            assert json.load(file) == []
+        assert saver.get_all_vacancies() == [{"id": "2", "name": "Second"}]
+
+        saver.flush()
+
+        with open(temp_json_file, encoding="utf-8") as file:
+            assert json.load(file) == [{"id": "2", "name": "Second"}]
+
+    def test_every_n_write_policy(self, temp_json_file):
+        """Тест записи после каждых N изменений"""
+        saver = JSONSaver(temp_json_file, write_policy="every_n", flush_every=2)
+
+        with patch.object(saver, "_save_data", wraps=saver._save_data) as mock_save:
+            saver.add_vacancy({"id": "1"})
+            mock_save.assert_not_called()
+            saver.add_vacancy({"id": "2"})
+            mock_save.assert_called_once()
+
+    def test_context_manager_flushes_on_exit(self, temp_json_file):
+        """Тест записи изменений при выходе из контекстного менеджера"""
+        with JSONSaver(temp_json_file, write_policy="deferred") as saver:
+            saver.add_vacancy({"id": "1"})
+
+        with open(temp_json_file, encoding="utf-8") as file:
+            assert json.load(file) == [{"id": "1"}]
+
+    def test_delete_missing_vacancy_does_not_write(self, temp_json_file):
+        """Тест удаления несуществующей вакансии без перезаписи файла"""
+        saver = JSONSaver(temp_json_file)
+
+        with patch.object(saver, "_save_data") as mock_save:
+            saver.delete_vacancy("missing")
+            mock_save.assert_not_called()
+
+    def test_invalid_write_policy(self):
+        """Тест ошибки при неизвестной политике записи"""
+        with pytest.raises(ValueError):
+            JSONSaver("test.json", write_policy="sometimes")
+
+    def test_upsert_vacancies(self, temp_json_file):
+        """Тест добавления новых и замены изменившихся вакансий одной записью"""
+        saver = JSONSaver(temp_json_file)
+        saver.add_vacancies([{"id": "1", "name": "Old"}, {"id": "2", "name": "Same"}])
+
+        with patch.object(saver, "_save_data", wraps=saver._save_data) as mock_save:
+            result = saver.upsert_vacancies([{"id": "1", "name": "New"}, {"id": "2", "name": "Same"}, {"id": "3"}])
+            mock_save.assert_called_once()
+
+        assert result == (1, 1)
+        assert saver.get_all_vacancies() == [{"id": "1", "name": "New"}, {"id": "2", "name": "Same"}, {"id": "3"}]
+
+    def test_delete_vacancies(self, temp_json_file):
+        """Тест пакетного удаления вакансий одной записью"""
+        saver = JSONSaver(temp_json_file)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+
+        with patch.object(saver, "_save_data", wraps=saver._save_data) as mock_save:
+            assert saver.delete_vacancies(["1", "3", "missing"]) == 2
+            mock_save.assert_called_once()
+
+        assert saver.get_all_vacancies() == [{"id": "2"}]
+
+    def test_filter_vacancies_uses_keyword_index(self, tmp_path):
+        """Тест поиска по индексу ключевых слов с сохранением семантики подстрок"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+        saver.add_vacancies(
+            [
+                {"id": "1", "name": "Python Developer", "requirement": "Django"},
+                {"id": "2", "name": "Java Developer", "requirement": "Spring"},
+                {"id": "3", "name": "JavaScript Developer", "requirement": "React"},
+                {"id": "4", "name": "Senior C++ Developer", "requirement": None},
+            ]
+        )
+
+        assert [v["id"] for v in saver.filter_vacancies(["java"])] == ["2", "3"]
+        assert [v["id"] for v in saver.filter_vacancies(["SCRIPT", "dev"])] == ["3"]
+        assert [v["id"] for v in saver.filter_vacancies(["c++"])] == ["4"]
+        assert [v["id"] for v in saver.filter_vacancies([])] == ["1", "2", "3", "4"]
+
+    def test_keyword_index_updated_incrementally(self, tmp_path):
+        """Тест обновления индекса ключевых слов при изменениях"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+        saver.add_vacancies([{"id": "1", "name": "Python Developer"}, {"id": "2", "name": "Go Developer"}])
+        assert [v["id"] for v in saver.filter_vacancies(["python"])] == ["1"]
+
+        saver.add_vacancy({"id": "3", "name": "Python Senior"})
+        saver.upsert_vacancies([{"id": "2", "name": "Python Go Developer"}])
+        saver.delete_vacancy("1")
+
+        assert [v["id"] for v in saver.filter_vacancies(["python"])] == ["2", "3"]
+
+    def test_keyword_index_saved_next_to_data_file(self, tmp_path):
+        """Тест сохранения индекса ключевых слов и его загрузки без перестроения"""
+        filename = str(tmp_path / "vacancies.json")
+        with JSONSaver(filename) as saver:
+            saver.add_vacancies([{"id": "1", "name": "Python Developer"}, {"id": "2", "name": "Go Developer"}])
+            saver.filter_vacancies(["python"])
+
+        assert os.path.exists(tmp_path / "vacancies.json.keywords.json")
+
+        saver = JSONSaver(filename)
+        with patch("src.json_saver.KeywordIndex.add") as mock_add:
+            assert [v["id"] for v in saver.filter_vacancies(["develop"])] == ["1", "2"]
+            mock_add.assert_not_called()
+
+    def test_keyword_index_saved_on_close_for_immediate_writes(self, tmp_path):
+        """Тест сохранения индекса ключевых слов при записи после каждого изменения только в close()"""
+        filename = str(tmp_path / "vacancies.json")
+        saver = JSONSaver(filename)
+        saver.filter_vacancies(["python"])
+
+        with patch("src.json_saver.KeywordIndex.save") as mock_save:
+            saver.add_vacancy({"id": "1", "name": "Python Developer"})
+            saver.add_vacancy({"id": "2", "name": "Go Developer"})
+            mock_save.assert_not_called()
+
+        saver.close()
+
+        assert os.path.exists(tmp_path / "vacancies.json.keywords.json")
+
+    def test_search_vacancies(self, tmp_path):
+        """Тест поиска по целым словам и началу слов через индекс ключевых слов"""
+        filename = str(tmp_path / "vacancies.json")
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(
+                [
+                    {"id": "1", "name": "Python Developer", "requirement": "Django"},
+                    {"id": "2", "name": "Java Developer", "requirement": "Spring"},
+                    {"id": "3", "name": "JavaScript Developer", "requirement": "React"},
+                    {"name": "Python без ID"},
+                ],
+                file,
+            )
+        saver = JSONSaver(filename)
+
+        assert [v["id"] for v in saver.search_vacancies(["java"])] == ["2"]
+        assert [v["id"] for v in saver.search_vacancies(["java"], prefix=True)] == ["2", "3"]
+        assert [v["id"] for v in saver.search_vacancies(["django", "spring"], mode="any")] == ["1", "2"]
+        assert [v["id"] for v in saver.search_vacancies(["developer", "react"])] == ["3"]
+        assert [v.get("id") for v in saver.search_vacancies(["python"])] == ["1", None]
+        assert saver.search_vacancies([]) == []
+        with pytest.raises(ValueError):
+            saver.search_vacancies(["python"], mode="some")
+
+    def test_keyword_index_rebuilt_after_external_change(self, tmp_path):
+        """Тест перестроения сохраненного индекса после изменения файла извне"""
+        filename = str(tmp_path / "vacancies.json")
+        with JSONSaver(filename) as saver:
+            saver.add_vacancies([{"id": "1", "name": "Python Developer"}])
+            saver.filter_vacancies(["python"])
+
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump([{"id": "2", "name": "Python Senior"}, {"name": "Python без ID"}], file)
+
+        result = JSONSaver(filename).filter_vacancies(["python"])
+
+        assert result == [{"id": "2", "name": "Python Senior"}, {"name": "Python без ID"}]
+
+    def test_filter_vacancies_by_salary_uses_salary_index(self, tmp_path):
+        """Тест запросов по зарплате через отсортированный индекс"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+        saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 100000, "salary_to": 150000},
+                {"id": "2", "salary_from": 200000, "salary_to": 250000},
+                {"id": "3", "salary_from": 80000, "salary_to": 0},
+            ]
+        )
+
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((0, 300000))] == ["3", "1", "2"]
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["1", "2"]
+        assert saver.salary_percentile(50) == 125000
+
+        saver.add_vacancy({"id": "4", "salary_from": 130000, "salary_to": None})
+        saver.upsert_vacancies([{"id": "1", "salary_from": 300000, "salary_to": None}])
+        saver.delete_vacancy("2")
+
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["4", "1"]
+
+    def test_salary_index_recalculates_unknown_rates(self, tmp_path, shared_currency_rates):
+        """Тест пересчета в индексе зарплаты, курс валюты которой загружен после построения индекса"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+        saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 2000, "salary_currency": "USD", "salary_normalized": None},
+                {"id": "2", "salary_from": 150000, "salary_currency": "RUR", "salary_normalized": 150000},
+            ]
+        )
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["2"]
+
+        shared_currency_rates.update({"USD": 0.01})
+
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["2", "1"]
+        assert saver.salary_percentile(100) == 200000
+
+        saver.delete_vacancy("1")
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["2"]
+
+    def test_filter_vacancies_by_salary_order_after_upsert(self, tmp_path):
+        """Тест порядка хранения среди равных зарплат после обновления вакансии"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"))
+        saver.add_vacancies([{"id": str(number), "salary_from": 100} for number in range(3)])
+        saver.filter_vacancies_by_salary((None, None))
+
+        saver.upsert_vacancies([{"id": "0", "name": "Updated", "salary_from": 100}])
+
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["0", "1", "2"]
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((None, None))] == ["0", "1", "2"]
+
+    def test_save_data_failure_keeps_previous_file(self, tmp_path):
+        """Тест сохранения прежнего содержимого при сбое во время записи"""
+        filename = str(tmp_path / "vacancies.json")
+        saver = JSONSaver(filename)
+        saver.add_vacancy({"id": "1", "name": "Python Developer"})
+
+        with patch("json.dump", side_effect=OSError("диск заполнен")):
+            with pytest.raises(OSError):
+                saver._save_data([{"id": "2"}])
+
+        with open(filename, "r", encoding="utf-8") as file:
+            assert json.load(file) == [{"id": "1", "name": "Python Developer"}]
+        assert os.listdir(tmp_path) == ["vacancies.json"]
+
+    def test_sync_policy_always(self, tmp_path):
+        """Тест fsync при каждой записи"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"), sync_policy="always")
+
+        with patch("os.fsync") as mock_fsync:
+            saver.add_vacancy({"id": "1"})
+            saver.add_vacancy({"id": "2"})
+
+        # Файл и каталог при каждой записи
+        assert mock_fsync.call_count == 4
+
+    def test_sync_policy_group(self, tmp_path):
+        """Тест группировки fsync нескольких записей в одном интервале"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"), sync_policy="group", sync_interval=60)
+
+        with patch("os.fsync") as mock_fsync:
+            for vacancy_id in ("1", "2", "3"):
+                saver.add_vacancy({"id": vacancy_id})
+            assert mock_fsync.call_count == 2
+
+            saver.close()
+            assert mock_fsync.call_count == 4
+
+            saver.close()
+            assert mock_fsync.call_count == 4
+
+        assert [v["id"] for v in JSONSaver(saver.filename).get_all_vacancies()] == ["1", "2", "3"]
+
+    def test_sync_policy_group_window_expires(self, tmp_path):
+        """Тест синхронизации последних записей по истечении интервала без вызова sync()"""
+        saver = JSONSaver(str(tmp_path / "vacancies.json"), sync_policy="group", sync_interval=0.05)
+
+        with patch("os.fsync") as mock_fsync:
+            for vacancy_id in ("1", "2", "3"):
+                saver.add_vacancy({"id": vacancy_id})
+            assert mock_fsync.call_count == 2
+
+            deadline = time.monotonic() + 5
+            while mock_fsync.call_count < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert mock_fsync.call_count == 4
+
+            saver.close()
+            assert mock_fsync.call_count == 4
+
+    def test_invalid_sync_policy(self):
+        """Тест ошибки при неизвестной политике синхронизации"""
+        with pytest.raises(ValueError):
+            JSONSaver("test.json", sync_policy="sometimes")
+        with pytest.raises(ValueError):
+            JSONSaver("test.json", sync_policy="group", sync_interval=-1)
+
+    def test_optimistic_merge_by_id(self, tmp_path):
+        """Тест объединения изменений двух экземпляров, работающих с одним файлом"""
+        filename = str(tmp_path / "vacancies.json")
+        JSONSaver(filename).add_vacancies([{"id": "1"}, {"id": "2"}])
+        first = JSONSaver(filename, write_policy="deferred", concurrency="optimistic")
+        second = JSONSaver(filename, write_policy="deferred", concurrency="optimistic")
+
+        first.add_vacancy({"id": "3"})
+        first.delete_vacancy("1")
+        second.add_vacancy({"id": "4"})
+        second.upsert_vacancies([{"id": "2", "name": "Updated"}])
+        first.flush()
+        second.flush()
+
+        result = JSONSaver(filename).get_all_vacancies()
+        assert result == [{"id": "2", "name": "Updated"}, {"id": "3"}, {"id": "4"}]
+        assert first.get_all_vacancies() == result
+        assert os.path.exists(f"{filename}.lock")
+
+    def test_without_concurrency_last_writer_wins(self, tmp_path):
+        """Тест потери изменений без режима совместной работы"""
+        filename = str(tmp_path / "vacancies.json")
+        first = JSONSaver(filename, write_policy="deferred")
+        second = JSONSaver(filename, write_policy="deferred")
+
+        first.add_vacancy({"id": "1"})
+        second.add_vacancy({"id": "2"})
+        first.flush()
+        second.flush()
+
+        assert JSONSaver(filename).get_all_vacancies() == [{"id": "2"}]
+
+    @pytest.mark.parametrize(
+        "concurrency, write_policy", [("lock", "immediate"), ("optimistic", "immediate"), ("optimistic", "every_n")]
+    )
+    def test_parallel_processes_keep_all_updates(self, tmp_path, concurrency, write_policy):
+        """Тест одновременной записи из нескольких процессов без потери изменений"""
+        filename = str(tmp_path / "vacancies.json")
+        JSONSaver(filename)
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(
+                target=add_vacancies_in_process, args=(filename, concurrency, write_policy, worker * 100, 20)
+            )
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        saved_ids = {vacancy["id"] for vacancy in JSONSaver(filename).get_all_vacancies()}
+        assert saved_ids == {str(worker * 100 + i) for worker in range(4) for i in range(20)}
+
+    def test_invalid_concurrency(self):
+        """Тест ошибки при неизвестном режиме совместной работы"""
+        with pytest.raises(ValueError):
+            JSONSaver("test.json", concurrency="shared")
@@ -0,0 +1,180 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.file_handler import FileHandler
+from src.jsonl_saver import JSONLinesSaver
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    """Путь к временному журналу JSON Lines"""
+    return str(tmp_path / "vacancies.jsonl")
+
+
+def read_lines(filename):
+    with open(filename, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class TestJSONLinesSaver:
+    """Тесты для класса JSONLinesSaver"""
+
+    def test_init_creates_file(self, tmp_path):
+        """Тест создания файла и директорий при инициализации"""
+        filename = str(tmp_path / "data" / "vacancies.jsonl")
+        saver = JSONLinesSaver(filename)
+
+        assert isinstance(saver, FileHandler)
+        assert saver.filename == filename
+        assert os.path.exists(filename)
+        assert saver.get_all_vacancies() == []
+
+    def test_add_vacancy_appends_line(self, jsonl_file):
+        """Тест дозаписи вакансии одной строкой"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancy({"id": "1", "name": "Первая"})
+        saver.add_vacancy({"id": "2", "name": "Вторая"})
+        saver.add_vacancy({"id": "1", "name": "Дубликат"})
+
+        assert read_lines(jsonl_file) == [{"id": "1", "name": "Первая"}, {"id": "2", "name": "Вторая"}]
+
+    def test_add_vacancy_does_not_read_log(self, jsonl_file):
+        """Тест добавления без чтения журнала"""
+        saver = JSONLinesSaver(jsonl_file)
+
+        with patch.object(saver, "_read_log") as mock_read:
+            saver.add_vacancy({"id": "1"})
+            mock_read.assert_not_called()
+
+    def test_add_vacancies_batch(self, jsonl_file):
+        """Тест пакетного добавления вакансий"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancy({"id": "1"})
+
+        result = saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "2"}, {"name": "Без ID"}])
+
+        assert result == (1, 3)
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["1", "2"]
+
+    def test_delete_vacancy_appends_tombstone(self, jsonl_file):
+        """Тест удаления вакансии через надгробие"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}])
+        saver.delete_vacancy("1")
+        saver.delete_vacancy("missing")
+
+        assert len(read_lines(jsonl_file)) == 3
+        assert saver.get_all_vacancies() == [{"id": "2"}]
+
+    def test_delete_vacancies(self, jsonl_file):
+        """Тест пакетного удаления одной дозаписью надгробий"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+
+        assert saver.delete_vacancies(["1", "3", "missing"]) == 2
+        assert len(read_lines(jsonl_file)) == 5
+        assert saver.get_all_vacancies() == [{"id": "2"}]
+
+    def test_state_restored_on_reopen(self, jsonl_file):
+        """Тест восстановления состояния из журнала при повторном открытии"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}])
+        saver.delete_vacancy("1")
+
+        reopened = JSONLinesSaver(jsonl_file)
+        reopened.add_vacancy({"id": "2", "name": "Дубликат"})
+        reopened.add_vacancy({"id": "1", "name": "Снова добавлена"})
+
+        assert reopened.get_all_vacancies() == [{"id": "2"}, {"id": "1", "name": "Снова добавлена"}]
+
+    def test_corrupted_line_skipped(self, jsonl_file):
+        """Тест пропуска недописанной строки"""
+        with open(jsonl_file, "w", encoding="utf-8") as file:
+            file.write('{"id": "1"}\n{"id": "2", "na')
+
+        saver = JSONLinesSaver(jsonl_file)
+
+        assert saver.get_all_vacancies() == [{"id": "1"}]
+
+    def test_append_after_corrupted_tail(self, jsonl_file):
+        """Тест дозаписи после недописанной строки без перевода строки"""
+        with open(jsonl_file, "w", encoding="utf-8") as file:
+            file.write('{"id": "1"}\n{"id": "2", "na')
+
+        saver = JSONLinesSaver(jsonl_file)
+        assert saver.add_vacancies([{"id": "3"}]) == (1, 0)
+
+        assert JSONLinesSaver(jsonl_file).get_all_vacancies() == [{"id": "1"}, {"id": "3"}]
+
+    def test_compact(self, jsonl_file):
+        """Тест компактификации журнала"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        saver.delete_vacancy("2")
+
+        saver.compact()
+
+        assert read_lines(jsonl_file) == [{"id": "1"}, {"id": "3"}]
+        assert not os.path.exists(f"{jsonl_file}.tmp")
+
+    def test_auto_compact_on_delete(self, jsonl_file):
+        """Тест автоматической компактификации при большой доле удаленных записей"""
+        saver = JSONLinesSaver(jsonl_file, compact_ratio=0.5, compact_min_records=4)
+        saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        saver.delete_vacancy("1")
+        saver.delete_vacancy("2")
+
+        assert read_lines(jsonl_file) == [{"id": "3"}]
+
+    def test_invalid_compact_ratio(self, jsonl_file):
+        """Тест ошибки при некорректной доле компактификации"""
+        with pytest.raises(ValueError):
+            JSONLinesSaver(jsonl_file, compact_ratio=0)
+
+    def test_filter_vacancies(self, jsonl_file):
+        """Тест фильтрации вакансий по ключевым словам"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies(
+            [
+                {"id": "1", "name": "Python Developer", "requirement": "Python experience"},
+                {"id": "2", "name": "Java Developer", "requirement": "Java experience"},
+            ]
+        )
+
+        result = saver.filter_vacancies(["python"])
+
+        assert [v["id"] for v in result] == ["1"]
+
+    def test_filter_vacancies_by_salary(self, jsonl_file):
+        """Тест фильтрации вакансий по диапазону зарплат"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 100000, "salary_to": 150000},
+                {"id": "2", "salary_from": 200000, "salary_to": 250000},
+                {"id": "3", "salary_from": 80000, "salary_to": 0},
+            ]
+        )
+
+        result = saver.filter_vacancies_by_salary((100000, 200000))
+
+        assert [v["id"] for v in result] == ["1"]
+
+    def test_filter_vacancies_by_salary_open_range(self, jsonl_file):
+        """Тест фильтрации по зарплате с открытыми границами и порядка по возрастанию зарплаты"""
+        saver = JSONLinesSaver(jsonl_file)
+        saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 200000, "salary_to": 250000},
+                {"id": "2", "salary_from": 100000},
+                {"id": "3", "salary_from": 80000, "salary_to": 0},
+                {"id": "4", "salary_from": 100000},
+            ]
+        )
+
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((100000, None))] == ["2", "4", "1"]
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((None, 100000))] == ["3", "2", "4"]
+        assert [v["id"] for v in saver.filter_vacancies_by_salary((None, None))] == ["3", "2", "4", "1"]
@@ -0,0 +1,118 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.keyword_index import KeywordIndex, is_token, tokenize
+
+
+class TestKeywordIndex:
+    """Тесты для инвертированного индекса ключевых слов"""
+
+    def make_index(self):
+        """Создание индекса с тестовыми вакансиями"""
+        index = KeywordIndex()
+        index.add("1", "Python Developer, Django")
+        index.add("2", "Java Developer")
+        index.add("3", "Python Senior")
+        return index
+
+    def test_tokenize(self):
+        """Тест разбиения текста на слова"""
+        assert tokenize("Python-разработчик, Django REST") == {"python", "разработчик", "django", "rest"}
+        assert is_token("python3")
+        assert not is_token("c++")
+
+    def test_search_all_words(self):
+        """Тест поиска вакансий со всеми словами"""
+        index = self.make_index()
+
+        assert index.search(["python"]) == {"1", "3"}
+        assert index.search(["Python", "developer"]) == {"1"}
+        assert index.search(["python", "missing"]) == set()
+        assert index.search([]) == set()
+
+    def test_search_any_word(self):
+        """Тест поиска вакансий хотя бы с одним словом"""
+        index = self.make_index()
+
+        assert index.search(["django", "java"], mode="any") == {"1", "2"}
+
+    def test_search_prefix(self):
+        """Тест поиска по началу слова"""
+        index = self.make_index()
+
+        assert index.search(["dev"], prefix=True) == {"1", "2"}
+        assert index.search(["py", "sen"], prefix=True) == {"3"}
+        assert index.search(["eloper"], prefix=True) == set()
+
+    def test_search_substring(self):
+        """Тест поиска по подстроке слова"""
+        index = self.make_index()
+
+        assert index.search_substring("ELOP") == {"1", "2"}
+
+    def test_add_replaces_and_remove(self):
+        """Тест переиндексации и удаления вакансии"""
+        index = self.make_index()
+
+        index.add("1", "Go Developer")
+        index.remove("2")
+        index.remove("missing")
+
+        assert index.search(["python"]) == {"3"}
+        assert index.search(["developer"]) == {"1"}
+        assert index.search(["java"]) == set()
+        assert index.ordered({"3", "1"}) == ["1", "3"]
+        assert len(index) == 2
+
+    def test_save_and_load(self, tmp_path):
+        """Тест сохранения и загрузки индекса"""
+        filename = str(tmp_path / "index.json")
+        index = self.make_index()
+        index.save(filename, (1, 2))
+
+        loaded = KeywordIndex.load(filename, (1, 2))
+
+        assert not index.changed
+        assert loaded.search(["python"]) == {"1", "3"}
+        assert loaded.search(["dev"], prefix=True) == {"1", "2"}
+        assert loaded.ordered({"3", "2", "1"}) == ["1", "2", "3"]
+
+    def test_changed_only_when_words_change(self, tmp_path):
+        """Тест отметки изменений только при изменении набора слов"""
+        index = self.make_index()
+        index.save(str(tmp_path / "index.json"), (1, 2))
+
+        index.add("1", "Django: developer PYTHON")
+        assert not index.changed
+
+        index.add("1", "Python Senior Developer")
+        assert index.changed
+
+    def test_save_failure_keeps_previous_file(self, tmp_path):
+        """Тест сохранения прежнего файла индекса при сбое во время записи"""
+        filename = str(tmp_path / "index.json")
+        index = self.make_index()
+        index.save(filename, (1, 2))
+
+        index.add("4", "Go Developer")
+        with patch("json.dump", side_effect=OSError("диск заполнен")):
+            with pytest.raises(OSError):
+                index.save(filename, (1, 3))
+
+        assert KeywordIndex.load(filename, (1, 2)).search(["go"]) == set()
+        assert os.listdir(tmp_path) == ["index.json"]
+
+    def test_load_stale_or_missing(self, tmp_path):
+        """Тест отказа от устаревшего или отсутствующего индекса"""
+        filename = str(tmp_path / "index.json")
+        self.make_index().save(filename, (1, 2))
+
+        assert KeywordIndex.load(filename, (1, 3)) is None
+        assert KeywordIndex.load(filename, None) is None
+        assert KeywordIndex.load(str(tmp_path / "missing.json"), (1, 2)) is None
+
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write("{broken")
+        assert KeywordIndex.load(filename, (1, 2)) is None
@@ -0,0 +1,120 @@
+import heapq
+import io
+
+import pytest
+
+from src.file_handler import FileHandler
+from src.mapped_store import HEADER, STORE_MAGIC, STORE_VERSION, MappedRecords, MappedVacancyStore
+from src.salary_index import salary_average
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def store_file(tmp_path):
+    """Путь к временному файлу хранилища"""
+    return str(tmp_path / "vacancies.vmap")
+
+
+@pytest.fixture
+def records():
+    """Записи в формате Vacancy.to_dict() с повторяющимися зарплатами и запись другого формата"""
+    data = [
+        Vacancy(str(i), f"Python {i}", f"https://hh.ru/vacancy/{i}", (i % 4) * 1000, 0, "RUR", "Опыт").to_dict()
+        for i in range(12)
+    ]
+    data[3]["schedule"] = "remote"
+    data.append({"name": "Java без ID", "salary": {"from": 500}, "tags": ["java"]})
+    return data
+
+
+class TestMappedVacancyStore:
+    """Тесты для класса MappedVacancyStore"""
+
+    def test_init_creates_empty_store(self, tmp_path):
+        """Тест создания пустого хранилища и директорий"""
+        filename = str(tmp_path / "data" / "vacancies.vmap")
+
+        with MappedVacancyStore(filename) as store:
+            assert isinstance(store, FileHandler)
+            assert store.filename == filename
+            assert len(store) == 0
+            assert list(store.get_all_vacancies()) == []
+            assert store.get_top_vacancies(5) == []
+
+    def test_build_roundtrip(self, store_file, records):
+        """Тест сохранения записей и ленивого чтения по номеру и срезу"""
+        with MappedVacancyStore.build(store_file, records) as store:
+            vacancies = store.get_all_vacancies()
+
+            assert isinstance(vacancies, MappedRecords)
+            assert len(vacancies) == len(records)
+            assert vacancies[3] == records[3]
+            assert vacancies[-1] == records[-1]
+            assert vacancies[2:4] == records[2:4]
+            assert list(vacancies) == records
+
+    def test_get_top_vacancies_matches_heap(self, store_file, records):
+        """Тест топа вакансий: порядок совпадает с heapq.nlargest, включая равные зарплаты"""
+        with MappedVacancyStore.build(store_file, records) as store:
+            for n in (1, 3, 5, 12, 20):
+                assert store.get_top_vacancies(n) == heapq.nlargest(n, records, key=salary_average)
+            assert store.get_top_vacancies(0) == []
+
+    def test_filter_vacancies_by_salary(self, store_file, records):
+        """Тест диапазона зарплат по возрастанию с открытыми границами"""
+        with MappedVacancyStore.build(store_file, records) as store:
+            result = store.filter_vacancies_by_salary((1000, 2000))
+            assert [v["id"] for v in result] == ["1", "5", "9", "2", "6", "10"]
+
+            expected = sorted(records, key=salary_average)
+            assert list(store.filter_vacancies_by_salary((None, None))) == expected
+            assert list(store.filter_vacancies_by_salary((3000, None))) == expected[-3:]
+            assert list(store.filter_vacancies_by_salary((5000, 1000))) == []
+
+    def test_filter_vacancies(self, store_file, records):
+        """Тест фильтрации по ключевым словам в названии и требованиях"""
+        with MappedVacancyStore.build(store_file, records) as store:
+            assert [v["id"] for v in store.filter_vacancies(["python 1"])] == ["1", "10", "11"]
+            assert store.filter_vacancies(["ОПЫТ", "python 7"]) == [records[7]]
+            assert store.filter_vacancies(["java"]) == [records[-1]]
+
+    def test_read_only(self, store_file, records):
+        """Тест запрета изменения хранилища"""
+        with MappedVacancyStore.build(store_file, records) as store:
+            assert store.read_only
+            with pytest.raises(io.UnsupportedOperation):
+                store.add_vacancy(records[0])
+            with pytest.raises(io.UnsupportedOperation):
+                store.add_vacancies(records)
+            with pytest.raises(io.UnsupportedOperation):
+                store.upsert_vacancies(records)
+            with pytest.raises(io.UnsupportedOperation):
+                store.delete_vacancy("1")
+            with pytest.raises(io.UnsupportedOperation):
+                store.delete_vacancies(["1"])
+
+    def test_close_with_results_alive(self, store_file, records):
+        """Тест закрытия хранилища, пока результаты запросов еще используются"""
+        store = MappedVacancyStore.build(store_file, records)
+        result = store.filter_vacancies_by_salary((1000, None))
+
+        store.close()
+
+        assert len(result) == 9
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (b"", "Поврежденное хранилище"),
+            (b"[]" + bytes(HEADER.size), "не является хранилищем"),
+            (HEADER.pack(STORE_MAGIC, STORE_VERSION + 1, 0, 0), "версия"),
+            (HEADER.pack(STORE_MAGIC, STORE_VERSION, 0, 10), "обрезан"),
+        ],
+    )
+    def test_invalid_file(self, store_file, data, message):
+        """Тест открытия поврежденного файла или файла другой версии"""
+        with open(store_file, "wb") as file:
+            file.write(data)
+
+        with pytest.raises(ValueError, match=message):
+            MappedVacancyStore(store_file)
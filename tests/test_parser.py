@@ -59,3 +59,17 @@ class TestParser:
         parser = ConcreteParser(json_saver)
 
         assert parser.file_worker == json_saver
+
+    def test_iter_vacancies_default(self):
+        """Тест генератора вакансий по умолчанию"""
+
+        class ConcreteParser(Parser):
+            def _connect(self):
+                pass
+
+            def load_vacancies(self, keyword):
+                return [{"id": "1"}, {"id": "2"}]
+
+        parser = ConcreteParser(None)
+
+        assert list(parser.iter_vacancies("Python")) == [{"id": "1"}, {"id": "2"}]
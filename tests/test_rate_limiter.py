@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.rate_limiter import RateLimiter
+
+
+def make_response(status_code, retry_after=None):
+    """Ответ с кодом и необязательным заголовком Retry-After"""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return response
+
+
+class TestRateLimiter:
+    """Тесты для класса RateLimiter"""
+
+    def test_invalid_settings(self):
+        """Тест ошибки при некорректных настройках"""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_shared_instance(self, shared_rate_limiter):
+        """Тест общего ограничителя для процесса"""
+        assert RateLimiter.shared() is shared_rate_limiter
+        assert RateLimiter.shared() is RateLimiter.shared()
+
+    def test_execute_retries_throttled_request(self):
+        """Тест повтора запроса после ответа 429"""
+        limiter = RateLimiter(rate=None, backoff_base=0)
+        send = Mock(side_effect=[make_response(429), make_response(503), make_response(200)])
+
+        response = limiter.execute(send)
+
+        assert response.status_code == 200
+        assert send.call_count == 3
+        assert limiter.stats["requests"] == 3
+        assert limiter.stats["throttles"] == 1
+        assert limiter.stats["retries"] == 2
+
+    def test_execute_returns_last_response_after_retries(self):
+        """Тест возврата последнего ответа после исчерпания повторов"""
+        limiter = RateLimiter(rate=None, backoff_base=0)
+        send = Mock(return_value=make_response(500))
+
+        response = limiter.execute(send, retries=2)
+
+        assert response.status_code == 500
+        assert send.call_count == 3
+
+    def test_execute_does_not_retry_client_errors(self):
+        """Тест отсутствия повторов для ответов 4xx кроме 429"""
+        limiter = RateLimiter(rate=None, backoff_base=0)
+        send = Mock(return_value=make_response(404))
+
+        assert limiter.execute(send).status_code == 404
+        send.assert_called_once()
+
+    def test_aimd_concurrency(self):
+        """Тест уменьшения предела одновременности после 429 и его восстановления"""
+        limiter = RateLimiter(rate=None, max_concurrency=8, backoff_base=0)
+
+        limiter.acquire()
+        limiter.release(429)
+        assert limiter.stats["concurrency"] == 4
+
+        limiter.acquire()
+        limiter.release(200)
+        assert limiter.stats["concurrency"] == 4.25
+
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(200)
+        assert limiter.stats["concurrency"] == 8
+
+    def test_concurrency_limit(self):
+        """Тест ограничения числа одновременных запросов"""
+        limiter = RateLimiter(rate=None, max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        def send():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return make_response(200)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: limiter.execute(send), range(12)))
+
+        assert max_in_flight <= 2
+
+    def test_retry_after_pauses_requests(self):
+        """Тест паузы всех запросов по заголовку Retry-After"""
+        limiter = RateLimiter(rate=None)
+        send = Mock(side_effect=[make_response(429, retry_after="0.1"), make_response(200)])
+
+        started = time.monotonic()
+        response = limiter.execute(send)
+
+        assert response.status_code == 200
+        assert time.monotonic() - started >= 0.09
+
+    def test_token_bucket_rate(self):
+        """Тест ограничения частоты запросов"""
+        limiter = RateLimiter(rate=50, burst=1)
+
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(200)
+
+        assert time.monotonic() - started >= 0.05
+
+    def test_backoff_bounds(self):
+        """Тест границ задержки перед повтором"""
+        limiter = RateLimiter(backoff_base=1, backoff_cap=5)
+
+        assert all(0 <= limiter.backoff(attempt) <= min(5, 2**attempt) for attempt in range(10))
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from src.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Временная директория кэша"""
+    return str(tmp_path / "cache")
+
+
+class TestResponseCache:
+    """Тесты для класса ResponseCache"""
+
+    def test_put_and_get(self, cache_dir):
+        """Тест сохранения и получения записи"""
+        cache = ResponseCache(cache_dir)
+        cache.put("url", {"text": "python", "page": 0}, {"items": [1]}, etag='"abc"')
+
+        entry = cache.get("url", {"page": 0, "text": "python"})
+
+        assert entry["body"] == {"items": [1]}
+        assert entry["etag"] == '"abc"'
+        assert cache.is_fresh(entry)
+        assert cache.get("url", {"text": "java", "page": 0}) is None
+
+    def test_entry_expires(self, cache_dir):
+        """Тест истечения срока жизни записи"""
+        cache = ResponseCache(cache_dir, ttl=0)
+        cache.put("url", {"page": 0}, {"items": []})
+
+        entry = cache.get("url", {"page": 0})
+
+        assert not cache.is_fresh(entry)
+
+    def test_refresh_extends_ttl(self, cache_dir):
+        """Тест продления срока жизни записи"""
+        cache = ResponseCache(cache_dir, ttl=60)
+        entry = cache.put("url", {"page": 0}, {"items": []})
+
+        cache.refresh("url", {"page": 0}, {**entry, "expires_at": 0})
+
+        assert cache.is_fresh(cache.get("url", {"page": 0}))
+
+    def test_lru_eviction(self, cache_dir):
+        """Тест вытеснения давно не использованных записей"""
+        cache = ResponseCache(cache_dir)
+        cache.put("url", {"page": 0}, {"items": "x" * 100})
+        entry_size = cache.size
+
+        # Размер записей немного различается из-за меток времени
+        cache = ResponseCache(cache_dir, max_size=entry_size * 2 + 20)
+        cache.put("url", {"page": 1}, {"items": "x" * 100})
+        cache.get("url", {"page": 0})
+        cache.put("url", {"page": 2}, {"items": "x" * 100})
+
+        assert cache.get("url", {"page": 0}) is not None
+        assert cache.get("url", {"page": 1}) is None
+        assert cache.get("url", {"page": 2}) is not None
+        assert cache.stats["evictions"] == 1
+        assert cache.size <= entry_size * 2 + 20
+
+    def test_size_restored_on_reopen(self, cache_dir):
+        """Тест восстановления размера кэша при повторном открытии"""
+        cache = ResponseCache(cache_dir)
+        cache.put("url", {"page": 0}, {"items": []})
+
+        assert ResponseCache(cache_dir).size == cache.size
+
+    def test_clear(self, cache_dir):
+        """Тест очистки кэша"""
+        cache = ResponseCache(cache_dir)
+        cache.put("url", {"page": 0}, {"items": []})
+
+        cache.clear()
+
+        assert cache.size == 0
+        assert os.listdir(cache_dir) == []
+
+    def test_invalid_settings(self, cache_dir):
+        """Тест ошибки при некорректных настройках"""
+        with pytest.raises(ValueError):
+            ResponseCache(cache_dir, max_size=0)
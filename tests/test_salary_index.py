@@ -0,0 +1,81 @@
+import pytest
+
+from src.salary_index import SalaryIndex, known_salary_average, salary_average
+
+
+class TestSalaryIndex:
+    """Тесты для отсортированного индекса зарплат"""
+
+    @pytest.fixture
+    def index(self):
+        """Фикстура с индексом зарплат"""
+        return SalaryIndex([("1", 125000), ("2", 0), ("3", 225000), ("4", 100000), ("5", 125000)])
+
+    def test_salary_average(self):
+        """Тест вычисления средней зарплаты записи"""
+        assert salary_average({"salary_from": 100000, "salary_to": 150000}) == 125000
+        assert salary_average({"salary_from": 80000, "salary_to": None}) == 80000
+        assert salary_average({"salary_to": 90000}) == 90000
+        assert salary_average({}) == 0
+
+    def test_salary_average_unknown_rate(self, shared_currency_rates):
+        """Тест пересчета зарплаты, курс валюты которой был неизвестен при сохранении"""
+        record = {"salary_from": 1000, "salary_currency": "USD", "salary_normalized": None}
+
+        assert salary_average(record) == 0
+        assert known_salary_average(record) is None
+
+        shared_currency_rates.update({"USD": 0.01})
+        assert salary_average(record) == 100000
+        assert known_salary_average(record) == 100000
+
+    def test_range(self, index):
+        """Тест запроса диапазона зарплат (включительно)"""
+        assert index.range(100000, 125000) == ["4", "1", "5"]
+        assert index.range(130000, 200000) == []
+        assert index.range(300000, 100000) == []
+        assert index.count(100000, 125000) == 3
+
+    def test_open_range(self, index):
+        """Тест открытых диапазонов"""
+        assert index.range(min_salary=125000) == ["1", "5", "3"]
+        assert index.range(max_salary=100000) == ["2", "4"]
+        assert index.range() == ["2", "4", "1", "5", "3"]
+
+    def test_add_and_remove(self, index):
+        """Тест добавления, обновления и удаления вакансий"""
+        index.add("6", 110000)
+        index.add("1", 300000)
+        index.remove("3")
+        index.remove("missing")
+
+        assert index.range(100000, None) == ["4", "6", "5", "1"]
+        assert "3" not in index
+        assert len(index) == 5
+
+    def test_update_keeps_order_among_equal_salaries(self):
+        """Тест сохранения места обновленной вакансии среди равных зарплат"""
+        index = SalaryIndex([("0", 100), ("1", 100), ("2", 100)])
+
+        index.add("0", 100)
+        assert index.range() == ["0", "1", "2"]
+
+        index.add("1", 50)
+        index.add("1", 100)
+        assert index.range() == ["0", "1", "2"]
+
+    def test_percentile(self, index):
+        """Тест перцентилей зарплаты"""
+        assert index.percentile(0) == 100000
+        assert index.percentile(50) == 125000
+        assert index.percentile(100) == 225000
+        assert index.percentile(0, only_with_salary=False) == 0
+        assert index.percentile(87.5) == 187500
+
+    def test_percentile_empty_and_invalid(self):
+        """Тест перцентиля пустого индекса и неверного значения"""
+        index = SalaryIndex([("1", 0)])
+
+        assert index.percentile(50) is None
+        with pytest.raises(ValueError):
+            index.percentile(101)
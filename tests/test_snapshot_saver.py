@@ -0,0 +1,162 @@
+import pytest
+
+from src.json_saver import JSONSaver
+from src.snapshot_saver import (
+    HEADER,
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    SnapshotSaver,
+    decode_snapshot,
+    encode_snapshot,
+)
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    """Путь к временному файлу снимка"""
+    return str(tmp_path / "vacancies.snap")
+
+
+def make_records(count):
+    return [
+        Vacancy(str(i), f"Python {i}", f"https://hh.ru/vacancy/{i}", 1000 * i, 0, "RUR", "Опыт").to_dict()
+        for i in range(count)
+    ]
+
+
+class TestSnapshotFormat:
+    """Тесты кодирования и декодирования снимка"""
+
+    def test_roundtrip_vacancy_records(self):
+        """Тест сохранения записей в формате Vacancy.to_dict()"""
+        records = make_records(50)
+
+        data = encode_snapshot(records)
+
+        assert data.startswith(SNAPSHOT_MAGIC)
+        assert decode_snapshot(data) == records
+
+    def test_roundtrip_heterogeneous_records(self):
+        """Тест записей с разными ключами и типами значений"""
+        records = [
+            {"id": "1", "salary": {"from": 100}, "count": 1, "rate": 1, "flag": True},
+            {"id": "2", "count": 2**70, "rate": 2.5, "note": "a\0b"},
+            {"name": "Без ID", "flag": None, "tags": ["python"]},
+        ]
+
+        assert decode_snapshot(encode_snapshot(records)) == records
+
+    def test_roundtrip_mixed_numbers(self):
+        """Тест сохранения типов в столбце с целыми и дробными числами"""
+        records = [{"salary_from": 100000}, {"salary_from": 2500.5}, {"salary_from": None}, {"salary_from": 7}]
+
+        decoded = decode_snapshot(encode_snapshot(records))
+
+        assert decoded == records
+        assert [type(record["salary_from"]) for record in decoded] == [int, float, type(None), int]
+
+    def test_roundtrip_missing_keys_order(self):
+        """Тест порядка ключей в записях с пропущенными ключами"""
+        records = [
+            {"id": "1", "name": "Python", "salary_from": 1.0},
+            {"id": "2", "salary_from": 2.0},
+            {"name": "Без ID"},
+            {"id": "3", "name": "Go", "salary_from": 3.0},
+        ]
+
+        decoded = decode_snapshot(encode_snapshot(records))
+
+        assert decoded == records
+        assert [list(record) for record in decoded] == [list(record) for record in records]
+
+    def test_roundtrip_empty(self):
+        """Тест пустого снимка"""
+        assert decode_snapshot(encode_snapshot([])) == []
+        assert decode_snapshot(encode_snapshot([{}, {}])) == [{}, {}]
+
+    def test_repeated_strings_stored_once(self):
+        """Тест хранения повторяющихся строк в таблице строк"""
+        records = [{"currency": "RUR" * 10} for _ in range(100)]
+
+        assert len(encode_snapshot(records)) < 100 * 30
+
+    def test_invalid_magic(self):
+        """Тест данных, не являющихся снимком"""
+        with pytest.raises(ValueError, match="не является снимком"):
+            decode_snapshot(b"[]" + bytes(HEADER.size))
+
+    def test_unsupported_version(self):
+        """Тест снимка неподдерживаемой версии"""
+        data = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION + 1, 0, 0, 0)
+
+        with pytest.raises(ValueError, match="версия"):
+            decode_snapshot(data)
+
+    def test_truncated_data(self):
+        """Тест поврежденного (обрезанного) снимка"""
+        data = encode_snapshot(make_records(10))
+
+        with pytest.raises(ValueError):
+            decode_snapshot(data[: len(data) // 2])
+        with pytest.raises(ValueError):
+            decode_snapshot(data[:4])
+
+    def test_corrupted_string_table_index(self):
+        """Тест поврежденного номера строки в таблице строк"""
+        data = encode_snapshot([{"currency": "RUR"} for _ in range(8)])
+
+        with pytest.raises(ValueError, match="Поврежденный снимок"):
+            decode_snapshot(data[:-4] + b"\xff\xff\xff\xff")
+
+
+class TestSnapshotSaver:
+    """Тесты для класса SnapshotSaver"""
+
+    def test_init_creates_empty_snapshot(self, snapshot_file):
+        """Тест создания пустого снимка при инициализации"""
+        saver = SnapshotSaver(snapshot_file, write_policy="deferred")
+
+        assert isinstance(saver, JSONSaver)
+        with open(snapshot_file, "rb") as file:
+            magic, version, _, count, _ = HEADER.unpack_from(file.read())
+        assert (magic, version, count) == (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0)
+        assert saver.get_all_vacancies() == []
+
+    def test_persistence(self, snapshot_file):
+        """Тест сохранения, удаления и повторного открытия хранилища"""
+        records = make_records(5)
+        saver = SnapshotSaver(snapshot_file)
+        assert saver.add_vacancies(records) == (5, 0)
+        saver.delete_vacancy("0")
+
+        reopened = SnapshotSaver(snapshot_file)
+
+        assert reopened.get_all_vacancies() == records[1:]
+        assert reopened.filter_vacancies(["python 3"]) == [records[3]]
+        assert reopened.filter_vacancies_by_salary((2000, 3000)) == records[2:4]
+
+    def test_corrupted_file_loads_empty(self, snapshot_file):
+        """Тест поврежденного файла снимка"""
+        with open(snapshot_file, "wb") as file:
+            file.write(b"not a snapshot")
+
+        assert SnapshotSaver(snapshot_file).get_all_vacancies() == []
+
+        data = encode_snapshot([{"id": str(number), "currency": "RUR"} for number in range(8)])
+        with open(snapshot_file, "wb") as file:
+            file.write(data[:-4] + b"\xff\xff\xff\xff")
+
+        assert SnapshotSaver(snapshot_file).get_all_vacancies() == []
+
+    def test_keyword_index_not_shared_with_json_file(self, tmp_path):
+        """Тест отдельных индексов ключевых слов у снимка и JSON-файла с одинаковым именем"""
+        with SnapshotSaver(str(tmp_path / "vacancies.snap")) as snapshot:
+            snapshot.add_vacancies(make_records(2))
+            snapshot.filter_vacancies(["python"])
+        with JSONSaver(str(tmp_path / "vacancies.json")) as json_saver:
+            json_saver.add_vacancies(make_records(3))
+            json_saver.filter_vacancies(["python"])
+
+        assert (tmp_path / "vacancies.snap.keywords.json").exists()
+        assert (tmp_path / "vacancies.json.keywords.json").exists()
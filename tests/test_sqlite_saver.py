@@ -0,0 +1,171 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.file_handler import FileHandler
+from src.sqlite_saver import SQLiteSaver
+
+
+@pytest.fixture
+def sqlite_saver(tmp_path):
+    """SQLiteSaver с временной базой данных"""
+    saver = SQLiteSaver(str(tmp_path / "vacancies.db"))
+    yield saver
+    saver.close()
+
+
+@pytest.fixture
+def stored_vacancies():
+    """Вакансии в формате хранилища"""
+    return [
+        {"id": "1", "name": "Python Developer", "requirement": "Опыт работы с Django", "salary_from": 100000},
+        {"id": "2", "name": "Java Developer", "requirement": "Spring", "salary_from": 200000, "salary_to": 250000},
+        {"id": "3", "name": "Python Senior", "requirement": "Senior Python", "salary_from": 150000, "salary_to": 0},
+        {"id": "4", "name": "Стажер", "requirement": "Без опыта"},
+    ]
+
+
+class TestSQLiteSaver:
+    """Тесты для класса SQLiteSaver"""
+
+    def test_init_creates_database(self, tmp_path):
+        """Тест создания файла базы данных и директорий"""
+        filename = str(tmp_path / "data" / "vacancies.db")
+        saver = SQLiteSaver(filename)
+
+        assert isinstance(saver, FileHandler)
+        assert saver.filename == filename
+        assert os.path.exists(filename)
+        assert saver.get_all_vacancies() == []
+        saver.close()
+
+    def test_add_vacancy_without_duplicates(self, sqlite_saver):
+        """Тест добавления вакансии без дубликатов"""
+        sqlite_saver.add_vacancy({"id": "1", "name": "Первая"})
+        sqlite_saver.add_vacancy({"id": "1", "name": "Дубликат"})
+        sqlite_saver.add_vacancy({"name": "Без ID"})
+
+        assert sqlite_saver.get_all_vacancies() == [{"id": "1", "name": "Первая"}]
+
+    def test_add_vacancies_batch(self, sqlite_saver):
+        """Тест пакетного добавления вакансий"""
+        sqlite_saver.add_vacancy({"id": "1"})
+
+        result = sqlite_saver.add_vacancies([{"id": "1"}, {"id": "2"}, {"id": "2"}, {"name": "Без ID"}])
+
+        assert result == (1, 3)
+        assert [v["id"] for v in sqlite_saver.get_all_vacancies()] == ["1", "2"]
+
+    def test_delete_vacancy(self, sqlite_saver, stored_vacancies):
+        """Тест удаления вакансии и ее записи в полнотекстовом индексе"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+        sqlite_saver.delete_vacancy("1")
+
+        assert [v["id"] for v in sqlite_saver.get_all_vacancies()] == ["2", "3", "4"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["python"])] == ["3"]
+
+    def test_delete_vacancies(self, sqlite_saver, stored_vacancies):
+        """Тест пакетного удаления с подсчетом только существующих вакансий"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+
+        assert sqlite_saver.delete_vacancies(["1", "3", "missing"]) == 2
+        assert [v["id"] for v in sqlite_saver.get_all_vacancies()] == ["2", "4"]
+
+    def test_data_persisted(self, tmp_path):
+        """Тест сохранения данных между подключениями"""
+        filename = str(tmp_path / "vacancies.db")
+        saver = SQLiteSaver(filename)
+        saver.add_vacancy({"id": "1", "name": "Python Developer"})
+        saver.close()
+
+        reopened = SQLiteSaver(filename)
+        assert [v["id"] for v in reopened.filter_vacancies(["python"])] == ["1"]
+        reopened.close()
+
+    def test_filter_vacancies(self, sqlite_saver, stored_vacancies):
+        """Тест фильтрации вакансий по ключевым словам"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["Python"])] == ["1", "3"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["python", "django"])] == ["1"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["ОПЫТ"])] == ["1", "4"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["ython"])] == ["1", "3"]
+        assert sqlite_saver.filter_vacancies(["ruby"]) == []
+
+    def test_filter_vacancies_short_words(self, sqlite_saver, stored_vacancies):
+        """Тест фильтрации по словам короче триграммы"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["ja"])] == ["1", "2"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies(["ja", "spring"])] == ["2"]
+
+    def test_filter_vacancies_by_salary(self, sqlite_saver, stored_vacancies):
+        """Тест фильтрации вакансий по диапазону зарплат"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+
+        result = sqlite_saver.filter_vacancies_by_salary((100000, 200000))
+
+        assert [v["id"] for v in result] == ["1", "3"]
+
+    def test_filter_vacancies_by_salary_open_range(self, sqlite_saver, stored_vacancies):
+        """Тест фильтрации по зарплате с открытыми границами и порядка по возрастанию зарплаты"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+        sqlite_saver.add_vacancy({"id": "5", "salary_from": 100000})
+
+        assert [v["id"] for v in sqlite_saver.filter_vacancies_by_salary((150000, None))] == ["3", "2"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies_by_salary((None, 100000))] == ["4", "1", "5"]
+        assert [v["id"] for v in sqlite_saver.filter_vacancies_by_salary((None, None))] == ["4", "1", "5", "3", "2"]
+
+    def test_get_top_vacancies(self, sqlite_saver, stored_vacancies):
+        """Тест топа вакансий запросом по индексу без загрузки всех записей"""
+        sqlite_saver.add_vacancies(stored_vacancies)
+        sqlite_saver.add_vacancy({"id": "5", "salary_from": 150000})
+
+        with patch.object(SQLiteSaver, "get_all_vacancies") as mock_get_all:
+            assert [v["id"] for v in sqlite_saver.get_top_vacancies(3)] == ["2", "3", "5"]
+            assert [v["id"] for v in sqlite_saver.get_top_vacancies(10)] == ["2", "3", "5", "1", "4"]
+            assert sqlite_saver.get_top_vacancies(0) == []
+            mock_get_all.assert_not_called()
+
+    def test_pending_salary_recalculated(self, sqlite_saver, shared_currency_rates):
+        """Тест пересчета зарплаты в валюте с неизвестным курсом после загрузки курса"""
+        sqlite_saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 1000, "salary_currency": "USD", "salary_normalized": None},
+                {"id": "2", "salary_from": 50000, "salary_currency": "RUR", "salary_normalized": 50000},
+            ]
+        )
+        assert [v["id"] for v in sqlite_saver.filter_vacancies_by_salary((None, None))] == ["1", "2"]
+
+        shared_currency_rates.update({"USD": 0.01})
+        result = sqlite_saver.filter_vacancies_by_salary((60000, None))
+
+        assert [(v["id"], v["salary_normalized"]) for v in result] == [("1", 100000)]
+
+    def test_missing_normalized_salary_recalculated(self, sqlite_saver, shared_currency_rates):
+        """Тест пересчета зарплаты записи, сохраненной без поля salary_normalized"""
+        sqlite_saver.add_vacancies(
+            [
+                {"id": "1", "salary_from": 1000, "salary_currency": "USD"},
+                {"id": "2", "salary_from": 50000, "salary_currency": "RUR"},
+            ]
+        )
+        assert [v["id"] for v in sqlite_saver.filter_vacancies_by_salary((1, None))] == ["2"]
+
+        shared_currency_rates.update({"USD": 0.01})
+        result = sqlite_saver.filter_vacancies_by_salary((60000, None))
+
+        assert [(v["id"], v["salary_normalized"]) for v in result] == [("1", 100000)]
+        assert [v["id"] for v in sqlite_saver.get_top_vacancies(2)] == ["1", "2"]
+
+    def test_salary_filter_uses_index(self, sqlite_saver):
+        """Тест использования индекса по средней зарплате"""
+        connection = sqlite_saver._SQLiteSaver__connection
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM vacancies WHERE salary_average >= ? AND salary_average <= ? "
+            "ORDER BY salary_average, rowid",
+            (0, 1),
+        ).fetchall()
+
+        assert any("idx_vacancies_salary_average" in row[-1] for row in plan)
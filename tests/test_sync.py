@@ -0,0 +1,157 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.hh import IncompleteCrawlError
+from src.json_saver import JSONSaver
+from src.sync import SearchSync
+
+NOW = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_item(vacancy_id, published_at, name="Python Developer", archived=False):
+    """Вакансия в формате API hh.ru"""
+    return {
+        "id": vacancy_id,
+        "name": name,
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Python"},
+        "published_at": published_at.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "archived": archived,
+    }
+
+
+@pytest.fixture
+def sync_env(tmp_path):
+    """Синхронизация с заглушкой HH и временным хранилищем"""
+    hh_api = Mock()
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    sync = SearchSync(hh_api, saver, str(tmp_path / "sync_state.json"))
+    return hh_api, saver, sync
+
+
+class TestSearchSync:
+    """Тесты для класса SearchSync"""
+
+    def test_first_sync_loads_everything(self, sync_env):
+        """Тест первой синхронизации без отметки"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [
+            make_item("1", NOW - timedelta(days=2)),
+            make_item("2", NOW - timedelta(hours=1)),
+        ]
+
+        result = sync.sync("python", now=NOW)
+
+        assert result == {"fetched": 2, "inserted": 2, "updated": 0, "deleted": 0, "failed": 0}
+        hh_api.crawl_vacancies.assert_called_once_with("python", date_from=None, date_to=NOW)
+        assert sync.high_water_mark("python") == NOW - timedelta(hours=1)
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["1", "2"]
+
+    def test_next_sync_fetches_delta(self, sync_env):
+        """Тест повторной синхронизации только новых и изменившихся вакансий"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [make_item("1", NOW - timedelta(hours=2))]
+        sync.sync("python", now=NOW)
+
+        later = NOW + timedelta(hours=1)
+        hh_api.crawl_vacancies.return_value = [
+            make_item("1", NOW - timedelta(minutes=10), name="Python Developer (обновлена)"),
+            make_item("3", NOW - timedelta(minutes=5)),
+        ]
+        result = sync.sync("python", now=later)
+
+        assert result == {"fetched": 2, "inserted": 1, "updated": 1, "deleted": 0, "failed": 0}
+        hh_api.crawl_vacancies.assert_called_with(
+            "python", date_from=NOW - timedelta(hours=2, minutes=1), date_to=later
+        )
+        assert saver.get_all_vacancies()[0]["name"] == "Python Developer (обновлена)"
+        assert sync.high_water_mark("python") == NOW - timedelta(minutes=5)
+
+    def test_unchanged_vacancies_not_written(self, sync_env):
+        """Тест отсутствия записи в хранилище без изменений"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [make_item("1", NOW - timedelta(hours=2))]
+        sync.sync("python", now=NOW)
+
+        saver._save_data = Mock()
+        result = sync.sync("python", now=NOW)
+
+        assert result["inserted"] == result["updated"] == 0
+        saver._save_data.assert_not_called()
+
+    def test_drop_archived(self, sync_env):
+        """Тест удаления архивных и устаревших вакансий"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [
+            make_item("old", NOW - timedelta(days=29)),
+            make_item("1", NOW - timedelta(days=1)),
+            make_item("2", NOW - timedelta(hours=1)),
+        ]
+        sync.sync("python", now=NOW)
+
+        hh_api.crawl_vacancies.return_value = [make_item("2", NOW - timedelta(hours=1), archived=True)]
+        result = sync.sync("python", drop_archived=True, now=NOW + timedelta(days=2))
+
+        assert result["deleted"] == 2
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["1"]
+
+    def test_deleted_counts_only_stored_vacancies(self, sync_env):
+        """Тест подсчета только действительно удаленных вакансий"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [
+            make_item("1", NOW - timedelta(hours=2)),
+            make_item("never-stored", NOW - timedelta(hours=1), archived=True),
+        ]
+
+        result = sync.sync("python", drop_archived=True, now=NOW)
+
+        assert result["deleted"] == 0
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["1"]
+
+    def test_incomplete_crawl_keeps_mark(self, sync_env):
+        """Тест сохранения отметки при неполной выгрузке"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [make_item("1", NOW - timedelta(hours=2))]
+        sync.sync("python", now=NOW)
+
+        later = NOW + timedelta(hours=1)
+        hh_api.crawl_vacancies.side_effect = IncompleteCrawlError([make_item("2", NOW - timedelta(minutes=5))], 3)
+        result = sync.sync("python", now=later)
+
+        assert result["inserted"] == 1
+        assert result["failed"] == 3
+        assert sync.high_water_mark("python") == NOW - timedelta(hours=2)
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["1", "2"]
+
+    def test_state_persisted(self, sync_env, tmp_path):
+        """Тест сохранения отметок между запусками"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [make_item("1", NOW - timedelta(hours=3))]
+        sync.sync("python", now=NOW)
+
+        reopened = SearchSync(hh_api, saver, str(tmp_path / "sync_state.json"))
+
+        assert reopened.high_water_mark("python") == NOW - timedelta(hours=3)
+        assert reopened.high_water_mark("java") is None
+
+    def test_state_pruned_only_by_drop_archived(self, sync_env, tmp_path):
+        """Тест хранения дат публикации до синхронизации этого ключевого слова с drop_archived"""
+        hh_api, saver, sync = sync_env
+        hh_api.crawl_vacancies.return_value = [make_item("java-old", NOW - timedelta(hours=1))]
+        sync.sync("java", now=NOW)
+        hh_api.crawl_vacancies.return_value = [make_item("python-1", NOW + timedelta(days=30))]
+        sync.sync("python", now=NOW + timedelta(days=31))
+
+        hh_api.crawl_vacancies.return_value = []
+        result = sync.sync("java", drop_archived=True, now=NOW + timedelta(days=32))
+
+        assert result["deleted"] == 1
+        assert [v["id"] for v in saver.get_all_vacancies()] == ["python-1"]
+        with open(tmp_path / "sync_state.json", "r", encoding="utf-8") as file:
+            state = json.load(file)
+        assert state["java"]["published"] == {}
+        assert list(state["python"]["published"]) == ["python-1"]
@@ -103,6 +103,50 @@ class TestUtils:
 
         assert len(result) == 0
 
+    def test_sort_and_filter_across_currencies(self, shared_currency_rates):
+        """Тест сортировки и фильтрации по зарплате в рублях"""
+        shared_currency_rates.update({"USD": 0.01, "KZT": 5.0})
+        vacancies = [
+            Vacancy("1", "Dev", "url1", 150000, None, "RUR", "req"),
+            Vacancy("2", "Dev", "url2", 2000, None, "USD", "req"),
+            Vacancy("3", "Dev", "url3", 500000, None, "KZT", "req"),
+        ]
+
+        assert [v.id for v in sort_vacancies(vacancies)] == ["2", "1", "3"]
+        assert [v.id for v in get_top_vacancies(vacancies, 1)] == ["2"]
+        assert [v.id for v in get_vacancies_by_salary(vacancies, (90000, 160000))] == ["1", "3"]
+
+    def test_get_top_vacancies_unsorted(self, sample_vacancies):
+        """Тест выбора топа из несортированного списка"""
+        result = get_top_vacancies(sample_vacancies, 2)
+
+        assert [v.id for v in result] == ["3", "2"]
+
+    def test_get_top_vacancies_ascending(self, sample_vacancies):
+        """Тест выбора вакансий с наименьшей зарплатой"""
+        result = get_top_vacancies(sample_vacancies, 2, reverse=False)
+
+        assert [v.id for v in result] == ["4", "1"]
+
+    def test_get_top_vacancies_from_stream(self, sample_vacancies):
+        """Тест выбора топа из генератора"""
+        result = get_top_vacancies((v for v in sample_vacancies), 3)
+
+        assert result == sort_vacancies(sample_vacancies)[:3]
+
+    def test_get_top_vacancies_ties(self):
+        """Тест разрешения равенства зарплат"""
+        vacancies = [
+            Vacancy("1", "Beta", "url1", 100000, 100000, "RUR", "req"),
+            Vacancy("2", "Alpha", "url2", 100000, 100000, "RUR", "req"),
+            Vacancy("3", "Gamma", "url3", 50000, 50000, "RUR", "req"),
+        ]
+
+        assert [v.id for v in get_top_vacancies(vacancies, 2)] == ["1", "2"]
+
+        result = get_top_vacancies(vacancies, 2, reverse=False, key=lambda v: (-v.get_salary_average(), v.name))
+        assert [v.id for v in result] == ["2", "1"]
+
     @patch("builtins.print")
     def test_print_vacancies(self, mock_print, sample_vacancies):
         """Тест печати вакансий"""
@@ -117,6 +161,69 @@ class TestUtils:
 
         mock_print.assert_called_with("Вакансии не найдены.")
 
+    @pytest.fixture
+    def many_vacancies(self):
+        """Фикстура с большим числом вакансий"""
+        return [Vacancy(str(i), f"Developer {i}", f"url{i}", 1000 * i, 0, "RUR", "") for i in range(1, 26)]
+
+    @patch("builtins.print")
+    def test_print_vacancies_one_write_per_page(self, mock_print, many_vacancies):
+        """Тест вывода страницами: одна запись на страницу"""
+        print_vacancies(many_vacancies, page_size=10)
+
+        assert mock_print.call_count == 3
+        first_page = mock_print.call_args_list[0].args[0]
+        assert "Найдено вакансий: 25" in first_page
+        assert "1. Developer 1" in first_page and "11. Developer 11" not in first_page
+        assert mock_print.call_args_list[2].args[0].startswith("21. Developer 21")
+
+    def test_print_vacancies_output_format(self, capsys, sample_vacancies):
+        """Тест формата вывода вакансии"""
+        print_vacancies(sample_vacancies[:1])
+
+        output = capsys.readouterr().out
+        assert output == (
+            "\nНайдено вакансий: 1\n"
+            + "-" * 80
+            + "\n1. Python Developer | 100000-150000 RUR | url1\n"
+            + "   Требования: Python experience...\n\n"
+        )
+
+    def test_print_vacancies_limit_offset(self, capsys, many_vacancies):
+        """Тест вывода части результатов"""
+        print_vacancies(iter(many_vacancies), limit=3, offset=20)
+
+        output = capsys.readouterr().out
+        assert "Найдено вакансий" not in output
+        assert [line.split(".")[0] for line in output.splitlines() if ". Developer" in line] == ["21", "22", "23"]
+
+        print_vacancies(many_vacancies, offset=30)
+        assert capsys.readouterr().out == "Вакансии не найдены.\n"
+
+    def test_print_vacancies_lazy_pager(self, capsys, many_vacancies):
+        """Тест постраничного просмотра с ленивым чтением"""
+        consumed = []
+
+        def stream():
+            for vacancy in many_vacancies:
+                consumed.append(vacancy.id)
+                yield vacancy
+
+        with patch("builtins.input", side_effect=["", "q"]) as mock_input:
+            print_vacancies(stream(), page_size=5, interactive=True)
+
+        output = capsys.readouterr().out
+        assert mock_input.call_count == 2
+        assert "10. Developer 10" in output and "11. Developer 11" not in output
+        assert len(consumed) == 15
+
+    def test_print_vacancies_invalid_arguments(self, sample_vacancies):
+        """Тест ошибок при неверных параметрах вывода"""
+        with pytest.raises(ValueError):
+            print_vacancies(sample_vacancies, page_size=0)
+        with pytest.raises(ValueError):
+            print_vacancies(sample_vacancies, offset=-1)
+
     def test_parse_salary_range_valid(self):
         """Тест парсинга валидного диапазона зарплат"""
         result = parse_salary_range("100000-150000")
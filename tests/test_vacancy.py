@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 import pytest
 
+from src.currency import CurrencyRates
 from src.vacancy import Vacancy
 
 
@@ -118,6 +121,106 @@ class TestVacancy:
         assert vacancy1 == vacancy2
         assert vacancy1 != vacancy3
 
+    def test_vacancy_comparison_across_currencies(self, shared_currency_rates):
+        """Тест сравнения вакансий по зарплате, приведенной к рублям"""
+        shared_currency_rates.update({"USD": 0.01})
+        vacancy_rub = Vacancy("1", "Dev", "url", 150000, None, "RUR", "req")
+        vacancy_usd = Vacancy("2", "Dev", "url", 2000, None, "USD", "req")
+
+        assert vacancy_usd.get_salary_average() == 2000.0
+        assert vacancy_usd.get_normalized_salary() == 200000.0
+        assert vacancy_usd > vacancy_rub
+        assert vacancy_usd.to_dict()["salary_normalized"] == 200000.0
+
+        vacancy_usd.salary_currency = "RUR"
+        assert vacancy_usd.get_normalized_salary() == 2000.0
+        assert vacancy_usd < vacancy_rub
+
+    def test_normalized_salary_unknown_rate(self, shared_currency_rates):
+        """Тест зарплаты в валюте с неизвестным курсом: None в записи и пересчет после загрузки курса"""
+        vacancy_usd = Vacancy("1", "Dev", "url", 2000, None, "USD", "req")
+        vacancy_rub = Vacancy("2", "Dev", "url", 150000, None, "RUR", "req")
+
+        assert vacancy_usd.to_dict()["salary_normalized"] is None
+        assert vacancy_usd.get_normalized_salary() == 0.0
+        assert vacancy_usd < vacancy_rub
+
+        shared_currency_rates.update({"USD": 0.01})
+        assert vacancy_usd.get_normalized_salary() == 200000.0
+        assert vacancy_usd.to_dict()["salary_normalized"] == 200000.0
+        assert vacancy_usd > vacancy_rub
+
+    def test_construction_without_rate_table(self):
+        """Тест создания и изменения вакансии без обращения к таблице курсов"""
+        with patch.object(CurrencyRates, "shared") as mock_shared:
+            vacancy = Vacancy("1", "Dev", "url", 2000, None, "USD", "req")
+            vacancy.salary_to = 3000
+            Vacancy.from_stored_batch(
+                [
+                    {
+                        "id": "3",
+                        "name": "Dev",
+                        "alternate_url": "url",
+                        "salary_from": 1000.0,
+                        "salary_to": 0.0,
+                        "salary_currency": "USD",
+                        "requirement": "req",
+                        "salary_normalized": None,
+                    }
+                ]
+            )
+            vacancy_rub = Vacancy("2", "Dev", "url", 150000, None, "RUR", "req")
+
+            assert vacancy_rub.get_normalized_salary() == 150000.0
+            mock_shared.assert_not_called()
+
+    def test_from_stored_batch_unknown_rate(self, shared_currency_rates):
+        """Тест пересчета сохраненной записи, курс валюты которой был неизвестен"""
+        record = Vacancy("1", "Dev", "url", 1000, None, "USD", "req").to_dict()
+
+        shared_currency_rates.update({"USD": 0.01})
+        (vacancy,) = Vacancy.from_stored_batch([record])
+
+        assert vacancy.get_normalized_salary() == 100000.0
+
+    def test_from_stored_batch_normalized_salary(self, shared_currency_rates):
+        """Тест использования сохраненной зарплаты в рублях и пересчета старых записей"""
+        shared_currency_rates.update({"USD": 0.01})
+        record = Vacancy("1", "Dev", "url", 1000, None, "USD", "req").to_dict()
+        legacy = {key: value for key, value in record.items() if key != "salary_normalized"}
+        legacy["id"] = "2"
+
+        shared_currency_rates.update({"USD": 0.02})
+        stored, recalculated = Vacancy.from_stored_batch([record, legacy])
+
+        assert stored.get_normalized_salary() == 100000.0
+        assert recalculated.get_normalized_salary() == 50000.0
+
+    def test_vacancy_hash(self):
+        """Тест хеширования вакансий для удаления дубликатов"""
+        vacancy1 = Vacancy("12345", "Dev1", "url1", 100000, 150000, "RUR", "req1")
+        vacancy2 = Vacancy("12345", "Dev2", "url2", 200000, 250000, "USD", "req2")
+        vacancy3 = Vacancy("67890", "Dev1", "url1", 100000, 150000, "RUR", "req1")
+
+        assert hash(vacancy1) == hash(vacancy2)
+        assert len({vacancy1, vacancy2, vacancy3}) == 2
+        assert {vacancy1: "first"}[vacancy2] == "first"
+
+    def test_salary_average_updated_on_change(self):
+        """Тест пересчета средней зарплаты при изменении границ"""
+        vacancy = Vacancy("1", "Dev", "url", 100000, 150000, "RUR", "req")
+
+        vacancy.salary_to = 200000
+        assert vacancy.salary_to == 200000.0
+        assert vacancy.get_salary_average() == 150000.0
+
+        vacancy.salary_from = None
+        assert vacancy.salary_from == 0.0
+        assert vacancy.get_salary_average() == 200000.0
+
+        vacancy.salary_to = -5
+        assert vacancy.get_salary_average() == 0.0
+
     def test_vacancy_str_repr(self):
         """Тест строкового представления"""
         vacancy = Vacancy("12345", "Python Dev", "https://hh.ru/12345", 100000, 150000, "RUR", "Python req")
@@ -158,6 +261,7 @@ class TestVacancy:
             "salary_to": 150000.0,
             "salary_currency": "RUR",
             "requirement": "Python req",
+            "salary_normalized": 125000.0,
         }
 
         assert result == expected
@@ -216,3 +320,18 @@ class TestVacancy:
 
         assert len(vacancies) == 1
         assert vacancies[0].id == "67890"
+
+    def test_from_stored_batch(self, sample_vacancies):
+        """Тест быстрого создания вакансий из записей хранилища"""
+        records = [vacancy.to_dict() for vacancy in sample_vacancies]
+
+        result = Vacancy.from_stored_batch(iter(records))
+
+        assert [vacancy.to_dict() for vacancy in result] == records
+        assert [v.get_salary_average() for v in result] == [v.get_salary_average() for v in sample_vacancies]
+        assert result == Vacancy.cast_to_object_list(records)
+
+    def test_from_stored_batch_incomplete_record(self):
+        """Тест ошибки для записи не в формате to_dict()"""
+        with pytest.raises(KeyError):
+            Vacancy.from_stored_batch([{"id": "1", "name": "Python Developer"}])